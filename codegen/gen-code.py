@@ -64,7 +64,7 @@ code = "\n".join(pylines).replace("\n\n\n\n", "\n\n").replace("\n\n\n", "\n\n")
 code = peamble.strip() + "\n\n\n" + code.strip() + "\n"
 code = blacken(code)
 
-with open("../spirv/_dis.py", "wb") as f:
+with open("../pyshader/_dis.py", "wb") as f:
 
     f.write(code.encode())
 
@@ -75,24 +75,65 @@ preamble = '''
 """
 All the SpirV constants. Generated by the Python file provided by Khronos at
 https://raw.githubusercontent.com/KhronosGroup/SPIRV-Headers/master/include/spirv/unified1/spirv.py
+
+The constants are stored in a table (a string, which is fast to load),
+that is parsed on first use. The Enum objects are created when they are
+first used.
 """
 
 # NOTE: THIS CODE IS AUTOGENERATED; DO NOT EDIT
 
-builtins = {}
+import sys
+
 
 class Enum(int):
     """ Enum (integer) with a meaningfull repr. """
     def __new__(cls, name, value):
         base = int.__new__(cls, value)
         base.name = name
-        if name.startswith("BuiltIn_"):
-            builtins[name[8:]] = base
         return base
     def __repr__(self):
         return self.name
+
+
+_values = {}
+
+
+def _get_values():
+    if not _values:
+        words = iter(_table.split())
+        for name, value in zip(words, words):
+            _values[name] = int(value, 0)
+    return _values
+
+
+def __getattr__(name):
+    g = globals()
+    values = _get_values()
+    if name == "builtins":
+        # Also see https://www.khronos.org/opengl/wiki/Built-in_Variable_(GLSL)
+        ob = {}
+        for key in values:
+            if key.startswith("BuiltIn_"):
+                ob[key[8:]] = g[key] if key in g else __getattr__(key)
+    elif name in values:
+        ob = Enum(name, values[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    g[name] = ob
+    return ob
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_get_values()) | {"builtins"})
 '''
 
+postamble = """
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562)
+    for _name in list(_get_values()) + ["builtins"]:
+        __getattr__(_name)
+"""
+
 
 # Get dict
 ns = {}
@@ -100,21 +141,22 @@ exec(open("spirv.py", "rb").read().decode(), ns, ns)
 spv = ns["spv"]
 
 # Process and generate lines
-pylines = []
+pylines = ['_table = """']
 for key, val in spv.items():
     if isinstance(val, dict):
         pylines.append("")
         for subkey, val in val.items():
             fullkey = subkey if key.startswith("Op") else key + "_" + subkey
-            pylines.append(f"{fullkey} = Enum({fullkey!r}, {val!r})")
+            pylines.append(f"{fullkey} {val!r}")
     else:
         rval = (
             hex(val) if key in ("MagicNumber", "Version", "OpCodeMask") else repr(val)
         )
-        pylines.append(f"{key} = Enum({key!r}, {rval})")
+        pylines.append(f"{key} {rval}")
+pylines.append('"""')
 
-code = preamble.strip() + "\n\n\n" + "\n".join(pylines) + "\n"
-code = blacken(code)
+code = preamble.strip() + "\n\n\n" + "\n".join(pylines) + "\n\n\n" + postamble.strip()
+code = blacken(code + "\n")
 
-with open("../spirv/_spirv_constants.py", "wb") as f:
+with open("../pyshader/_spirv_constants.py", "wb") as f:
     f.write(code.encode())
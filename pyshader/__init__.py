@@ -7,21 +7,80 @@ Write modern GPU shaders in Python!
 __version__ = "0.7.0"
 version_info = tuple(map(int, __version__.split(".")))
 
+import sys
+import importlib
+
 from ._coreutils import ShaderError
 from ._module import ShaderModule
-from .py import python2shader
 
 # from .wasl import wasl2spirv  # note the textx dependency
 
-from ._types import void, boolean, u8, i16, i32, i64, f16, f32, f64
-from ._types import vec2, vec3, vec4
-from ._types import ivec2, ivec3, ivec4
-from ._types import bvec2, bvec3, bvec4
-from ._types import mat2, mat3, mat4
-from ._types import Vector, Matrix, Array, Struct
 
-from ._types import shadertype_as_ctype
-from ._types import RES_INPUT, RES_OUTPUT
-from ._types import RES_UNIFORM, RES_BUFFER, RES_SAMPLER, RES_TEXTURE
+# The rest of the API is imported on first use, so that e.g. applications
+# that only load precompiled shaders don't import the compiler.
+_lazy_api = {
+    "py": ["python2shader"],
+    "_batch": ["compile_many"],
+    "_precompiled": ["load_shaders"],
+    "_archive": ["ShaderArchive", "write_archive"],
+    "_stats": ["enable_compile_stats", "set_compile_stats_hook"],
+    "_types": [
+        "void boolean u8 i16 i32 i64 f16 f32 f64",
+        "vec2 vec3 vec4",
+        "ivec2 ivec3 ivec4",
+        "bvec2 bvec3 bvec4",
+        "mat2 mat3 mat4",
+        "Vector Matrix Array Struct",
+        "shadertype_as_ctype",
+        "RES_INPUT RES_OUTPUT",
+        "RES_UNIFORM RES_BUFFER RES_SAMPLER RES_TEXTURE RES_SHARED",
+        "RES_SPECIALIZATION",
+    ],
+}
+_lazy_names = {
+    name: module_name
+    for module_name, names in _lazy_api.items()
+    for name in " ".join(names).split()
+}
+
+__all__ = ["version_info", "ShaderError", "ShaderModule", "dev"] + list(_lazy_names)
+
+_lazy_submodules = {
+    "bench",
+    "dev",
+    "opcodes",
+    "py",
+    "stdlib",
+    "_archive",
+    "_batch",
+    "_build",
+    "_cache",
+    "_dis",
+    "_generator_base",
+    "_generator_bc",
+    "_precompiled",
+    "_spirv_constants",
+    "_stats",
+    "_types",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_names:
+        module = importlib.import_module("." + _lazy_names[name], __name__)
+        ob = getattr(module, name)
+    elif name in _lazy_submodules:
+        ob = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = ob
+    return ob
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | _lazy_submodules)
+
 
-from . import dev
+if sys.version_info < (3, 7):  # No module __getattr__ (PEP 562)
+    for _name in list(_lazy_names) + ["dev"]:
+        __getattr__(_name)
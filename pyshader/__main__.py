@@ -0,0 +1,50 @@
+"""
+Command line interface for pyshader. Usage:
+
+    python -m pyshader build <module-or-package> [...] -o <outdir> [-j <workers>]
+    python -m pyshader build <module-or-package> [...] --archive <filename>
+
+The build command imports the given modules, compiles the shaders that
+they define, and writes the SpirV files and a manifest to the output
+directory. Use ``pyshader.load_shaders(outdir)`` to load them. Or it
+writes a single archive file, which can be loaded with
+``pyshader.ShaderArchive(filename)``.
+"""
+
+import sys
+import argparse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pyshader")
+    subparsers = parser.add_subparsers(dest="command")
+    build_parser = subparsers.add_parser(
+        "build", help="compile the shaders in Python modules ahead of time"
+    )
+    build_parser.add_argument("modules", nargs="+", help="modules or packages")
+    build_parser.add_argument("-o", "--outdir", help="output directory")
+    build_parser.add_argument("-a", "--archive", help="output archive filename")
+    build_parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="number of processes"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command != "build":
+        parser.print_help()
+        return 1
+    if not (args.outdir or args.archive):
+        build_parser.error("one of the arguments -o/--outdir -a/--archive is required")
+
+    from ._build import build_shaders, build_archive
+
+    if args.outdir:
+        manifest = build_shaders(args.modules, args.outdir, workers=args.workers)
+        print(f"Compiled {len(manifest['shaders'])} shaders to {args.outdir}")
+    if args.archive:
+        names = build_archive(args.modules, args.archive, workers=args.workers)
+        print(f"Compiled {len(names)} shaders to {args.archive}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+A single-file archive of compiled shaders, which is memory-mapped so that
+the SpirV of individual shaders is loaded only when it's used.
+
+Layout (all integers little endian):
+
+* header: magic (8 bytes), version (u32), number of entries (u32)
+* index: one record per entry, sorted by key hash:
+  key hash (u64), offset (u64), spirv size (u32), metadata size (u32)
+* data: for each entry the SpirV, followed by the metadata as json,
+  padded to a multiple of 4 bytes.
+
+The key of an entry is a string, usually the "module:qualname" name of
+the shader, optionally combined with the generator options (see
+``get_archive_key()``).
+"""
+
+import json
+import mmap
+import struct
+import hashlib
+
+from ._module import ShaderModule, normalize_options
+
+
+MAGIC = b"PYSHARC\x00"
+VERSION = 1
+
+HEADER = struct.Struct("<8sII")
+RECORD = struct.Struct("<QQII")
+
+
+def get_archive_key(name, options=None):
+    """Get the key for the shader with the given name, compiled with the
+    given generator options.
+    """
+    options = normalize_options(options or {})
+    if not options:
+        return name
+    return name + "?" + json.dumps(sorted(options.items()))
+
+
+def _hash_key(key):
+    return int.from_bytes(hashlib.sha1(key.encode()).digest()[:8], "little")
+
+
+def write_archive(filename, entries):
+    """Write an archive of compiled shaders. The entries must be an iterable
+    of (key, spirv, metadata) tuples.
+    """
+    records = {}
+    for key, spirv, metadata in entries:
+        h = _hash_key(key)
+        if h in records:
+            raise ValueError(f"Duplicate (or colliding) archive key {key!r}.")
+        records[h] = bytes(spirv), json.dumps(metadata).encode()
+
+    offset = HEADER.size + RECORD.size * len(records)
+    index, blobs = [], []
+    for h in sorted(records):
+        spirv, meta = records[h]
+        index.append(RECORD.pack(h, offset, len(spirv), len(meta)))
+        padding = b"\x00" * (-(len(spirv) + len(meta)) % 4)
+        blobs.extend([spirv, meta, padding])
+        offset += len(spirv) + len(meta) + len(padding)
+
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(records)))
+        f.write(b"".join(index))
+        f.write(b"".join(blobs))
+
+
+class ShaderArchive:
+    """A read-only, memory-mapped archive of compiled shaders. The SpirV is
+    given as memoryview objects that refer directly to the mapped file.
+    Use ``get_module()`` to get a ShaderModule that is backed by the archive.
+    """
+
+    def __init__(self, filename):
+        self._filename = filename
+        with open(filename, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        if len(self._view) < HEADER.size:
+            self.close()
+            raise ValueError(f"Not a shader archive: {filename!r}")
+        magic, version, self._count = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a (compatible) shader archive: {filename!r}")
+
+    def __repr__(self):
+        return f"<ShaderArchive {self._filename!r} with {self._count} entries>"
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, name):
+        return self._find(get_archive_key(name)) is not None
+
+    def close(self):
+        """Close the archive. Memoryviews obtained from it must be released
+        first.
+        """
+        self._view.release()
+        self._mmap.close()
+
+    def _find(self, key):
+        """Binary search in the index, returns (offset, spirv size, metadata
+        size) or None.
+        """
+        h = _hash_key(key)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = RECORD.unpack_from(self._view, HEADER.size + mid * RECORD.size)
+            if record[0] < h:
+                lo = mid + 1
+            elif record[0] > h:
+                hi = mid
+            else:
+                return record[1:]
+        return None
+
+    def lookup(self, name, options=None):
+        """Get the (spirv, metadata) tuple for the shader with the given
+        name and generator options, or None. The spirv is a memoryview
+        into the archive.
+        """
+        found = self._find(get_archive_key(name, options))
+        if found is None:
+            return None
+        offset, spirv_size, meta_size = found
+        spirv = self._view[offset : offset + spirv_size]
+        meta = bytes(self._view[offset + spirv_size : offset + spirv_size + meta_size])
+        return spirv, json.loads(meta.decode())
+
+    def get_spirv(self, name, options=None):
+        """Get the SpirV for the given shader name and generator options,
+        as a memoryview.
+        """
+        result = self.lookup(name, options)
+        if result is None:
+            raise KeyError(get_archive_key(name, options))
+        return result[0]
+
+    def get_module(self, name):
+        """Get a ShaderModule for the shader with the given name. Its
+        ``to_spirv()`` method returns memoryviews into the archive, for
+        each set of options that the archive has a variant for.
+        """
+        if name not in self:
+            raise KeyError(name)
+        m = ShaderModule(name, None, f"shader {name} from archive")
+        m._archive = self, name
+        return m
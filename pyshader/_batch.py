@@ -0,0 +1,77 @@
+"""
+Compile many shaders at once, using multiple processes.
+
+The conversion from Python to bytecode happens in the calling process,
+because it needs the actual Python function objects. The bytecode
+consists of plain tuples, in which types are referenced by name, so it
+can be sent to worker processes that convert it to SpirV.
+"""
+
+import os
+
+from . import _stats
+from ._module import ShaderModule, generate_spirv, normalize_options
+
+
+def compile_many(shaders, workers=None, **options):
+    """Compile multiple shaders to SpirV, using a pool of worker processes.
+
+    The ``shaders`` can be Python functions and/or ShaderModule objects.
+    The ``workers`` argument specifies the number of processes (default
+    the number of CPU's); if it's 1, the shaders are compiled in the
+    current process. Other keyword arguments are passed as options to
+    the SpirV generator.
+
+    Returns a list of ShaderModule objects, for which ``to_spirv()`` with
+    the given options returns the result without compiling.
+    """
+    from .py import python2shader
+
+    modules = []
+    for shader in shaders:
+        if not isinstance(shader, ShaderModule):
+            shader = python2shader(shader)
+        modules.append(shader)
+
+    # Select the modules that need compiling. Same modules are compiled once.
+    options = normalize_options(options)
+    key = tuple(sorted(options.items()))
+    todo = {}
+    for m in modules:
+        if id(m) not in todo and m._lookup_spirv(key, options) is None:
+            todo[id(m)] = m
+    todo = list(todo.values())
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(int(workers), len(todo))
+
+    collect_stats = _stats.is_enabled()
+    if workers <= 1:
+        results = (
+            generate_spirv(m.to_bytecode(), options, collect_stats) for m in todo
+        )
+        for m, (result, stats) in zip(todo, results):
+            m._store_spirv(key, options, result)
+            if collect_stats:
+                m._record_stats(stats)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        bytecodes = [m.to_bytecode() for m in todo]
+        n = len(todo)
+        chunksize = max(1, n // (workers * 4))
+        with ProcessPoolExecutor(workers) as executor:
+            results = executor.map(
+                generate_spirv,
+                bytecodes,
+                [options] * n,
+                [collect_stats] * n,
+                chunksize=chunksize,
+            )
+            for m, (result, stats) in zip(todo, results):
+                m._store_spirv(key, options, result)
+                if collect_stats:
+                    m._record_stats(stats)
+
+    return modules
@@ -0,0 +1,134 @@
+"""
+Ahead-of-time compilation of the shaders in Python modules. The result
+is a directory with SpirV files and a manifest, which can be loaded with
+``load_shaders()`` without importing the compiler.
+"""
+
+import os
+import sys
+import json
+import pkgutil
+import importlib
+
+from . import __version__
+from ._cache import get_function_hash
+from ._module import ShaderModule
+from ._batch import compile_many
+from ._archive import write_archive
+from ._precompiled import MANIFEST_FILENAME
+from .opcodes import bc2str
+
+
+def find_shader_modules(module_names):
+    """Import the given modules (and the submodules of packages), and
+    get a list of (module_name, ShaderModule) tuples for the shaders
+    that they define.
+    """
+    found = []
+    seen = set()
+    for module_name in _iter_module_names(module_names):
+        module = sys.modules[module_name]
+        for ob in vars(module).values():
+            if not isinstance(ob, ShaderModule) or id(ob) in seen:
+                continue
+            func = ob.input
+            # Skip shaders imported from other modules, and ones not from Python
+            if getattr(func, "__module__", None) != module_name:
+                continue
+            seen.add(id(ob))
+            found.append((module_name, ob))
+    return found
+
+
+def _iter_module_names(module_names):
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        yield module_name
+        if hasattr(module, "__path__"):  # A package
+            prefix = module_name + "."
+            for info in pkgutil.walk_packages(module.__path__, prefix):
+                importlib.import_module(info.name)
+                yield info.name
+
+
+def build_shaders(module_names, outdir, workers=None):
+    """Compile the shaders defined in the given modules, and write the
+    SpirV (and bytecode) files and a manifest to the given directory.
+    Returns the manifest (a dict).
+    """
+    found = find_shader_modules(module_names)
+    compile_many([m for _, m in found], workers=workers)
+
+    os.makedirs(outdir, exist_ok=True)
+    shaders = {}
+    for module_name, m in found:
+        func = m.input
+        name = f"{module_name}:{func.__qualname__}"
+        basename = name.replace(":", ".").replace("<", "").replace(">", "")
+        bytecode = m.to_bytecode()
+        with open(os.path.join(outdir, basename + ".spv"), "wb") as f:
+            f.write(m.to_spirv())
+        with open(os.path.join(outdir, basename + ".bc"), "wb") as f:
+            f.write(bc2str(bytecode).encode())
+        shaders[name] = {
+            "module": module_name,
+            "qualname": func.__qualname__,
+            "description": m.description,
+            "code_hash": get_function_hash(func, _get_execution_modes(bytecode)),
+            "shader_type": _get_shader_type(bytecode),
+            "resources": _get_resources(bytecode),
+            "spirv": basename + ".spv",
+            "bytecode": basename + ".bc",
+            "metadata": m.get_spirv_metadata(),
+        }
+
+    manifest = {"pyshader_version": __version__, "shaders": shaders}
+    with open(os.path.join(outdir, MANIFEST_FILENAME), "wb") as f:
+        f.write(json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest
+
+
+def build_archive(module_names, filename, workers=None):
+    """Compile the shaders defined in the given modules, and write them
+    to a single archive file, which can be loaded with ShaderArchive.
+    Returns the names of the shaders.
+    """
+    found = find_shader_modules(module_names)
+    compile_many([m for _, m in found], workers=workers)
+
+    entries = []
+    for module_name, m in found:
+        name = f"{module_name}:{m.input.__qualname__}"
+        entries.append((name, m.to_spirv(), m.get_spirv_metadata()))
+    write_archive(filename, entries)
+    return [entry[0] for entry in entries]
+
+
+def _get_shader_type(bytecode):
+    for opcode, *args in bytecode:
+        if opcode == "co_entrypoint":
+            return args[1]
+
+
+def _get_execution_modes(bytecode):
+    # These are part of the hash, like in python2shader(), because e.g.
+    # the workgroup size is not part of the Python code.
+    for opcode, *args in bytecode:
+        if opcode == "co_entrypoint":
+            return args[2]
+
+
+def _get_resources(bytecode):
+    resources = []
+    for opcode, *args in bytecode:
+        if opcode == "co_resource" and args[1] not in ("shared", "specialization"):
+            name, kind, slot, type_str = args
+            resources.append(
+                {
+                    "name": name.partition(".")[2],
+                    "kind": kind,
+                    "slot": list(slot) if isinstance(slot, tuple) else slot,
+                    "type": type_str,
+                }
+            )
+    return resources
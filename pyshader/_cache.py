@@ -0,0 +1,183 @@
+"""
+A persistent on-disk cache for compiled shaders. It's opt-in: set the
+PYSHADER_CACHE_DIR environment variable to a directory to enable it.
+The PYSHADER_CACHE_SIZE environment variable can be used to set the
+maximum size of the cache in bytes (default 64 MiB).
+
+Cache entries are keyed by a hash of the Python function's code object,
+the pyshader version and the compile options. We store the internal
+bytecode, and the SpirV for each set of generator options. Files are
+written atomically, so that multiple processes can share the cache.
+When the cache grows too large, the least recently used entries are
+removed.
+"""
+
+import os
+import json
+import types
+import hashlib
+import tempfile
+
+from .opcodes import bc2str, str2bc
+
+
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+CACHE_SUFFIXES = ".bc", ".spv"
+
+
+def get_cache_dir():
+    """Get the cache directory, or None if the cache is disabled."""
+    return os.getenv("PYSHADER_CACHE_DIR", "").strip() or None
+
+
+def get_cache_size():
+    """Get the maximum size of the cache in bytes."""
+    size = os.getenv("PYSHADER_CACHE_SIZE", "").strip()
+    return int(size) if size else DEFAULT_CACHE_SIZE
+
+
+def get_function_hash(func, options=None):
+    """Get a hash (hex str) that identifies the result of compiling
+    the given function with the given options.
+    """
+    from . import __version__
+
+    h = hashlib.sha1()
+    _hash_update(h, ("pyshader", __version__, func.__name__))
+    _hash_update(h, func.__code__)
+    _hash_update(h, func.__annotations__)
+    _hash_update(h, func.__defaults__)
+    _hash_update(h, sorted((options or {}).items()))
+    return h.hexdigest()
+
+
+def _hash_update(h, ob):
+    if isinstance(ob, types.CodeType):
+        # The repr of a code object includes its address, so we hash the parts
+        h.update(b"<code>")
+        for x in (ob.co_code, ob.co_lnotab, ob.co_filename, ob.co_firstlineno):
+            _hash_update(h, x)
+        for x in (ob.co_argcount, ob.co_kwonlyargcount, ob.co_flags):
+            _hash_update(h, x)
+        for x in (ob.co_consts, ob.co_names, ob.co_varnames, ob.co_freevars):
+            _hash_update(h, x)
+    elif isinstance(ob, (tuple, list)):
+        h.update(f"<{type(ob).__name__} {len(ob)}>".encode())
+        for x in ob:
+            _hash_update(h, x)
+    elif isinstance(ob, dict):
+        _hash_update(h, sorted(ob.items(), key=lambda kv: str(kv[0])))
+    elif isinstance(ob, bytes):
+        h.update(b"<bytes %i>" % len(ob) + ob)
+    elif isinstance(ob, type):
+        # ShaderType classes have a name that uniquely identifies them
+        h.update(f"<type {ob.__module__}.{ob.__name__}>".encode())
+    else:
+        h.update(repr(ob).encode())
+
+
+def _get_options_hash(options):
+    h = hashlib.sha1()
+    _hash_update(h, sorted(options.items()))
+    return h.hexdigest()[:16]
+
+
+def load_bytecode(key):
+    """Get the cached bytecode for the given key, or None."""
+    data = _load(key + ".bc")
+    if data is not None:
+        try:
+            return str2bc(data.decode())
+        except Exception:
+            return None
+
+
+def store_bytecode(key, bytecode):
+    """Store the bytecode for the given key."""
+    _store(key + ".bc", bc2str(bytecode).encode())
+
+
+def load_spirv(key, options):
+    """Get the cached (spirv, metadata) tuple for the given key and
+    generator options, or None.
+    """
+    data = _load(key + "-" + _get_options_hash(options) + ".spv")
+    if data is not None:
+        try:
+            n = int.from_bytes(data[:4], "little")
+            metadata = json.loads(data[4 : 4 + n].decode())
+            return data[4 + n :], metadata
+        except Exception:
+            return None
+
+
+def store_spirv(key, options, spirv, metadata):
+    """Store the spirv and metadata for the given key and generator options."""
+    meta_bytes = json.dumps(metadata).encode()
+    data = len(meta_bytes).to_bytes(4, "little") + meta_bytes + bytes(spirv)
+    _store(key + "-" + _get_options_hash(options) + ".spv", data)
+
+
+def _load(fname):
+    cache_dir = get_cache_dir()
+    if not cache_dir:
+        return None
+    filename = os.path.join(cache_dir, fname)
+    try:
+        with open(filename, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    # Touch the file, so that eviction is based on last use
+    try:
+        os.utime(filename)
+    except OSError:  # pragma: no cover
+        pass
+    return data
+
+
+def _store(fname, data):
+    cache_dir = get_cache_dir()
+    if not cache_dir:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file and then move it in place. The
+        # replace is atomic, so other processes never see partial files.
+        fd, tmp_filename = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_filename, os.path.join(cache_dir, fname))
+        except BaseException:
+            os.remove(tmp_filename)
+            raise
+    except OSError:  # pragma: no cover
+        return  # The cache is an optimization, not a requirement
+    _evict(cache_dir, get_cache_size())
+
+
+def _evict(cache_dir, max_size):
+    """Remove least recently used entries until the cache fits in max_size."""
+    entries = []
+    total_size = 0
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(CACHE_SUFFIXES):
+            try:
+                st = entry.stat()
+            except OSError:  # pragma: no cover - removed by another process
+                continue
+            entries.append((st.st_mtime, entry.path, st.st_size))
+            total_size += st.st_size
+    if total_size <= max_size:
+        return
+    entries.sort()
+    for mtime, filename, size in entries:
+        try:
+            os.remove(filename)
+        except OSError:  # pragma: no cover - in use or already removed
+            continue
+        total_size -= size
+        if total_size <= max_size:
+            break
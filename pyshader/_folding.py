@@ -0,0 +1,236 @@
+"""
+Constant folding for the SpirV generator. The functions in this module
+evaluate operations on constant values at compile time, following the
+semantics of the SpirV instruction that the generator would otherwise
+emit: floats are rounded to the precision of their type, and integers
+wrap around. Vector values are represented as tuples.
+
+Each function returns a (type, value) tuple, or None if the operation
+cannot (or should not) be folded, e.g. for unsupported types, for
+operations whose result is undefined (like division by zero), or for
+results that cannot be represented as a constant.
+"""
+
+import math
+import ctypes
+
+from . import _types
+
+
+INT_BITS = {"u8": 8, "i16": 16, "i32": 32, "i64": 64}
+
+
+def is_foldable_type(the_type):
+    """Get whether values of the given (scalar or vector) type can be folded."""
+    if issubclass(the_type, _types.Vector):
+        the_type = the_type.subtype
+    if issubclass(the_type, _types.Float):
+        return the_type in (_types.f32, _types.f64)
+    return issubclass(the_type, (_types.Int, _types.boolean))
+
+
+def normalize(the_type, value):
+    """Get the value as it is stored in a constant of the given scalar type."""
+    if the_type is _types.f32:
+        return ctypes.c_float(value).value
+    return value
+
+
+def _round_float(the_type, value):
+    value = normalize(the_type, float(value))
+    if value == 0 and math.copysign(1.0, value) < 0:
+        return None  # our constants cannot (yet) distinguish -0.0 and 0.0
+    return value
+
+
+def _wrap_int(the_type, value, signed=None):
+    bits = INT_BITS[the_type.__name__]
+    if signed is None:
+        signed = not the_type.__name__.startswith("u")
+    value &= (1 << bits) - 1
+    if signed and value >= 1 << (bits - 1):
+        value -= 1 << bits
+    return value
+
+
+def _div_trunc(a, b):
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _fold_scalar_binary(op, the_type, a, b):
+    if issubclass(the_type, _types.Float):
+        if op == "add":
+            return _round_float(the_type, a + b)
+        elif op == "sub":
+            return _round_float(the_type, a - b)
+        elif op == "mul":
+            return _round_float(the_type, a * b)
+        elif op in ("div", "fdiv") and b != 0:
+            return _round_float(the_type, a / b)
+        # The precision of OpFMod and OpFRem is not exactly specified
+    elif issubclass(the_type, _types.Int):
+        if op == "add":
+            return _wrap_int(the_type, a + b)
+        elif op == "sub":
+            return _wrap_int(the_type, a - b)
+        elif op == "mul":
+            return _wrap_int(the_type, a * b)
+        elif op in ("div", "idiv", "mod", "rem"):
+            # OpSDiv, OpSMod and OpSRem interpret their operands as signed
+            a, b = _wrap_int(the_type, a, True), _wrap_int(the_type, b, True)
+            if b == 0:
+                return None
+            elif op in ("div", "idiv"):
+                return _wrap_int(the_type, _div_trunc(a, b))
+            elif op == "mod":
+                return _wrap_int(the_type, a % b)  # sign of b, like Python
+            else:
+                return _wrap_int(the_type, a - b * _div_trunc(a, b))
+    elif issubclass(the_type, _types.boolean):
+        if op == "and":
+            return a and b
+        elif op == "or":
+            return a or b
+    return None
+
+
+def _fold_scalar_compare(cmp, the_type, a, b):
+    if issubclass(the_type, _types.Float):
+        if math.isnan(a) or math.isnan(b):
+            return False  # ordered comparisons
+    elif cmp not in ("==", "!="):
+        # OpSLessThan and friends interpret their operands as signed
+        a, b = _wrap_int(the_type, a, True), _wrap_int(the_type, b, True)
+    if cmp == "<":
+        return a < b
+    elif cmp == "<=":
+        return a <= b
+    elif cmp == "==":
+        return a == b
+    elif cmp == "!=":
+        return a != b
+    elif cmp == ">":
+        return a > b
+    elif cmp == ">=":
+        return a >= b
+    return None
+
+
+def _fold_scalar_convert(out_type, arg_type, value):
+    if issubclass(out_type, _types.Float):
+        if issubclass(arg_type, _types.boolean):
+            return 1.0 if value else 0.0
+        elif issubclass(arg_type, _types.Int) and abs(value) >= 1 << 53:
+            return None  # avoid double rounding
+        return _round_float(out_type, value)
+    elif issubclass(out_type, _types.Int):
+        if issubclass(arg_type, _types.boolean):
+            return 1 if value else 0
+        elif issubclass(arg_type, _types.Int):
+            # OpSConvert sign-extends
+            return _wrap_int(out_type, _wrap_int(arg_type, value, True))
+        elif math.isnan(value) or math.isinf(value):
+            return None
+        value = math.trunc(value)
+        if _wrap_int(out_type, value) != value:
+            return None  # out of range: undefined
+        return value
+    elif issubclass(out_type, _types.boolean):
+        if issubclass(arg_type, _types.Float) and math.isnan(value):
+            return False  # OpFOrdNotEqual
+        return value != 0
+    return None
+
+
+def _map(func, args, *values):
+    """Apply func to scalar values or to all elements of vector values.
+    Returns None if any of the results is None.
+    """
+    if not isinstance(values[0], tuple):
+        return func(*args, *values)
+    result = tuple(func(*args, *elements) for elements in zip(*values))
+    if any(x is None for x in result):
+        return None
+    return result
+
+
+def fold_unary_op(op, the_type, value):
+    """Fold a unary op (neg or not) on a scalar or vector value."""
+    if not is_foldable_type(the_type):
+        return None
+    el_type = the_type
+    if issubclass(the_type, _types.Vector):
+        el_type = the_type.subtype
+
+    def func(x):
+        if op == "neg" and issubclass(el_type, _types.Float):
+            return _round_float(el_type, -x)
+        elif op == "neg" and issubclass(el_type, _types.Int):
+            return _wrap_int(el_type, -x)
+        elif op == "not" and issubclass(el_type, _types.boolean):
+            return not x
+        return None
+
+    result = _map(func, (), value)
+    return None if result is None else (the_type, result)
+
+
+def fold_binary_op(op, type1, value1, type2, value2):
+    """Fold a binary op on two scalars or vectors of the same type, or on
+    a float vector and a float scalar.
+    """
+    if not (is_foldable_type(type1) and is_foldable_type(type2)):
+        return None
+    elif type1 is type2 and issubclass(type1, _types.Scalar):
+        result_type = type1
+        result = _fold_scalar_binary(op, type1, value1, value2)
+    elif type1 is type2 and issubclass(type1, _types.Vector):
+        result_type = type1
+        result = _map(_fold_scalar_binary, (op, type1.subtype), value1, value2)
+    elif (
+        issubclass(type1, _types.Scalar)
+        and issubclass(type2, _types.Vector)
+        and issubclass(type1, _types.Float)
+        and type2.subtype is type1
+    ):
+        result_type = type2
+        value1 = (value1,) * type2.length
+        result = _map(_fold_scalar_binary, (op, type1), value1, value2)
+    elif (
+        issubclass(type1, _types.Vector)
+        and issubclass(type2, _types.Scalar)
+        and issubclass(type2, _types.Float)
+        and type1.subtype is type2
+    ):
+        result_type = type1
+        value2 = (value2,) * type1.length
+        result = _map(_fold_scalar_binary, (op, type2), value1, value2)
+    else:
+        return None
+    return None if result is None else (result_type, result)
+
+
+def fold_compare(cmp, the_type, value1, value2):
+    """Fold a comparison of two scalar or vector values of the given type.
+    The result is a boolean or a boolean vector.
+    """
+    if not is_foldable_type(the_type):
+        return None
+    elif issubclass(the_type, _types.Vector):
+        result_type = _types.Vector(the_type.length, _types.boolean)
+        el_type = the_type.subtype
+    else:
+        result_type, el_type = _types.boolean, the_type
+    if not issubclass(el_type, _types.Numeric):
+        return None
+    result = _map(_fold_scalar_compare, (cmp, el_type), value1, value2)
+    return None if result is None else (result_type, result)
+
+
+def fold_convert(out_type, out_el_type, arg_el_type, value):
+    """Fold the conversion of a scalar or vector value to out_type."""
+    if not (is_foldable_type(out_el_type) and is_foldable_type(arg_el_type)):
+        return None
+    result = _map(_fold_scalar_convert, (out_el_type, arg_el_type), value)
+    return None if result is None else (out_type, result)
@@ -9,30 +9,99 @@ Notes on exceptions for code that parses/converts/compiles shading code:
 * Always provide an error message.
 """
 
-import io
+import sys
 import struct
+import functools
+from array import array
+from time import perf_counter
 
 from ._coreutils import ShaderError
 from . import _spirv_constants as cc
 from . import _types
 
 
+# The array typecode for 32 bit unsigned ints
+WORD_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+# The SpirV versions that we can target, see the spirv_version option.
+SPIRV_VERSIONS = (1, 0), (1, 1), (1, 2), (1, 3)
+
+# The struct formats to encode the value of (scalar) constants. Values of
+# types narrower than 32 bits are zero- or sign-extended to a full word.
+CONSTANT_FORMATS = {
+    "u8": "<I",
+    "i16": "<i",
+    "i32": "<i",
+    "i64": "<q",
+    "f32": "<f",
+    "f64": "<d",
+}
+
+
+# Instructions (in function bodies) without side effects. Their first two
+# operands are the result type and the result id.
+PURE_OPCODES = {
+    getattr(cc, name)
+    for name in """
+    OpAccessChain OpLoad OpPhi OpSelect OpCopyObject OpUndef
+    OpCompositeConstruct OpCompositeExtract OpCompositeInsert OpVectorShuffle
+    OpConvertFToU OpConvertFToS OpConvertSToF OpConvertUToF
+    OpUConvert OpSConvert OpFConvert OpBitcast
+    OpSNegate OpFNegate OpIAdd OpFAdd OpISub OpFSub OpIMul OpFMul
+    OpUDiv OpSDiv OpFDiv OpUMod OpSRem OpSMod OpFRem OpFMod
+    OpVectorTimesScalar OpMatrixTimesScalar OpVectorTimesMatrix
+    OpMatrixTimesVector OpMatrixTimesMatrix OpDot
+    OpLogicalEqual OpLogicalNotEqual OpLogicalOr OpLogicalAnd OpLogicalNot
+    OpIEqual OpINotEqual OpUGreaterThan OpSGreaterThan OpUGreaterThanEqual
+    OpSGreaterThanEqual OpULessThan OpSLessThan OpULessThanEqual OpSLessThanEqual
+    OpFOrdEqual OpFOrdNotEqual OpFOrdLessThan OpFOrdGreaterThan
+    OpFOrdLessThanEqual OpFOrdGreaterThanEqual
+    OpExtInst OpSampledImage OpImageSampleImplicitLod OpImageSampleExplicitLod
+    OpImageRead OpImageFetch
+    """.split()
+}
+
+# Pure instructions that read memory (or images), and whose result can
+# therefore change when an instruction with side effects is executed.
+MEMORY_READ_OPCODES = {cc.OpLoad, cc.OpImageRead, cc.OpImageFetch}
+
+# Debug and annotation instructions, which are only needed if their
+# target (the first operand) is used.
+TARGETED_OPCODES = {cc.OpName, cc.OpMemberName, cc.OpDecorate, cc.OpMemberDecorate}
+
+# Decorations that keep their target alive: the specialization constants
+# are part of the shader's interface, and the WorkgroupSize builtin can be
+# a constant that is not used otherwise.
+ROOT_DECORATIONS = {cc.Decoration_SpecId, cc.Decoration_BuiltIn}
+
+
+@functools.lru_cache(maxsize=4096)
 def str_to_words(s):
+    """Encode a string as a tuple of SpirV words (ints). The result is
+    cached, because the same names occur often.
+    """
     # In SpirV, words are 32bit. Op counting is per word, not per immediate or per byte.
     b = s.encode()
     padding = 4 - (len(b) % 4)  # 4, 3, 2 or 1 -> always at least 1 for 0-termination
-    b += padding * b"\x00"
-    assert len(b) % 4 == 0 and b[-1] == 0, b
-    words = []
-    for i in range(0, len(b), 4):
-        words.append(b[i : i + 4])
-        # words.append(struct.unpack("<I", b[i : i + 4])[0])
-    return words
+    return bytes_to_words(b + padding * b"\x00")
+
+
+def bytes_to_words(b):
+    """Convert little endian bytes (a multiple of 4) to a tuple of SpirV words."""
+    if len(b) % 4:
+        raise RuntimeError(f"Cannot convert {len(b)} bytes to SpirV words.")
+    words = array(WORD_TYPECODE, b)
+    if sys.byteorder != "little":  # pragma: no cover
+        words.byteswap()
+    return tuple(words)
 
 
 class AnyId:
     """Anything that has an id in a SpirV module"""
 
+    # Shaders can have many ids, so we keep them small
+    __slots__ = ["name", "id"]
+
     def __init__(self, name=""):
         self.name = name
         self.id = None
@@ -63,6 +132,8 @@ class AnyId:
 class TypeId(AnyId):
     """A type in a SpirV module."""
 
+    __slots__ = ["type"]
+
     def __init__(self, type, name=""):
         super().__init__(name=name)
         self.type = type
@@ -71,6 +142,8 @@ class TypeId(AnyId):
 class ValueId(AnyId):
     """Anything that represents a concrete value in a SpirV module."""
 
+    __slots__ = ["type"]
+
     def __init__(self, type, name=""):
         super().__init__(name=name)
         self.type = type
@@ -89,6 +162,16 @@ class VariableAccessId(ValueId):
     is always None.
     """
 
+    # The sample_type, sampled and depth are only used for textures
+    __slots__ = [
+        "variable",
+        "storage_class",
+        "indices",
+        "sample_type",
+        "sampled",
+        "depth",
+    ]
+
     def __init__(self, variable, storage_class, type, *indices, name=""):
         super().__init__(type, name=name)
         self.variable = variable  # ValueId representing the SpirV Variable
@@ -185,6 +268,8 @@ class WordPlaceholder:
     program.
     """
 
+    __slots__ = ["value"]
+
     def __init__(self, initial_value):
         assert isinstance(initial_value, (int, bytes))
         self.value = initial_value
@@ -193,13 +278,42 @@ class WordPlaceholder:
         return f"~{self.value}"
 
 
+def get_word_value(word):
+    """Get the (id) value of a word that is an AnyId, WordPlaceholder or int."""
+    if isinstance(word, AnyId):
+        return word.id
+    elif isinstance(word, WordPlaceholder):
+        return word.value
+    return word
+
+
 class BaseSpirVGenerator:
     """Base class that can be used by compiler implementations in the
     last compile step to generate the SpirV code. It has an internal
     representation of SpirV module and provides an API to generate
     instructions. This class it not aware of our bytecode representation.
+
+    Subclasses can define the options that they support (and their
+    default values) in the ``default_options`` dict.
     """
 
+    default_options = {
+        "promote_locals": False,
+        "eliminate_common_subexpressions": False,
+        "eliminate_dead_code": False,
+        "spirv_version": (1, 3),
+    }
+
+    def __init__(self, **options):
+        for key in options:
+            if key not in self.default_options:
+                raise TypeError(f"Invalid option for {self.__class__.__name__}: {key}")
+        self._options = self.default_options.copy()
+        self._options.update(options)
+        if self._options["spirv_version"] not in SPIRV_VERSIONS:
+            versions = ", ".join(str(v) for v in SPIRV_VERSIONS)
+            raise ValueError(f"The spirv_version must be one of {versions}.")
+
     def convert(self, input):
         """Generate the Spir-V code. After this, dump() can be used to
         produce the binary blob that represents the Spir-V module.
@@ -209,10 +323,15 @@ class BaseSpirVGenerator:
         self._init()
 
         # Do the thing!
+        t0 = perf_counter()
         self._convert(input)
+        t1 = perf_counter()
 
         # Wrap up
         self._post_convert()
+        t2 = perf_counter()
+
+        self._phase_times = {"convert": t1 - t0, "post_convert": t2 - t1}
 
     def _convert(self, input):
         """Subclasses should implement this."""
@@ -222,7 +341,11 @@ class BaseSpirVGenerator:
 
         self._ids = {0: None}  # maps id -> info. For objects, info is a type in _types
         self._constants = {}
+        self._constant_cache_hits = 0
+        self._phase_times = {}
         self._type_hash_to_id = {}
+        self._type_to_id = {}  # fast path for obtain_type_id()
+        self._undefs = {}  # type id -> ValueId
         self._capabilities = set()
         self._execution_modes = {}
         self._extentded_instruction_sets = {}
@@ -316,14 +439,9 @@ class BaseSpirVGenerator:
         # Move OpVariable to the start of a function
         # Variables are used to refer to either internal variables, or IO, and load/store
         # is used to move variables from/to the stack.
-        func_instructions = self._sections["functions"]
-        insert_point = -1
-        for i in range(len(func_instructions)):
-            if func_instructions[i][0] == cc.OpFunction:
-                insert_point = i + 2
-            elif func_instructions[i][0] == cc.OpVariable:
-                func_instructions.insert(insert_point, func_instructions.pop(i))
-                insert_point += 1
+        self._sections["functions"] = self._layout_functions(
+            self._sections["functions"]
+        )
 
         # Get ids of global variables
         global_OpVariable_s = []
@@ -337,8 +455,572 @@ class BaseSpirVGenerator:
             global_OpVariable_s
         )
 
+        if self._options["promote_locals"]:
+            self._promote_locals()
+        if self._options["eliminate_common_subexpressions"]:
+            self._merge_pointer_types()
+            self._eliminate_common_subexpressions()
+        if self._options["eliminate_dead_code"]:
+            self._eliminate_dead_code()
+
+    def _layout_functions(self, instructions):
+        """Get a new list of function instructions, in which the OpVariable
+        instructions of each function are moved to the start of its first
+        block, as required by SpirV. Runs in linear time.
+        """
+        OpFunction, OpFunctionEnd = cc.OpFunction, cc.OpFunctionEnd
+        OpVariable, OpLabel = cc.OpVariable, cc.OpLabel
+        result = []
+        head = variables = body = None  # the parts of the current function
+        for instr in instructions:
+            opcode = instr[0]
+            if opcode == OpFunction:
+                head, variables, body = [instr], [], []
+            elif head is None:
+                result.append(instr)  # not in a function
+            elif opcode == OpVariable:
+                variables.append(instr)
+            elif body or head[-1][0] == OpLabel:
+                body.append(instr)
+            else:
+                head.append(instr)  # parameters and the first label
+            if opcode == OpFunctionEnd and head is not None:
+                result += head + variables + body
+                head = None
+        if head is not None:
+            result += head + variables + body
+        return result
+
+    def _promote_locals(self):
+        """Promote function variables of scalar and vector types that are
+        only loaded and stored (never indexed) to SSA values. The loads
+        are replaced with the stored values, and OpPhi instructions are
+        inserted where control flow merges. Also see _promote_locals_in_function().
+        """
+        sections = self._sections
+        value_type_opcodes = {
+            cc.OpTypeBool,
+            cc.OpTypeInt,
+            cc.OpTypeFloat,
+            cc.OpTypeVector,
+        }
+
+        # Get the value types of pointers that can be promoted
+        type_opcodes = {}
+        pointee_types = {}  # id of pointer type -> TypeId of value
+        for instr in sections["types"]:
+            opcode = instr[0]
+            if opcode == cc.OpTypePointer:
+                if instr[2] == cc.StorageClass_Function:
+                    if type_opcodes.get(instr[3].id, None) in value_type_opcodes:
+                        pointee_types[instr[1].id] = instr[3]
+            elif opcode.name.startswith("OpType"):
+                type_opcodes[instr[1].id] = opcode
+
+        # Process each function
+        result = []
+        promoted = set()
+        function = []
+        for instr in sections["functions"]:
+            function.append(instr)
+            if instr[0] == cc.OpFunctionEnd:
+                result += self._promote_locals_in_function(
+                    function, pointee_types, promoted
+                )
+                function = []
+        sections["functions"] = result + function
+
+        # Remove the names of the variables that are gone
+        sections["debug"] = [
+            instr
+            for instr in sections["debug"]
+            if not (instr[0] == cc.OpName and instr[1] in promoted)
+        ]
+
+    def _promote_locals_in_function(self, instructions, pointee_types, promoted):
+        """Promote variables in a single function. Uses the classic approach
+        by Cytron et al.: the dominator tree is calculated (with the
+        algorithm by Cooper, Harvey and Kennedy), phi nodes are placed in
+        the iterated dominance frontier of the blocks that store to a
+        variable, and then the loads are renamed in a walk over the
+        dominator tree. Finally, trivial and unused phi nodes are removed.
+        """
+        OpLabel, OpLoad, OpStore = cc.OpLabel, cc.OpLoad, cc.OpStore
+        OpVariable, OpPhi = cc.OpVariable, cc.OpPhi
+
+        # Split into blocks
+        head, blocks = [], []
+        for instr in instructions:
+            if instr[0] == OpLabel:
+                blocks.append([instr])
+            elif blocks:
+                blocks[-1].append(instr)
+            else:
+                head.append(instr)
+        tail = [blocks[-1].pop()] if blocks else []
+
+        # Select the variables to promote: they must only be loaded and stored
+        variables = {}  # id -> (variable id, TypeId of value)
+        for instr in blocks[0] if blocks else ():
+            if instr[0] == OpVariable and instr[1].id in pointee_types:
+                variables[instr[2].id] = instr[2], pointee_types[instr[1].id]
+        for block in blocks:
+            for instr in block:
+                opcode = instr[0]
+                for i, word in enumerate(instr):
+                    if isinstance(word, AnyId) and word.id in variables:
+                        if not (
+                            (opcode == OpLoad and i == 3)
+                            or (opcode == OpStore and i == 1)
+                            or (opcode == OpVariable and i == 2)
+                        ):
+                            variables.pop(word.id)
+        if not variables:
+            return instructions
+        promoted.update(variables)
+
+        # Get the control flow graph
+        labels = [block[0][1] for block in blocks]
+        label_indices = {label.id: i for i, label in enumerate(labels)}
+        successors = []
+        for block in blocks:
+            last = block[-1]
+            targets = ()
+            if last[0] == cc.OpBranch:
+                targets = last[1:2]
+            elif last[0] == cc.OpBranchConditional:
+                targets = last[2:4]
+            indices = [label_indices[get_word_value(w)] for w in targets]
+            successors.append(sorted(set(indices), key=indices.index))
+        predecessors = [[] for block in blocks]
+        for i, indices in enumerate(successors):
+            for j in indices:
+                predecessors[j].append(i)
+
+        # Get the reachable blocks in reverse postorder
+        order = []
+        visited = {0}
+        stack = [(0, iter(successors[0]))]
+        while stack:
+            i, iterator = stack[-1]
+            for j in iterator:
+                if j not in visited:
+                    visited.add(j)
+                    stack.append((j, iter(successors[j])))
+                    break
+            else:
+                stack.pop()
+                order.append(i)
+        order.reverse()
+        order_indices = {i: k for k, i in enumerate(order)}
+
+        # Calculate the immediate dominators
+        idom = {0: 0}
+        changed = True
+        while changed:
+            changed = False
+            for i in order[1:]:
+                new_idom = None
+                for j in predecessors[i]:
+                    if j not in idom:
+                        continue
+                    elif new_idom is None:
+                        new_idom = j
+                    else:
+                        while j != new_idom:
+                            while order_indices[j] > order_indices[new_idom]:
+                                j = idom[j]
+                            while order_indices[new_idom] > order_indices[j]:
+                                new_idom = idom[new_idom]
+                if idom.get(i, None) != new_idom:
+                    idom[i] = new_idom
+                    changed = True
+
+        # Calculate the dominance frontiers
+        frontiers = {i: set() for i in order}
+        for i in order:
+            reachable_predecessors = [j for j in predecessors[i] if j in idom]
+            if len(reachable_predecessors) >= 2:
+                for runner in reachable_predecessors:
+                    while runner != idom[i]:
+                        frontiers[runner].add(i)
+                        runner = idom[runner]
+
+        # Place phi nodes
+        def_blocks = {var_id: set() for var_id in variables}
+        for i in order:
+            for instr in blocks[i]:
+                if instr[0] == OpStore and instr[1].id in variables:
+                    def_blocks[instr[1].id].add(i)
+        phis = {}  # block index -> list of [var_id, phi_id, operands]
+        for var_id, todo in def_blocks.items():
+            todo = list(todo)
+            has_phi = set()
+            while todo:
+                for i in frontiers[todo.pop()]:
+                    if i not in has_phi:
+                        has_phi.add(i)
+                        var, type_id = variables[var_id]
+                        phi_id = ValueId(type_id.type, var.name)
+                        phi_id.resolve(self)
+                        phis.setdefault(i, []).append((var_id, phi_id, []))
+                        todo.append(i)
+
+        # Rename, by walking the dominator tree
+        replacements = {}  # id -> AnyId
+
+        def resolve(word):
+            while word.id in replacements:
+                word = replacements[word.id]
+            return word
+
+        def get_current(var_id):
+            if current[var_id]:
+                return current[var_id][-1]
+            return self._obtain_undef(variables[var_id][1])
+
+        children = {i: [] for i in order}
+        for i in order[1:]:
+            children[idom[i]].append(i)
+        current = {var_id: [] for var_id in variables}
+        stack = [(0, None)]
+        while stack:
+            i, pushed = stack.pop()
+            if pushed is not None:
+                for var_id in pushed:
+                    current[var_id].pop()
+                continue
+            pushed = []
+            for var_id, phi_id, operands in phis.get(i, ()):
+                current[var_id].append(phi_id)
+                pushed.append(var_id)
+            new_block = []
+            for instr in blocks[i]:
+                opcode = instr[0]
+                if opcode == OpLoad and instr[3].id in variables:
+                    replacements[instr[2].id] = get_current(instr[3].id)
+                elif opcode == OpStore and instr[1].id in variables:
+                    current[instr[1].id].append(resolve(instr[2]))
+                    pushed.append(instr[1].id)
+                elif not (opcode == OpVariable and instr[2].id in variables):
+                    new_block.append(instr)
+            blocks[i] = new_block
+            for j in successors[i]:
+                for var_id, phi_id, operands in phis.get(j, ()):
+                    operands.append((get_current(var_id), labels[i]))
+            stack.append((i, pushed))
+            stack.extend((j, None) for j in reversed(children[i]))
+
+        # Unreachable blocks can still refer to the variables
+        for i, block in enumerate(blocks):
+            if i not in idom:
+                new_block = []
+                for instr in block:
+                    opcode = instr[0]
+                    if opcode == OpLoad and instr[3].id in variables:
+                        replacements[instr[2].id] = get_current(instr[3].id)
+                    elif not (opcode == OpStore and instr[1].id in variables):
+                        new_block.append(instr)
+                blocks[i] = new_block
+                for j in successors[i]:
+                    for var_id, phi_id, operands in phis.get(j, ()):
+                        operands.append((get_current(var_id), labels[i]))
+
+        # Remove phi nodes that have only one value (other than themselves)
+        changed = True
+        while changed:
+            changed = False
+            for block_phis in phis.values():
+                for var_id, phi_id, operands in block_phis:
+                    if phi_id.id in replacements:
+                        continue
+                    values = {
+                        resolve(value).id: resolve(value) for value, _ in operands
+                    }
+                    values.pop(phi_id.id, None)
+                    if len(values) <= 1:
+                        replacements[phi_id.id] = (
+                            values.popitem()[1]
+                            if values
+                            else self._obtain_undef(variables[var_id][1])
+                        )
+                        changed = True
+
+        # Assemble the function, applying the replacements
+        def rewrite(instr):
+            return tuple(
+                resolve(word) if isinstance(word, AnyId) else word for word in instr
+            )
+
+        result = [rewrite(instr) for instr in head]
+        phi_instructions = {}
+        for i, block in enumerate(blocks):
+            result.append(block[0])
+            for var_id, phi_id, operands in phis.get(i, ()):
+                if phi_id.id not in replacements:
+                    words = [OpPhi, variables[var_id][1], phi_id]
+                    for value, label in operands:
+                        words += [resolve(value), label]
+                    phi_instructions[phi_id.id] = len(result)
+                    result.append(tuple(words))
+            result.extend(rewrite(instr) for instr in block[1:])
+        result += tail
+
+        # Remove phi nodes that are not used (except by other phi nodes)
+        used = set()
+        todo = [
+            instr
+            for instr in result
+            if instr[0] != OpPhi or instr[2].id not in phi_instructions
+        ]
+        while todo:
+            instr = todo.pop()
+            for word in instr:
+                if isinstance(word, AnyId) and word.id in phi_instructions:
+                    if word.id not in used:
+                        used.add(word.id)
+                        todo.append(result[phi_instructions[word.id]])
+        unused = {phi_instructions[id] for id in phi_instructions if id not in used}
+        return [instr for i, instr in enumerate(result) if i not in unused]
+
+    def _obtain_undef(self, type_id):
+        """Get the id of an undefined value of the given type."""
+        try:
+            return self._undefs[type_id.id]
+        except KeyError:
+            undef_id = ValueId(type_id.type, "undef")
+            self.gen_instruction("types", cc.OpUndef, type_id, undef_id)
+            self._undefs[type_id.id] = undef_id
+            return undef_id
+
+    def _merge_pointer_types(self):
+        """Merge duplicate pointer types (a pointer type is declared for
+        each access chain) by giving them the same id.
+        """
+        OpTypePointer = cc.OpTypePointer
+        pointer_types = {}
+        types = []
+        for instr in self._sections["types"]:
+            if instr[0] == OpTypePointer:
+                key = instr[2], instr[3].id
+                if key in pointer_types:
+                    instr[1].id = pointer_types[key]
+                    continue
+                pointer_types[key] = instr[1].id
+            types.append(instr)
+        self._sections["types"] = types
+
+    def _eliminate_common_subexpressions(self):
+        """Remove instructions without side effects that compute the same as
+        an earlier instruction in the same block, i.e. that have the same
+        opcode, result type and operands. The result of the earlier
+        instruction is used instead. Loads are only re-used until an
+        instruction with side effects is encountered, or, for function
+        variables, until the variable is stored to.
+        """
+        OpLabel, OpPhi, OpUndef = cc.OpLabel, cc.OpPhi, cc.OpUndef
+        OpVariable, OpAccessChain, OpStore = cc.OpVariable, cc.OpAccessChain, cc.OpStore
+        replacements = {}  # id -> AnyId
+        values = {}  # (opcode, type, operands) -> AnyId, for the current block
+        reads = {}  # same, for instructions that read memory
+        bases = {}  # id of pointer -> id of function variable
+        result = []
+        for instr in self._sections["functions"]:
+            opcode = instr[0]
+            if replacements:
+                instr = tuple(
+                    replacements.get(w.id, w) if isinstance(w, AnyId) else w
+                    for w in instr
+                )
+            if opcode in PURE_OPCODES and opcode not in (OpPhi, OpUndef):
+                key = (opcode, instr[1].id) + tuple(
+                    w.id if isinstance(w, AnyId) else w for w in instr[3:]
+                )
+                table = reads if opcode in MEMORY_READ_OPCODES else values
+                if key in table:
+                    replacements[instr[2].id] = table[key]
+                    continue
+                table[key] = instr[2]
+                if opcode == OpAccessChain and instr[3].id in bases:
+                    bases[instr[2].id] = bases[instr[3].id]
+            elif opcode == OpLabel:
+                values.clear()
+                reads.clear()
+            elif opcode == OpVariable:
+                bases[instr[2].id] = instr[2].id
+            elif opcode == OpStore and instr[1].id in bases:
+                base = bases[instr[1].id]
+                for key in [key for key in reads if bases.get(key[2], None) == base]:
+                    del reads[key]
+            elif opcode not in PURE_OPCODES:
+                reads.clear()
+            result.append(instr)
+        self._sections["functions"] = result
+
+        # Phi instructions can refer to values further down the function,
+        # and debug names and decorations of removed values must go.
+        if replacements:
+            for i, instr in enumerate(result):
+                if instr[0] == OpPhi:
+                    result[i] = tuple(
+                        replacements.get(w.id, w) if isinstance(w, AnyId) else w
+                        for w in instr
+                    )
+            for section_name in ("debug", "annotations"):
+                self._sections[section_name] = [
+                    instr
+                    for instr in self._sections[section_name]
+                    if not (
+                        instr[0] in TARGETED_OPCODES
+                        and (instr[1].id if isinstance(instr[1], AnyId) else instr[1])
+                        in replacements
+                    )
+                ]
+
+    def _eliminate_dead_code(self):
+        """Remove unused declarations (types, constants, function variables
+        and extended instruction sets), instructions without side effects
+        whose result is not used, and stores into function variables that
+        are never read. Debug names and decorations of removed ids are
+        removed too. Duplicate pointer types are merged, and the ids are
+        renumbered so that the id bound is as small as possible.
+        """
+        sections = self._sections
+        OpVariable, OpAccessChain, OpStore = cc.OpVariable, cc.OpAccessChain, cc.OpStore
+
+        self._merge_pointer_types()
+
+        # Collect the instructions that can be removed (by the id that they
+        # define), the stores into function variables, and the instructions
+        # that must be kept (the roots).
+        definitions = {}  # id -> instruction
+        stores = {}  # id of function variable -> store instructions
+        roots = []
+        targeted = []
+        access_chain_bases = {}
+        for section_name, instructions in sections.items():
+            for instr in instructions:
+                opcode = instr[0]
+                if opcode in TARGETED_OPCODES:
+                    if opcode == cc.OpDecorate and instr[2] in ROOT_DECORATIONS:
+                        roots.append(instr)
+                    else:
+                        targeted.append(instr)
+                elif section_name == "types":
+                    if opcode.name.startswith("OpType"):
+                        definitions[instr[1].id] = instr
+                    elif opcode == OpVariable:
+                        roots.append(instr)  # keep the shader's interface
+                    else:
+                        definitions[instr[2].id] = instr
+                elif section_name == "extension_imports":
+                    definitions[instr[1].id] = instr
+                elif section_name != "functions":
+                    roots.append(instr)
+                elif opcode in PURE_OPCODES or opcode == OpVariable:
+                    definitions[instr[2].id] = instr
+                    if opcode == OpAccessChain:
+                        base = instr[3].id
+                        access_chain_bases[instr[2].id] = access_chain_bases.get(
+                            base, base
+                        )
+                elif opcode == OpStore:
+                    pointer = instr[1].id
+                    base = access_chain_bases.get(pointer, pointer)
+                    base_instr = definitions.get(base, None)
+                    if base_instr is not None and base_instr[0] == OpVariable:
+                        stores.setdefault(base, []).append(instr)
+                    else:
+                        roots.append(instr)
+                else:
+                    roots.append(instr)
+
+        # Mark the used ids, starting from the roots
+        used = set()
+        todo = []
+        for instr in roots:
+            todo.append(instr)
+        while todo:
+            instr = todo.pop()
+            for word in instr:
+                if isinstance(word, AnyId) and word.id not in used:
+                    used.add(word.id)
+                    if word.id in definitions:
+                        todo.append(definitions.pop(word.id))
+                    todo.extend(stores.pop(word.id, ()))
+
+        # Remove what's not used
+        removed = {id(instr) for instr in definitions.values()}
+        for instructions in stores.values():
+            removed.update(id(instr) for instr in instructions)
+        for instr in targeted:
+            target = instr[1].id if isinstance(instr[1], AnyId) else instr[1]
+            if target not in used:
+                removed.add(id(instr))
+        for section_name, instructions in sections.items():
+            sections[section_name] = [
+                instr for instr in instructions if id(instr) not in removed
+            ]
+
+        # Renumber the ids. Note that branch instructions refer to labels
+        # via placeholders, and that OpName refers to its target by number.
+        branch_opcodes = {
+            cc.OpBranch,
+            cc.OpBranchConditional,
+            cc.OpSelectionMerge,
+            cc.OpLoopMerge,
+        }
+        new_ids = {old_id: i + 1 for i, old_id in enumerate(sorted(used))}
+        id_objects = {}
+        for section_name, instructions in sections.items():
+            for i, instr in enumerate(instructions):
+                for word in instr:
+                    if isinstance(word, AnyId):
+                        id_objects[id(word)] = word
+                if instr[0] in branch_opcodes:
+                    instructions[i] = tuple(
+                        new_ids[w.value] if isinstance(w, WordPlaceholder) else w
+                        for w in instr
+                    )
+                elif instr[0] in TARGETED_OPCODES and isinstance(instr[1], int):
+                    instructions[i] = (instr[0], new_ids[instr[1]]) + instr[2:]
+        self._ids = {0: None}
+        for ob in id_objects.values():
+            ob.id = new_ids[ob.id]
+            self._ids[ob.id] = ob
+
     # %% Utility for compiler
 
+    def get_metadata(self):
+        """Get a dict with info derived during the generation of the SpirV
+        module. Contains the id bound, capabilities, extended instruction
+        sets and execution modes. All values are json-compatible.
+        """
+        return {
+            "bound": len(self._ids),
+            "capabilities": sorted(
+                repr(c) for c in self._capabilities | {cc.Capability_Shader}
+            ),
+            "extended_instruction_sets": sorted(self._extentded_instruction_sets),
+            "execution_modes": {
+                key: list(val) for key, val in self._execution_modes.items()
+            },
+        }
+
+    def get_stats(self):
+        """Get a dict with statistics of the generation: the time spent in
+        each phase (in seconds), and the number of instructions, ids, types
+        and constants, and how often an existing constant was re-used.
+        """
+        return {
+            "phases": dict(self._phase_times),
+            "instructions": sum(len(x) for x in self._sections.values()),
+            "ids": len(self._ids) - 1,
+            "types": len(self._type_hash_to_id),
+            "constants": len(self._constants),
+            "constant_cache_hits": self._constant_cache_hits,
+        }
+
     def to_text(self):
         """Generate a textual (dis-assembly-like) representation."""
 
@@ -375,6 +1057,8 @@ class BaseSpirVGenerator:
                             cc.OpBranchConditional,
                         ):
                             pass
+                        elif instruction[0] == cc.OpPhi and i is not instruction[2]:
+                            pass  # operands can be defined further down
                         elif i.id not in seen_ids:
                             seen_ids.add(i.id)
                             ret = i.display_name + " = "
@@ -386,48 +1070,68 @@ class BaseSpirVGenerator:
 
         return "\n".join(lines)
 
-    def dump(self):
-        """Generated a bytes object representing the Spir-V module."""
+    def dump(self, out=None, as_memoryview=False):
+        """Generate the binary representation of the Spir-V module. By
+        default returns a bytes object. If ``as_memoryview`` is True, returns
+        a memoryview of the words that were generated (no copy is made).
+        If ``out`` is given, the module is written to it instead, and the
+        number of bytes written is returned. It can be a bytearray (which
+        gets extended) or a file-like object.
+        """
 
-        f = io.BytesIO()
+        t0 = perf_counter()
 
-        def write_word(w):
-            if isinstance(w, bytes):
-                assert len(w) == 4
-                f.write(w)
-            else:
-                f.write(struct.pack("<I", w))
-
-        # We pin to version 1.3, since higher versions seem not well supported by drivers
-        # version = cc.Version
-        # version = struct.unpack("<I", struct.pack("<bbbb", 0, 5, 1, 0))
-        version = 66304
+        # We go up to version 1.3, since higher versions seem not well supported by drivers
+        major, minor = self._options["spirv_version"]
+        version = (major << 16) | (minor << 8)
 
         # Write header
-        write_word(cc.MagicNumber)  # Magic number
-        write_word(version)  # SpirV version
-        write_word(0)  # Vendor id - can be zero, let's use zero until we are registered
-        write_word(len(self._ids))  # Bound (of ids)
-        write_word(0)  # Reserved
-
-        # Write instructions
+        words = array(WORD_TYPECODE)
+        words.append(cc.MagicNumber)  # Magic number
+        words.append(version)  # SpirV version
+        words.append(0)  # Vendor id - zero until we are registered
+        words.append(len(self._ids))  # Bound (of ids)
+        words.append(0)  # Reserved
+
+        # Write instructions. The first word is set when we know the word count.
+        append, extend = words.append, words.extend
         for instructions in self._sections.values():
-            for opcode, *instr_words in instructions:
-                words = []
-                for word in instr_words:
+            for opcode, *operands in instructions:
+                i = len(words)
+                append(0)
+                for word in operands:
                     if isinstance(word, AnyId):
-                        words.append(word.id)
+                        append(word.id)
+                    elif isinstance(word, int):
+                        append(word)
                     elif isinstance(word, WordPlaceholder):
-                        words.append(word.value)
+                        value = word.value
+                        if isinstance(value, int):
+                            append(value)
+                        else:
+                            extend(bytes_to_words(value))
                     elif isinstance(word, str):
-                        words.extend(str_to_words(word))
+                        extend(str_to_words(word))
                     else:
-                        words.append(word)
-                write_word(((len(words) + 1) << 16) | opcode)
-                for word in words:
-                    write_word(word)
+                        extend(bytes_to_words(word))
+                words[i] = ((len(words) - i) << 16) | opcode
+
+        # SpirV is little endian
+        if sys.byteorder != "little":  # pragma: no cover
+            words.byteswap()
+
+        self._phase_times["dump"] = perf_counter() - t0
 
-        return f.getvalue()
+        if out is not None:
+            if isinstance(out, bytearray):
+                out += memoryview(words)
+            else:
+                out.write(memoryview(words))
+            return len(words) * 4
+        elif as_memoryview:
+            return memoryview(words).cast("B")
+        else:
+            return words.tobytes()
 
     # %% Utils for subclasses
 
@@ -463,16 +1167,12 @@ class BaseSpirVGenerator:
         if isinstance(value, float):
             the_type = _types.f32 if the_type is None else the_type
             assert the_type.__name__ != "f16", "Cannot yet create f16 constants."
-            M = {"f32": "<f", "f64": "<d"}
-            struct_type = M[the_type.__name__]
-            bb = struct.pack(struct_type, value)
+            bb = struct.pack(CONSTANT_FORMATS[the_type.__name__], value)
         elif isinstance(value, bool):  # test before int because issubclass(bool, int)
             the_type = _types.boolean
         elif isinstance(value, int):
             the_type = _types.i32 if the_type is None else the_type
-            M = {"u8": "<B", "i16": "<h", "i32": "<i", "i64": "<q"}
-            struct_type = M[the_type.__name__]
-            bb = struct.pack(struct_type, value)
+            bb = struct.pack(CONSTANT_FORMATS[the_type.__name__], value)
         else:
             raise RuntimeError(f"Cannot get a constant for {value}")
         # Make sure that we have it
@@ -487,9 +1187,29 @@ class BaseSpirVGenerator:
                 self.gen_instruction("types", cc.OpConstant, type_id, id, bb)
             self.gen_instruction("debug", cc.OpName, id.id, name)
             self._constants[key] = id
+        else:
+            self._constant_cache_hits += 1
         # Return cached
         return self._constants[key]
 
+    def obtain_spec_constant(self, value, the_type, spec_id, name=""):
+        """Create a specialization constant with the given default value
+        and SpecId. Unlike normal constants, these are never re-used.
+        """
+        id, type_id = self.obtain_value(the_type, name)
+        if the_type is _types.boolean:
+            opcode = cc.OpSpecConstantTrue if value else cc.OpSpecConstantFalse
+            self.gen_instruction("types", opcode, type_id, id)
+        else:
+            bb = struct.pack(CONSTANT_FORMATS[the_type.__name__], value)
+            self.gen_instruction("types", cc.OpSpecConstant, type_id, id, bb)
+        self.gen_instruction(
+            "annotations", cc.OpDecorate, id, cc.Decoration_SpecId, spec_id
+        )
+        if name:
+            self.gen_instruction("debug", cc.OpName, id.id, name)
+        return id
+
     def obtain_variable(self, the_type, storage_class, name=""):
         """Create a variable in the current scope. Generates an OpVariable
         definition instruction and returns a VariableAccessId to access it.
@@ -518,6 +1238,11 @@ class BaseSpirVGenerator:
         """Get the id for the given type. Generates a type
         definition instruction as needed.
         """
+        try:
+            return self._type_to_id[the_type]
+        except KeyError:
+            pass
+
         if isinstance(the_type, tuple):
             if not (
                 the_type
@@ -538,7 +1263,9 @@ class BaseSpirVGenerator:
 
         # Already know this type?
         if type_hash in self._type_hash_to_id:
-            return self._type_hash_to_id[type_hash]
+            type_id = self._type_hash_to_id[type_hash]
+            self._type_to_id[the_type] = type_id
+            return type_id
 
         if isinstance(the_type, tuple):
             type_id = TypeId(the_type)  # all info is now on TypeId instance
@@ -617,6 +1344,7 @@ class BaseSpirVGenerator:
             raise RuntimeError(f"Unknown GPU type {the_type}")
 
         self._type_hash_to_id[type_hash] = type_id
+        self._type_to_id[the_type] = type_id
         return type_id
 
     def obtain_extended_instruction_set(self, set_name):
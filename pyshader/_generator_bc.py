@@ -3,6 +3,7 @@ Implements generating SpirV code from our bytecode.
 """
 
 import os
+import struct
 import ctypes
 
 from ._generator_base import (
@@ -14,7 +15,9 @@ from ._generator_base import (
 from ._coreutils import ShaderError
 from . import _spirv_constants as cc
 from . import _types
-from .stdlib import tex_functions, ext_functions
+from . import _folding
+from .stdlib import tex_functions, sync_functions, atomic_functions
+from .stdlib import subgroup_functions, ext_functions
 from .opcodes import OpCodeDefinitions
 
 # todo: build in some checks
@@ -40,13 +43,212 @@ image_formats_that_need_no_ext = {
 }
 
 
+# Tables to select the SpirV opcode for binary ops and comparisons. For
+# binary ops, the key is (op, scalar kind, shape), for comparisons it's
+# (op, scalar kind). See get_type_kind().
+BINARY_OPCODES = {}
+COMPARE_OPCODES = {}
+
+for _shape in ("scalar", "vector"):
+    # We specify three flavors of div: One that works for both int and float,
+    # one that works for float only, and one that works for int only.
+    for _op, _opcode in [
+        ("add", cc.OpFAdd),
+        ("sub", cc.OpFSub),
+        ("mul", cc.OpFMul),
+        ("fdiv", cc.OpFDiv),
+        ("div", cc.OpFDiv),
+        ("mod", cc.OpFMod),
+        ("rem", cc.OpFRem),
+    ]:
+        BINARY_OPCODES[(_op, "float", _shape)] = _opcode
+    for _op, _opcode in [
+        ("add", cc.OpIAdd),
+        ("sub", cc.OpISub),
+        ("mul", cc.OpIMul),
+        ("idiv", cc.OpSDiv),
+        ("div", cc.OpSDiv),
+        ("mod", cc.OpSMod),
+        ("rem", cc.OpSRem),
+    ]:
+        BINARY_OPCODES[(_op, "int", _shape)] = _opcode
+    for _op, _opcode in [("and", cc.OpLogicalAnd), ("or", cc.OpLogicalOr)]:
+        BINARY_OPCODES[(_op, "bool", _shape)] = _opcode
+BINARY_OPCODES[("mmul", "float", "vector")] = cc.OpDot
+
+for _op, _suffix in [
+    ("<", "LessThan"),
+    ("<=", "LessThanEqual"),
+    ("==", "Equal"),
+    ("!=", "NotEqual"),
+    (">", "GreaterThan"),
+    (">=", "GreaterThanEqual"),
+]:
+    COMPARE_OPCODES[(_op, "float")] = getattr(cc, "OpFOrd" + _suffix)
+    _prefix = "OpS" if "Than" in _suffix else "OpI"
+    COMPARE_OPCODES[(_op, "int")] = getattr(cc, _prefix + _suffix)
+
+ATOMIC_OPCODES = {
+    "atomic_add": cc.OpAtomicIAdd,
+    "atomic_sub": cc.OpAtomicISub,
+    "atomic_min": cc.OpAtomicSMin,
+    "atomic_max": cc.OpAtomicSMax,
+    "atomic_and": cc.OpAtomicAnd,
+    "atomic_or": cc.OpAtomicOr,
+    "atomic_xor": cc.OpAtomicXor,
+    "atomic_exchange": cc.OpAtomicExchange,
+    "atomic_compare_exchange": cc.OpAtomicCompareExchange,
+}
+
+# Table to select the SpirV opcode and group operation for the subgroup
+# arithmetic functions. The key is (funcname, scalar kind).
+SUBGROUP_OPCODES = {}
+
+for _name, _op, _iopcode, _fopcode in [
+    (
+        "subgroup_add",
+        cc.GroupOperation_Reduce,
+        cc.OpGroupNonUniformIAdd,
+        cc.OpGroupNonUniformFAdd,
+    ),
+    (
+        "subgroup_min",
+        cc.GroupOperation_Reduce,
+        cc.OpGroupNonUniformSMin,
+        cc.OpGroupNonUniformFMin,
+    ),
+    (
+        "subgroup_max",
+        cc.GroupOperation_Reduce,
+        cc.OpGroupNonUniformSMax,
+        cc.OpGroupNonUniformFMax,
+    ),
+    (
+        "subgroup_inclusive_add",
+        cc.GroupOperation_InclusiveScan,
+        cc.OpGroupNonUniformIAdd,
+        cc.OpGroupNonUniformFAdd,
+    ),
+    (
+        "subgroup_exclusive_add",
+        cc.GroupOperation_ExclusiveScan,
+        cc.OpGroupNonUniformIAdd,
+        cc.OpGroupNonUniformFAdd,
+    ),
+]:
+    SUBGROUP_OPCODES[(_name, "int")] = _iopcode, _op
+    SUBGROUP_OPCODES[(_name, "float")] = _fopcode, _op
+
+# The builtin io variables that are part of GroupNonUniform
+SUBGROUP_BUILTINS = {
+    "SubgroupSize",
+    "SubgroupLocalInvocationId",
+    "NumSubgroups",
+    "SubgroupId",
+}
+
+
+_type_kinds = {}
+
+
+def get_type_kind(the_type):
+    """Get a tuple (reftype, scalar kind, shape) for the given type. The
+    reftype is the subtype for vectors and matrices, and the type itself
+    otherwise. The kind is "float", "int", "bool" or None. The shape is
+    "scalar", "vector", "matrix" or None. The result is cached.
+    """
+    try:
+        return _type_kinds[the_type]
+    except KeyError:
+        pass
+    reftype, shape = the_type, None
+    if issubclass(the_type, _types.Scalar):
+        shape = "scalar"
+    elif issubclass(the_type, _types.Vector):
+        reftype, shape = the_type.subtype, "vector"
+    elif issubclass(the_type, _types.Matrix):
+        reftype, shape = the_type.subtype, "matrix"
+    kind = None
+    if issubclass(reftype, _types.Float):
+        kind = "float"
+    elif issubclass(reftype, _types.Int):
+        kind = "int"
+    elif issubclass(reftype, _types.boolean):
+        kind = "bool"
+    _type_kinds[the_type] = reftype, kind, shape
+    return reftype, kind, shape
+
+
+class Branch:
+    """A branch in the structured control flow graph. A branch either
+    jumps to a label (it's a leaf), or it has two children (it diverged
+    at a conditional branch, and the children have not merged yet).
+    """
+
+    __slots__ = [
+        "parent",
+        "depth",
+        "path",
+        "detached",
+        "label",
+        "prev_label",
+        "children",
+        "branch_label_placeholder",
+        "merge_label_placeholder",
+    ]
+
+    def __init__(self, parent, index, label, prev_label=None, placeholder=None):
+        self.parent = parent
+        self.label = label
+        self.prev_label = prev_label
+        self.children = ()
+        self.branch_label_placeholder = placeholder
+        self.merge_label_placeholder = None
+        if parent is None:
+            self.depth, self.path, self.detached = 0, (), False
+        else:
+            # The path (child indices from the root) sorts in depth-first order
+            self.depth = parent.depth + 1
+            self.path = parent.path + (index,)
+            self.detached = parent.detached
+
+    def __repr__(self):
+        return f"<Branch {self.label} at depth {self.depth}>"
+
+    def set_children(self, children):
+        """Set the children. Branches that are no longer children (and
+        their sub-branches) are marked as detached from the tree.
+        """
+        to_detach = [child for child in self.children if child not in children]
+        while to_detach:
+            branch = to_detach.pop(-1)
+            branch.detached = True
+            to_detach.extend(branch.children)
+        self.children = tuple(children)
+
+
 class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
     """A generator that operates on our own well-defined bytecode.
 
     In essence, this class implements BaseSpirVGenerator by implementing
     the opcode methods of OpCodeDefinitions.
+
+    Options:
+
+    * fold_constants: evaluate arithmetic, comparisons and casts on
+      constants at compile time (default False).
+    * promote_locals: turn local scalars and vectors into SSA values,
+      so that they are not loaded from memory (default False).
+    * eliminate_common_subexpressions: re-use the result of identical
+      instructions within a block (default False).
+    * eliminate_dead_code: remove unused declarations and instructions,
+      and compact the ids (default False).
+    * spirv_version: the SpirV version to target, as a tuple (major, minor).
+      Subgroup operations need at least (1, 3), which is the default.
     """
 
+    default_options = {**BaseSpirVGenerator.default_options, "fold_constants": False}
+
     def show_bytecode(self):
         """For debugging purposes."""
         for x in self._bytecode:
@@ -70,6 +272,8 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         self._buffer = {}
         self._sampler = {}
         self._texture = {}
+        self._shared = {}
+        self._specialization = {}  # name -> (ValueId, default value)
         self._slotmap = {}  # (namespaceidentifier, slot) -> name
 
         self._decorated_array_types = set()
@@ -82,17 +286,40 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
         # Labels for control flow
         self._labels = {}
-        self._root_branch = {"depth": 0, "label": "", "children": ()}
+        self._root_branch = Branch(None, 0, "")
         self._current_branch = self._root_branch
+        self._pending_branches = {}  # label -> leaf branches that jump there
+
+        # The values of constants, only used when folding constants
+        self._constant_values = {}  # ValueId -> value
 
         # Parse
+        methods = self._get_method_table()
         for opcode, *args in bytecode:
-            method = getattr(self, opcode.lower(), None)
+            method = methods.get(opcode.lower(), None)
             if method is None:
                 # pprint_bytecode(self._co)
                 raise RuntimeError(self.errinfo() + f"Cannot parse {opcode} yet.")
             else:
-                method(*args)
+                method(self, *args)
+
+    @classmethod
+    def _get_method_table(cls):
+        """Get a dict that maps opcodes to the (unbound) methods that
+        implement them. It is created once for each class.
+        """
+        table = cls.__dict__.get("_method_table", None)
+        if table is None:
+            table = {
+                name: getattr(cls, name) for name in dir(cls) if name.startswith("co_")
+            }
+            cls._method_table = table
+        return table
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats["opcodes"] = len(self._bytecode)
+        return stats
 
     def _get_label_id(self, label_value):
         if label_value not in self._labels:
@@ -197,6 +424,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 self.errinfo() + "Function ends with unresolved sub-branches!"
             )
         # End function or entrypoint
+        self._specialize_workgroup_size()
         self.gen_func_instruction(cc.OpReturn)
         self.gen_func_instruction(cc.OpFunctionEnd)
 
@@ -212,8 +440,8 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
     def co_call(self, funcname, nargs):
 
         assert len(self._stack) >= nargs
-        args = self._stack[-nargs:]
-        self._stack[-nargs:] = []
+        args = self._stack[len(self._stack) - nargs :]
+        self._stack[len(self._stack) - nargs :] = []
 
         assert isinstance(funcname, str)
 
@@ -223,6 +451,12 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             self._stack.append(self._typecast(ty, args))
         elif funcname in tex_functions:
             self._texture_call(funcname, args)
+        elif funcname in sync_functions:
+            self._sync_call(funcname, args)
+        elif funcname in atomic_functions:
+            self._atomic_call(funcname, args)
+        elif funcname in subgroup_functions:
+            self._subgroup_call(funcname, args)
         elif funcname in ext_functions:
             self._ext_instruction_call(funcname, args)
         else:
@@ -252,6 +486,197 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             result = self._convert_scalar(ty, args[0])
         return result
 
+    def _sync_call(self, funcname, args):
+        if args:
+            raise ShaderError(self.errinfo() + f"{funcname}() takes no arguments.")
+        elif funcname != "memory_barrier":
+            if self._execution_model_flag != cc.ExecutionModel_GLCompute:
+                raise ShaderError(
+                    self.errinfo() + f"{funcname}() only works in compute shaders."
+                )
+        # Get the memory scope and the kinds of memory that the barrier applies to
+        if funcname == "workgroup_barrier":
+            scope, memory = cc.Scope_Workgroup, cc.MemorySemanticsMask_WorkgroupMemory
+        else:
+            scope = cc.Scope_Device
+            memory = (
+                cc.MemorySemanticsMask_UniformMemory
+                | cc.MemorySemanticsMask_WorkgroupMemory
+                | cc.MemorySemanticsMask_ImageMemory
+            )
+        scope_id = self.obtain_constant(int(scope))
+        semantics = int(cc.MemorySemanticsMask_AcquireRelease | memory)
+        semantics_id = self.obtain_constant(semantics)
+        if funcname == "memory_barrier":
+            self.gen_func_instruction(cc.OpMemoryBarrier, scope_id, semantics_id)
+        else:
+            # Execution scope, memory scope, memory semantics
+            execution_scope_id = self.obtain_constant(int(cc.Scope_Workgroup))
+            self.gen_func_instruction(
+                cc.OpControlBarrier, execution_scope_id, scope_id, semantics_id
+            )
+        self._stack.append(None)  # this call returns None, gets popped
+
+    def _atomic_call(self, funcname, args):
+        opcode = ATOMIC_OPCODES[funcname]
+        nargs = 3 if opcode == cc.OpAtomicCompareExchange else 2
+        if len(args) != nargs:
+            raise ShaderError(
+                self.errinfo() + f"{funcname}() takes exactly {nargs} arguments."
+            )
+        ref, *values = args
+        # Check the reference. Atomics on memory that is not shared are pointless.
+        if not isinstance(ref, VariableAccessId):
+            is_buffer = is_shared = False
+        else:
+            is_shared = ref.storage_class == cc.StorageClass_Workgroup
+            is_buffer = any(ref.variable is ac.variable for ac in self._buffer.values())
+        if not (is_buffer or is_shared):
+            raise ShaderError(
+                self.errinfo(ref)
+                + f"The first arg of {funcname}() must be in a buffer or shared memory."
+            )
+        elif ref.type is not _types.i32:
+            raise ShaderError(
+                self.errinfo(ref)
+                + f"Atomic operations need an i32 element, not {ref.type.__name__}."
+            )
+        for value in values:
+            if value.type is not ref.type:
+                raise ShaderError(
+                    self.errinfo(ref, value)
+                    + f"Cannot use {funcname}() with a {value.type.__name__} value."
+                )
+        # Get operands. Memory order is left to the barriers (relaxed semantics).
+        scope = cc.Scope_Workgroup if is_shared else cc.Scope_Device
+        scope_id = self.obtain_constant(int(scope))
+        semantics_id = self.obtain_constant(int(cc.MemorySemanticsMask_MaskNone))
+        pointer_id = ref.resolve_chain(self)
+        result_id, type_id = self.obtain_value(ref.type)
+        if opcode == cc.OpAtomicCompareExchange:
+            compare, value = values
+            self.gen_func_instruction(
+                opcode,
+                type_id,
+                result_id,
+                pointer_id,
+                scope_id,
+                semantics_id,  # when equal
+                semantics_id,  # when unequal
+                value,
+                compare,
+            )
+        else:
+            self.gen_func_instruction(
+                opcode,
+                type_id,
+                result_id,
+                pointer_id,
+                scope_id,
+                semantics_id,
+                values[0],
+            )
+        self._stack.append(result_id)
+
+    def _subgroup_call(self, funcname, args):
+        nargs = 2 if funcname in ("subgroup_broadcast", "subgroup_shuffle") else 1
+        if len(args) != nargs:
+            s = "" if nargs == 1 else "s"
+            raise ShaderError(
+                self.errinfo() + f"{funcname}() takes exactly {nargs} argument{s}."
+            )
+        self._require_subgroups(f"{funcname}()")
+        value = args[0]
+        _, kind, shape = get_type_kind(value.type)
+        scope_id = self.obtain_constant(int(cc.Scope_Subgroup))
+
+        if funcname == "subgroup_ballot":
+            if value.type is not _types.boolean:
+                raise ShaderError(
+                    self.errinfo(value)
+                    + f"subgroup_ballot() needs a bool, not {value.type.__name__}."
+                )
+            self._capabilities.add(cc.Capability_GroupNonUniformBallot)
+            # The ballot is an uvec4, but we don't have unsigned types
+            uint_type_id = self.obtain_type_id((cc.OpTypeInt, 32, 0))
+            ballot_type = (cc.OpTypeVector, uint_type_id, 4)
+            ballot_id, ballot_type_id = self.obtain_value(ballot_type)
+            self.gen_func_instruction(
+                cc.OpGroupNonUniformBallot, ballot_type_id, ballot_id, scope_id, value
+            )
+            result_id, type_id = self.obtain_value(_types.ivec4)
+            self.gen_func_instruction(cc.OpBitcast, type_id, result_id, ballot_id)
+        elif funcname in ("subgroup_broadcast", "subgroup_shuffle"):
+            if kind is None or shape not in ("scalar", "vector"):
+                raise ShaderError(
+                    self.errinfo(value)
+                    + f"Cannot use {funcname}() with a {value.type.__name__}."
+                )
+            id = self._get_subgroup_invocation_id(funcname, args[1])
+            if funcname == "subgroup_broadcast":
+                self._capabilities.add(cc.Capability_GroupNonUniformBallot)
+                opcode = cc.OpGroupNonUniformBroadcast
+            else:
+                self._capabilities.add(cc.Capability_GroupNonUniformShuffle)
+                opcode = cc.OpGroupNonUniformShuffle
+            result_id, type_id = self.obtain_value(value.type)
+            self.gen_func_instruction(opcode, type_id, result_id, scope_id, value, id)
+        else:
+            if (funcname, kind) not in SUBGROUP_OPCODES or shape == "matrix":
+                raise ShaderError(
+                    self.errinfo(value)
+                    + f"Cannot use {funcname}() with a {value.type.__name__}."
+                )
+            opcode, group_op = SUBGROUP_OPCODES[(funcname, kind)]
+            self._capabilities.add(cc.Capability_GroupNonUniformArithmetic)
+            result_id, type_id = self.obtain_value(value.type)
+            self.gen_func_instruction(
+                opcode, type_id, result_id, scope_id, group_op, value
+            )
+        self._stack.append(result_id)
+
+    def _get_subgroup_invocation_id(self, funcname, id):
+        """Get the id of an invocation in the subgroup as an unsigned int."""
+        if id.type is not _types.i32:
+            raise ShaderError(
+                self.errinfo(id)
+                + f"The id for {funcname}() must be i32, not {id.type.__name__}."
+            )
+        uint_type_id = self.obtain_type_id((cc.OpTypeInt, 32, 0))
+        # Is it a constant? The id of a broadcast must be. Since the id is a
+        # scalar, its key is (typename, value).
+        for key, constant_id in self._constants.items():
+            if constant_id is id:
+                value = key[1]
+                break
+        else:
+            if funcname == "subgroup_broadcast":
+                raise ShaderError(
+                    self.errinfo(id)
+                    + "The id for subgroup_broadcast() must be a constant."
+                )
+            result_id = ValueId(uint_type_id.type)
+            self.gen_func_instruction(cc.OpBitcast, uint_type_id, result_id, id)
+            return result_id
+        # Get the unsigned constant
+        key = "uint", value
+        if key not in self._constants:
+            name = f"{value}u"
+            result_id = ValueId(uint_type_id.type, name)
+            bb = struct.pack("<I", value & 0xFFFFFFFF)
+            self.gen_instruction("types", cc.OpConstant, uint_type_id, result_id, bb)
+            self.gen_instruction("debug", cc.OpName, result_id.id, name)
+            self._constants[key] = result_id
+        return self._constants[key]
+
+    def _require_subgroups(self, what):
+        """Check that subgroup operations can be used, and declare that we use them."""
+        if self._options["spirv_version"] < (1, 3):
+            raise ShaderError(
+                self.errinfo() + f"{what} needs SpirV version 1.3 or higher."
+            )
+        self._capabilities.add(cc.Capability_GroupNonUniform)
+
     def _texture_call(self, funcname, args):
         if funcname in ("imageLoad", "read"):
             tex, coord = args
@@ -482,6 +907,10 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
     def co_resource(self, name, kind, slot, typename):
 
+        if kind == "specialization":
+            spec_id, default = slot
+            return self._specialization_constant(name, spec_id, default, typename)
+
         bindgroup = 0
         if isinstance(slot, (tuple, list)):
             bindgroup, slot = slot
@@ -512,6 +941,15 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         elif kind == "texture":
             storage_class, iodict = cc.StorageClass_UniformConstant, self._texture
             location_or_binding = cc.Decoration_Binding
+        elif kind == "shared":
+            storage_class, iodict = cc.StorageClass_Workgroup, self._shared
+            location_or_binding = None
+            if self._execution_model_flag != cc.ExecutionModel_GLCompute:
+                raise ShaderError(
+                    self.errinfo() + f"Shared {name} only works in compute shaders."
+                )
+            elif slot is not None:
+                raise ShaderError(self.errinfo() + f"Shared {name} cannot have a slot.")
         else:
             raise ShaderError(self.errinfo() + f"Invalid IO kind {kind}")
 
@@ -523,7 +961,9 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             # Bindings must be unique within a bind group.
             namespace_id = "bindgroup-" + str(bindgroup)
         slotmap_key = (namespace_id, slot)
-        if slotmap_key in self._slotmap:
+        if slot is None:
+            pass  # Shared memory is not bound to a slot
+        elif slotmap_key in self._slotmap:
             other_name = self._slotmap[slotmap_key]
             raise ShaderError(
                 self.errinfo()
@@ -533,9 +973,15 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             self._slotmap[slotmap_key] = name
 
         # Get the root variable
-        if kind in ("input", "output"):
+        if kind in ("input", "output", "shared"):
             var_type = _types.type_from_name(typename)
             subtypes = None
+            # Workgroup memory cannot be a runtime array
+            if kind == "shared" and issubclass(var_type, _types.Array):
+                if not var_type.length:
+                    raise ShaderError(
+                        self.errinfo() + f"Shared {name} must have a fixed length."
+                    )
         elif kind in ("uniform", "buffer"):
             # Block - Consider the variable to be a struct
             var_type = _types.type_from_name(typename)
@@ -686,6 +1132,8 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             # Builtin input or output
             if slot == "FragDepth":
                 self._execution_modes["DepthReplacing"] = []
+            elif slot in SUBGROUP_BUILTINS:
+                self._require_subgroups(f"The {slot} builtin")
             try:
                 slot = cc.builtins[slot]
             except KeyError:
@@ -711,6 +1159,83 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 iodict[subname] = var_access.index(index_id, i)
                 iodict[subname].name = subname.split(".")[-1]
 
+    def _specialization_constant(self, name, spec_id, default, typename):
+        the_type = _types.type_from_name(typename)
+        if the_type is _types.boolean:
+            default = False if default is None else default
+            ok = isinstance(default, bool)
+        elif the_type in (_types.u8, _types.i16, _types.i32, _types.i64):
+            default = 0 if default is None else default
+            ok = isinstance(default, int) and not isinstance(default, bool)
+            ok = ok and the_type._ctype(default).value == default
+        elif the_type in (_types.f32, _types.f64):
+            default = 0.0 if default is None else default
+            ok = isinstance(default, (int, float)) and not isinstance(default, bool)
+            default = float(default) if ok else default
+        else:
+            raise ShaderError(
+                self.errinfo()
+                + f"Specialization constant {name} must be a scalar, not {typename}."
+            )
+        if not ok:
+            raise ShaderError(
+                self.errinfo()
+                + f"Invalid default value for {typename} specialization constant {name}: {default!r}"
+            )
+        # The constant ids must be unique
+        slotmap_key = ("specialization", spec_id)
+        if slotmap_key in self._slotmap:
+            other_name = self._slotmap[slotmap_key]
+            raise ShaderError(
+                self.errinfo()
+                + f"The specialization id {spec_id} for {name} already taken by {other_name}."
+            )
+        self._slotmap[slotmap_key] = name
+        if name in self._specialization:
+            raise ShaderError(self.errinfo() + f"specialization {name} already exists")
+        id = self.obtain_spec_constant(default, the_type, spec_id, name.split(".")[-1])
+        self._specialization[name] = id, default
+
+    def _specialize_workgroup_size(self):
+        """If the workgroup size refers to specialization constants, declare
+        it as a constant with the WorkgroupSize builtin, which overrides the
+        LocalSize. The LocalSize is set to the default values.
+        """
+        local_size = self._execution_modes.get("LocalSize", ())
+        if all(isinstance(n, int) for n in local_size):
+            return
+        ids, defaults = [], []
+        for n in local_size:
+            if isinstance(n, int):
+                ids.append(self.obtain_constant(n))
+                defaults.append(n)
+                continue
+            try:
+                id, default = self._specialization["specialization." + n]
+            except KeyError:
+                raise ShaderError(
+                    f"The workgroup_size refers to {n}, which is not a specialization constant."
+                )
+            if id.type is not _types.i32 or default < 1:
+                raise ShaderError(
+                    f"The specialization constant {n} for the workgroup_size "
+                    + "must be an i32 with a default value of at least 1."
+                )
+            ids.append(id)
+            defaults.append(default)
+        self._execution_modes["LocalSize"] = defaults
+        result_id, type_id = self.obtain_value(_types.ivec3, "workgroup_size")
+        self.gen_instruction(
+            "types", cc.OpSpecConstantComposite, type_id, result_id, *ids
+        )
+        self.gen_instruction(
+            "annotations",
+            cc.OpDecorate,
+            result_id,
+            cc.Decoration_BuiltIn,
+            cc.BuiltIn_WorkgroupSize,
+        )
+
     def _annotate_uniform_subtype(self, type_id, subtype, i, offset):
         """Annotates the given uniform struct subtype and return its size in bytes."""
         a = "annotations"
@@ -814,6 +1339,11 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         elif name in self._texture:
             ob = self._texture[name]
             assert isinstance(ob, VariableAccessId)
+        elif name in self._shared:
+            ob = self._shared[name]
+            assert isinstance(ob, VariableAccessId)
+        elif name in self._specialization:
+            ob = self._specialization[name][0]
         else:
             raise ShaderError(self.errinfo() + f"Using invalid variable: {name}")
         self._stack.append(ob)
@@ -826,10 +1356,17 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         elif name in self._buffer:
             ac = self._buffer[name]
             ac.resolve_store(self, ob)
+        elif name in self._shared:
+            ac = self._shared[name]
+            ac.resolve_store(self, ob)
         elif name in self._input:
             raise ShaderError(self.errinfo(ob) + "Cannot store to input")
         elif name in self._uniform:
             raise ShaderError(self.errinfo(ob) + "Cannot store to uniform")
+        elif name in self._specialization:
+            raise ShaderError(
+                self.errinfo(ob) + "Cannot store to specialization constant"
+            )
         elif isinstance(ob, VariableAccessId) and issubclass(
             ob.type, (_types.Array, _types.Struct)
         ):
@@ -947,6 +1484,8 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
     def co_load_constant(self, value):
         id = self.obtain_constant(value)
+        if self._options["fold_constants"]:
+            self._constant_values[id] = _folding.normalize(id.type, value)
         self._stack.append(id)
         # Also see OpConstantNull OpConstantSampler OpConstantComposite
 
@@ -964,6 +1503,15 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
         val1 = self._stack.pop()
 
+        # Evaluate at compile time if we can
+        if val1 in self._constant_values:
+            value1 = self._constant_values[val1]
+            result_id = self._obtain_folded_constant(
+                _folding.fold_unary_op(op, val1.type, value1)
+            )
+            if result_id is not None:
+                return self._stack.append(result_id)
+
         # Get reference types
         type1 = val1.type
         reftype1 = type1
@@ -999,42 +1547,23 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         val2 = self._stack.pop()
         val1 = self._stack.pop()
 
+        # Evaluate at compile time if we can
+        if val1 in self._constant_values and val2 in self._constant_values:
+            value1, value2 = self._constant_values[val1], self._constant_values[val2]
+            result_id = self._obtain_folded_constant(
+                _folding.fold_binary_op(op, val1.type, value1, val2.type, value2)
+            )
+            if result_id is not None:
+                return self._stack.append(result_id)
+
         # The ids that will be in the instruction, can be reset
         id1, id2 = val1, val2
 
-        # Predefine some types
-        # We specify three flavors of div: One that works for both int and float,
-        # one that works for float only, and one that works for int only.
-        scalar_or_vector = _types.Scalar, _types.Vector
-        FOPS = dict(
-            add=cc.OpFAdd,
-            sub=cc.OpFSub,
-            mul=cc.OpFMul,
-            fdiv=cc.OpFDiv,
-            div=cc.OpFDiv,
-            mod=cc.OpFMod,
-            rem=cc.OpFRem,
-        )
-        IOPS = dict(
-            add=cc.OpIAdd,
-            sub=cc.OpISub,
-            mul=cc.OpIMul,
-            idiv=cc.OpSDiv,
-            div=cc.OpSDiv,
-            mod=cc.OpSMod,
-            rem=cc.OpSRem,
-        )
-        LOPS = {"and": cc.OpLogicalAnd, "or": cc.OpLogicalOr}
-
         # Get reference types
         type1 = val1.type
-        reftype1 = type1
-        if issubclass(type1, (_types.Vector, _types.Matrix)):
-            reftype1 = type1.subtype
+        reftype1, kind1, shape1 = get_type_kind(type1)
         type2 = val2.type
-        reftype2 = type2
-        if issubclass(type2, (_types.Vector, _types.Matrix)):
-            reftype2 = type2.subtype
+        reftype2, kind2, shape2 = get_type_kind(type2)
 
         tn1 = type1.__name__
         tn2 = type2.__name__
@@ -1046,46 +1575,25 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 + f"Cannot {op.upper()} two values with different (sub)types: {tn1} and {tn2}"
             )
 
-        elif type1 is type2 and issubclass(type1, scalar_or_vector):
+        elif type1 is type2 and shape1 in ("scalar", "vector"):
             # Types are equal and scalar or vector. Covers a lot of cases.
-            result_id, type_id = self.obtain_value(type1)
-            if (
-                issubclass(type1, _types.Vector)
-                and issubclass(reftype1, _types.Float)
-                and op == "mmul"
-            ):
-                opcode = cc.OpDot  # special case
-                result_id, type_id = self.obtain_value(type1.subtype)
-            elif issubclass(reftype1, _types.Float):
-                try:
-                    opcode = FOPS[op]
-                except KeyError:  # pragma: no cover
+            opcode = BINARY_OPCODES.get((op, kind1, shape1), None)
+            if opcode is None:
+                if kind1 is None:
                     raise ShaderError(
-                        self.errinfo(val1, val2) + f"Cannot {op.upper()} float values."
+                        self.errinfo(val1, val2)
+                        + f"Cannot {op.upper()} values of type {tn1}."
                     )
-            elif issubclass(reftype1, _types.Int):
-                try:
-                    opcode = IOPS[op]
-                except KeyError:  # pragma: no cover
-                    raise ShaderError(
-                        self.errinfo(val1, val2) + f"Cannot {op.upper()} int values."
-                    )
-            elif issubclass(reftype1, _types.boolean):
-                try:
-                    opcode = LOPS[op]
-                except KeyError:  # pragma: no cover
-                    raise ShaderError(
-                        self.errinfo(val1, val2) + f"Cannot {op.upper()} bool values."
-                    )
-            else:
                 raise ShaderError(
-                    self.errinfo(val1, val2)
-                    + f"Cannot {op.upper()} values of type {tn1}."
+                    self.errinfo(val1, val2) + f"Cannot {op.upper()} {kind1} values."
                 )
+            result_id, type_id = self.obtain_value(type1)
+            if opcode == cc.OpDot:
+                result_id, type_id = self.obtain_value(type1.subtype)  # special case
 
-        elif issubclass(type1, _types.Scalar) and issubclass(type2, _types.Vector):
+        elif shape1 == "scalar" and shape2 == "vector":
             # Convenience - add/mul vectors with scalars
-            if not issubclass(reftype1, _types.Float):
+            if kind1 != "float":
                 raise ShaderError(
                     self.errinfo(val1, val2)
                     + f"Scalar {op.upper()} Vector only supported for float subtype."
@@ -1095,13 +1603,13 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 opcode = cc.OpVectorTimesScalar
                 id1, id2 = val2, val1  # swap to put vector first
             else:
-                opcode = FOPS[op]
+                opcode = BINARY_OPCODES[(op, kind1, "vector")]
                 val3 = self._vector_packing(type2, [val1] * type2.length)
                 id1, id2 = val1, val3
 
-        elif issubclass(type1, _types.Vector) and issubclass(type2, _types.Scalar):
+        elif shape1 == "vector" and shape2 == "scalar":
             # Convenience - add/mul vectors with scalars, opposite order
-            if not issubclass(reftype1, _types.Float):
+            if kind1 != "float":
                 raise ShaderError(
                     self.errinfo(val1, val2)
                     + f"Vector {op.upper()} Scalar only supported for float subtype."
@@ -1111,7 +1619,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 opcode = cc.OpVectorTimesScalar
                 id1, id2 = val1, val2
             else:
-                opcode = FOPS[op]
+                opcode = BINARY_OPCODES[(op, kind1, "vector")]
                 val3 = self._vector_packing(type1, [val2] * type1.length)
                 id1, id2 = val1, val3
 
@@ -1122,7 +1630,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 + f"Cannot {op.upper()} {tn1} and {tn2}, multiply only."
             )
 
-        elif not issubclass(reftype1, _types.Float):
+        elif kind1 != "float":
             # The remaining cases are all limited to float types
             raise ShaderError(
                 self.errinfo(val1, val2)
@@ -1131,7 +1639,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
         # With that out of the way, the remaining cases are quite short to write.
 
-        elif issubclass(type1, _types.Matrix) and issubclass(type2, _types.Matrix):
+        elif shape1 == "matrix" and shape2 == "matrix":
             # Multiply two matrices
             if type1.cols != type2.rows:
                 raise ShaderError(
@@ -1142,19 +1650,19 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             result_id, type_id = self.obtain_value(type3)
             opcode = cc.OpMatrixTimesMatrix
 
-        elif issubclass(type1, _types.Matrix) and issubclass(type2, _types.Scalar):
+        elif shape1 == "matrix" and shape2 == "scalar":
             # Matrix times vector
             result_id, type_id = self.obtain_value(type1)  # Result is a matrix
             opcode = cc.OpMatrixTimesScalar
             id1, id2 = val1, val2
 
-        elif issubclass(type1, _types.Matrix) and issubclass(type2, _types.Scalar):
+        elif shape1 == "matrix" and shape2 == "scalar":
             # Matrix times vector, opposite order
             result_id, type_id = self.obtain_value(type2)  # Result is a matrix
             opcode = cc.OpMatrixTimesScalar
             id1, id2 = val2, val1  # reverse
 
-        elif issubclass(type1, _types.Matrix) and issubclass(type2, _types.Vector):
+        elif shape1 == "matrix" and shape2 == "vector":
             # Matrix times Vector
             if type2.length != type1.cols:
                 raise ShaderError(
@@ -1164,7 +1672,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             result_id, type_id = self.obtain_value(type3)
             opcode = cc.OpMatrixTimesVector
 
-        elif issubclass(type1, _types.Vector) and issubclass(type2, _types.Matrix):
+        elif shape1 == "vector" and shape2 == "matrix":
             # Vector times Matrix
             if type1.length != type2.rows:
                 raise ShaderError(
@@ -1193,30 +1701,24 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 self.errinfo(val1, val2)
                 + "Cannot compare values that do not have the same type."
             )
-        if issubclass(val1.type, _types.Vector):
-            reftype = val1.type.subtype
+
+        # Evaluate at compile time if we can
+        if val1 in self._constant_values and val2 in self._constant_values:
+            value1, value2 = self._constant_values[val1], self._constant_values[val2]
+            result_id = self._obtain_folded_constant(
+                _folding.fold_compare(cmp, val1.type, value1, value2)
+            )
+            if result_id is not None:
+                return self._stack.append(result_id)
+        _, kind, shape = get_type_kind(val1.type)
+        if shape == "vector":
             result_type = _types.Vector(val1.type.length, _types.boolean)
         else:
-            reftype = val1.type
             result_type = _types.boolean
 
-        # Get what kind of comparison to do
-        opname_suffix_map = {
-            "<": "LessThan",
-            "<=": "LessThanEqual",
-            "==": "Equal",
-            "!=": "NotEqual",
-            ">": "GreaterThan",
-            ">=": "GreaterThanEqual",
-        }
-        opname_suffix = opname_suffix_map[cmp]
-
         # Get the actual opcode
-        if issubclass(reftype, _types.Float):
-            opcode = getattr(cc, "OpFOrd" + opname_suffix)
-        elif issubclass(reftype, _types.Int):
-            prefix = "OpS" if "Than" in opname_suffix else "OpI"
-            opcode = getattr(cc, prefix + opname_suffix)
+        if kind in ("float", "int"):
+            opcode = COMPARE_OPCODES[(cmp, kind)]
         else:
             raise ShaderError(
                 self.errinfo(val1, val2)
@@ -1231,7 +1733,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
     # %% Control flow
 
     def _before_moving_out_of_a_block(self):
-        label = self._current_branch["label"]
+        label = self._current_branch.label
         self._store_stack_for_phi_op(label)
 
     def _store_stack_for_phi_op(self, label):
@@ -1277,6 +1779,12 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             self.gen_func_instruction(*phi_op)
             self._stack.append(result_id)
 
+    def _set_branch_label(self, branch, label):
+        # Let the (running) branch jump to the given label
+        branch.prev_label = branch.label
+        branch.label = label
+        self._pending_branches.setdefault(label, []).append(branch)
+
     def co_label(self, label):
         # We enter a new block. This is where we resolve branch pairs that both
         # jumped to this block. If there are multiple such pairs, we need to
@@ -1304,31 +1812,22 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         if loop_info.get("merge_label") == new_label:
             self._loop_stack.pop(-1)
 
-        # Create a mapping to obtain parents of items in the CFG.
-        # We don't use a 'parent' attribute on the items, because that makes
-        # these dicts really hard to read during debugging.
-        parents = {}
-
-        # First we collect the leaf branches that have jumped to this block
-        def _collect_leaf_branches(branch):
-            if branch["children"]:
-                c1, c2 = branch["children"]
-                parents[id(c1)] = parents[id(c2)] = branch
-                return _collect_leaf_branches(c1) + _collect_leaf_branches(c2)
-            elif branch["label"] == new_label:
-                return [branch]
-            else:
-                return []
-
-        leaf_branches = _collect_leaf_branches(self._root_branch)
+        # First we collect the leaf branches that have jumped to this block.
+        # Some may have been cut off from the tree when a loop was merged.
+        leaf_branches = [
+            branch
+            for branch in self._pending_branches.pop(new_label, [])
+            if branch.label == new_label and not branch.children and not branch.detached
+        ]
+        leaf_branches.sort(key=lambda b: b.path)
 
         # Then we merge branches, one by one, deeper ones first
         def _select_branch_to_merge():
             for branch in leaf_branches:
-                if branch["depth"] > 0:
-                    parent = parents[id(branch)]
-                    siblings = parent["children"]
-                    if siblings[0]["label"] == siblings[1]["label"]:
+                if branch.depth > 0:
+                    parent = branch.parent
+                    siblings = parent.children
+                    if siblings[0].label == siblings[1].label:
                         # Merging what started at co_branch_conditional
                         return parent
                     elif parent is loop_info.get("branch", None):
@@ -1336,28 +1835,28 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                         # Note that one child branch is pointing to the continue label, not to here.
                         # Don't AND this sub-if, the above elif excludes cases for the next elif.
                         if loop_info.get("merge_label") == new_label:
-                            parent["children"] = tuple(
-                                c for c in siblings if c in leaf_branches
+                            parent.set_children(
+                                [c for c in siblings if c in leaf_branches]
                             )
                             return parent
-                    elif branch["label"] == new_label:
+                    elif branch.label == new_label:
                         # This could be a break
                         sibling_branch = siblings[int(branch is siblings[0])]
-                        if sibling_branch["label"] == loop_info.get("merge_label"):
-                            parent["children"] = tuple(
-                                c for c in siblings if c in leaf_branches
+                        if sibling_branch.label == loop_info.get("merge_label"):
+                            parent.set_children(
+                                [c for c in siblings if c in leaf_branches]
                             )
                             return parent
 
         branches2merge = []
         while True:
-            leaf_branches.sort(key=lambda b: -b["depth"])
+            leaf_branches.sort(key=lambda b: -b.depth)
             new_leaf = _select_branch_to_merge()
             if not new_leaf:
                 break
-            new_leaf["label"] = new_leaf["children"][0]["label"]
-            # new_leaf["children"] = () -> do further down, we need that info
-            for child in new_leaf["children"]:
+            new_leaf.label = new_leaf.children[0].label
+            # new_leaf.children = () -> do further down, we need that info
+            for child in new_leaf.children:
                 if child in leaf_branches:
                     leaf_branches.remove(child)
             leaf_branches.append(new_leaf)
@@ -1367,7 +1866,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         if len(leaf_branches) != 1:
             raise ShaderError(
                 self.errinfo()
-                + f"New block ({new_label}) should start with 1 unmerged branches, got {[b['label'] for b in leaf_branches]}"
+                + f"New block ({new_label}) should start with 1 unmerged branches, got {[b.label for b in leaf_branches]}"
             )
         self._current_branch = leaf_branches[0]
 
@@ -1389,21 +1888,21 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
             label_id = self._get_label_id(hop_label)
             self.gen_func_instruction(cc.OpLabel, label_id)
             # Update placeholders
-            for child in branch["children"]:
-                child["branch_label_placeholder"].value = label_id.id
-            branch["merge_label_placeholder"].value = label_id.id
+            for child in branch.children:
+                child.branch_label_placeholder.value = label_id.id
+            branch.merge_label_placeholder.value = label_id.id
             # We may need to insert a Phi op
-            if len(branch["children"]) == 2:
+            if len(branch.children) == 2:
                 self._collect_stack_from_previous_blocks(
-                    *[b["prev_label"] for b in branch["children"]]
+                    *[b.prev_label for b in branch.children]
                 )
             # Do we need to hop to the next block?
             if hop_label is not new_label:
                 branch_label_placeholder = WordPlaceholder(
                     self._get_label_id(hop_labels[i + 1]).id
                 )
-                branch["branch_label_placeholder"] = branch_label_placeholder
-                branch["prev_label"] = hop_label
+                branch.branch_label_placeholder = branch_label_placeholder
+                branch.prev_label = hop_label
                 self.gen_func_instruction(cc.OpBranch, branch_label_placeholder)
             if i < len(branches2merge) - 1:
                 self._store_stack_for_phi_op(hop_label)
@@ -1414,11 +1913,11 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
         # Collect stack from previous block
         if not branches2merge:
-            self._collect_stack_from_previous_block(self._current_branch["prev_label"])
+            self._collect_stack_from_previous_block(self._current_branch.prev_label)
 
         # Clean up
         for branch in branches2merge:
-            branch["children"] = ()
+            branch.set_children(())
 
     def co_branch(self, label):
         # Before we leave this block ...
@@ -1428,10 +1927,9 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         branch_label = self._get_label_id(label)
         branch_label_placeholder = WordPlaceholder(branch_label.id)
         # Update the label for the currently running branch
-        self._current_branch["prev_label"] = self._current_branch["label"]
-        self._current_branch["label"] = label
+        self._set_branch_label(self._current_branch, label)
         # Also update the label placeholder for the last jump
-        self._current_branch["branch_label_placeholder"] = branch_label_placeholder
+        self._current_branch.branch_label_placeholder = branch_label_placeholder
         # Mark the end of the block (will be set again at co_label)
         self._current_branch = None
         # Generate instruction, but not if the last instruction already marked
@@ -1441,7 +1939,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
     def co_branch_conditional(self, true_label, false_label):
         condition = self._stack.pop()
-        current_label = self._current_branch["label"]
+        current_label = self._current_branch.label
         # Before we leave this block ...
         self._before_moving_out_of_a_block()
         # Setup tracing for the two new branches. SpirV wants to know
@@ -1450,25 +1948,16 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         # point in co_label.
         branch1_label = WordPlaceholder(self._get_label_id(true_label).id)
         branch2_label = WordPlaceholder(self._get_label_id(false_label).id)
-        new_branch1 = {
-            "depth": self._current_branch["depth"] + 1,
-            "children": (),
-            "label": true_label,
-            "prev_label": current_label,
-            "branch_label_placeholder": branch1_label,
-        }
-        new_branch2 = {
-            "depth": self._current_branch["depth"] + 1,
-            "children": (),
-            "label": false_label,
-            "prev_label": current_label,
-            "branch_label_placeholder": branch2_label,
-        }
-        self._current_branch["children"] = new_branch1, new_branch2
+        parent = self._current_branch
+        new_branch1 = Branch(parent, 0, true_label, current_label, branch1_label)
+        new_branch2 = Branch(parent, 1, false_label, current_label, branch2_label)
+        parent.set_children([new_branch1, new_branch2])
+        self._pending_branches.setdefault(true_label, []).append(new_branch1)
+        self._pending_branches.setdefault(false_label, []).append(new_branch2)
         # Introduce OpSelectionMerge, unless we've already emitted OpLoopMerge
         if self._loop_stack[-1].get("branch") is not self._current_branch:
             merge_label = WordPlaceholder(0)
-            self._current_branch["merge_label_placeholder"] = merge_label
+            self._current_branch.merge_label_placeholder = merge_label
             self.gen_func_instruction(cc.OpSelectionMerge, merge_label, 0)
         # Generate the branch instruction
         self.gen_func_instruction(
@@ -1488,7 +1977,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         # Generate loop merge instruction
         # note: here we can specify request for unroll, min/max iters (1.4+) etc.
         merge_placeholder = WordPlaceholder(merge_id.id)
-        self._current_branch["merge_label_placeholder"] = merge_placeholder
+        self._current_branch.merge_label_placeholder = merge_placeholder
         self.gen_func_instruction(cc.OpLoopMerge, merge_placeholder, continue_id, 0)
         # Mark the current branch as a loop, ending at merge_label
         loop_info = {
@@ -1502,10 +1991,9 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         # The rest is similar to co_branch()
         branch_label_placeholder = WordPlaceholder(iter_id.id)
         # Update the label for the currently running branch
-        self._current_branch["prev_label"] = self._current_branch["label"]
-        self._current_branch["label"] = iter_label
+        self._set_branch_label(self._current_branch, iter_label)
         # Also update the label placeholder for the last jump
-        self._current_branch["branch_label_placeholder"] = branch_label_placeholder
+        self._current_branch.branch_label_placeholder = branch_label_placeholder
         # Mark the end of the block (will be set again at co_label)
         self._current_branch = None
         self.gen_func_instruction(cc.OpBranch, iter_id)
@@ -1527,6 +2015,22 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
 
     # %% Helper methods
 
+    def _obtain_folded_constant(self, folded):
+        """Get the id for the constant that results from constant folding.
+        The given folded value is a (type, value) tuple or None. Returns None
+        if there is nothing to fold.
+        """
+        if folded is None:
+            return None
+        the_type, value = folded
+        if issubclass(the_type, _types.Vector):
+            args = [self.obtain_constant(x, the_type.subtype) for x in value]
+            result_id = self._vector_packing(the_type, args)
+        else:
+            result_id = self.obtain_constant(value, the_type)
+        self._constant_values[result_id] = value
+        return result_id
+
     def _convert_scalar(self, out_type, arg):
         return self._convert_scalar_or_vector(out_type, out_type, arg, arg.type)
 
@@ -1553,6 +2057,15 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         if arg.type is out_type:
             return arg
 
+        # Evaluate at compile time if we can
+        if arg in self._constant_values:
+            value = self._constant_values[arg]
+            result_id = self._obtain_folded_constant(
+                _folding.fold_convert(out_type, out_el_type, arg_el_type, value)
+            )
+            if result_id is not None:
+                return result_id
+
         # Otherwise we need a new value
         result_id, type_id = self.obtain_value(out_type)
 
@@ -1637,7 +2150,7 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                 comp_id = arg
                 if arg.type is not t:
                     comp_id = self._convert_scalar(t, arg)
-                    can_be_constant = False
+                    can_be_constant &= comp_id in self._constant_values
                 composite_ids.append(comp_id)
                 composite_length += 1
             elif issubclass(arg.type, _types.Vector):
@@ -1647,13 +2160,18 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                     composite_length += arg.type.length
                 else:
                     # Otherwise do the long approach
-                    can_be_constant = False  # because of func instruction
                     for i in range(arg.type.length):
-                        comp_id, comp_type_id = self.obtain_value(arg.type.subtype)
-                        self.gen_func_instruction(
-                            cc.OpCompositeExtract, comp_type_id, comp_id, arg, i
-                        )
+                        if arg in self._constant_values:
+                            comp_id = self._obtain_folded_constant(
+                                (arg.type.subtype, self._constant_values[arg][i])
+                            )
+                        else:
+                            comp_id, comp_type_id = self.obtain_value(arg.type.subtype)
+                            self.gen_func_instruction(
+                                cc.OpCompositeExtract, comp_type_id, comp_id, arg, i
+                            )
                         comp_id = self._convert_scalar(t, comp_id)
+                        can_be_constant &= comp_id in self._constant_values
                         composite_ids.append(comp_id)
                         composite_length += 1
             else:
@@ -1673,9 +2191,11 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
         ), "When constructing a vector, there must be at least two Constituent operands."
 
         # Construct
-        if can_be_constant and all(arg in self._constants.values() for arg in args):
+        if can_be_constant and all(
+            arg in self._constants.values() for arg in composite_ids
+        ):
             # Construct or re-use constant
-            key = (vector_type.__name__,) + tuple(f"%{arg.id}" for arg in args)
+            key = (vector_type.__name__,) + tuple(f"%{arg.id}" for arg in composite_ids)
             if key not in self._constants:
                 result_id, vector_type_id = self.obtain_value(vector_type)
                 self.gen_instruction(
@@ -1686,7 +2206,16 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                     *composite_ids,
                 )
                 self._constants[key] = result_id
-            return self._constants[key]
+            else:
+                self._constant_cache_hits += 1
+            result_id = self._constants[key]
+            if all(arg in self._constant_values for arg in composite_ids):
+                value = ()
+                for arg in composite_ids:
+                    arg_value = self._constant_values[arg]
+                    value += arg_value if isinstance(arg_value, tuple) else (arg_value,)
+                self._constant_values[result_id] = value
+            return result_id
         else:
             # Construct in function
             result_id, vector_type_id = self.obtain_value(vector_type)
@@ -1718,6 +2247,8 @@ class Bytecode2SpirVGenerator(OpCodeDefinitions, BaseSpirVGenerator):
                     "types", cc.OpConstantComposite, type_id, var_id, *composite_ids
                 )
                 self._constants[key] = var_id
+            else:
+                self._constant_cache_hits += 1
             var_id = self._constants[key]
         else:
             # Construct the array *now*
@@ -1,16 +1,50 @@
-from ._generator_bc import Bytecode2SpirVGenerator
+from . import _stats
+
+
+# The default values of the options of the SpirV generator (see the
+# default_options of Bytecode2SpirVGenerator). Defined here so that the
+# caches can be used without importing the compiler.
+DEFAULT_OPTIONS = {
+    "fold_constants": False,
+    "promote_locals": False,
+    "eliminate_common_subexpressions": False,
+    "eliminate_dead_code": False,
+    "spirv_version": (1, 3),
+}
+
+
+def normalize_options(options):
+    """Get the given generator options without the ones that have their
+    default value, so that equivalent sets of options map to the same
+    cache entries.
+    """
+    return {
+        key: val
+        for key, val in options.items()
+        if key not in DEFAULT_OPTIONS or val != DEFAULT_OPTIONS[key]
+    }
 
 
 class ShaderModule:
     """Representation of a shader module. It is basically a wrapper
     around the source input and the bytes representing the actual SpirV
     code.
+
+    The bytecode can also be given as a callable that produces the
+    bytecode. It is then called when the bytecode is first needed.
     """
 
     def __init__(self, input, bytecode, description):
         self._input = input
         self._bytecode = bytecode
         self._description = description
+        self._spirv_cache = {}  # options key -> (bytes, metadata)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._disk_cache_key = None  # set when the disk cache is used
+        self._archive = None  # (archive, name) for archive-backed modules
+        self._use_disk_cache = True  # False after invalidate()
+        self._compile_stats = {}
 
     def __repr__(self):
         return f"<ShaderModule {self._description} at 0x{hex(id(self))}>"
@@ -25,16 +59,135 @@ class ShaderModule:
         """The input used to produce this SpirV module."""
         return self._input
 
+    @property
+    def workgroup_size(self):
+        """The workgroup size of a compute shader, as a tuple (x, y, z).
+        Use it to calculate the number of workgroups to dispatch. None
+        for other types of shaders.
+        """
+        # Check the shader type first, to not compile other shaders
+        if self._bytecode is not None:
+            for opcode, *args in self.to_bytecode():
+                if opcode == "co_entrypoint" and args[1] != "compute":
+                    return None
+        if self._spirv_cache:
+            metadata = next(iter(self._spirv_cache.values()))[1]
+        else:
+            metadata = self.get_spirv_metadata()
+        local_size = metadata["execution_modes"].get("LocalSize", None)
+        return None if local_size is None else tuple(local_size)
+
+    @property
+    def compile_stats(self):
+        """A dict with statistics of the most recent compilation of this
+        shader: the time spent in each phase (in seconds), and counts of
+        e.g. opcodes and SpirV instructions. Empty unless compile stats are
+        enabled (see ``pyshader.enable_compile_stats()``).
+        """
+        return self._compile_stats
+
     def to_bytecode(self):
         """Get the bytecode representing this shader module.
         Note that the bytecode is not yet part of the public API; it can change.
         """
+        if callable(self._bytecode):
+            self._bytecode = self._bytecode()
         return self._bytecode
 
-    def to_spirv(self):
-        """Get the binary representation of the SpirV module (bytes)."""
-        gen = Bytecode2SpirVGenerator()
-        # self.gen = gen  # uncomment this line for debugging purposes
+    def to_spirv(self, **options):
+        """Get the binary representation of the SpirV module (bytes).
+        The keyword arguments are passed as options to the SpirV generator.
+        The result is cached per set of options.
+        """
+        return self._get_spirv(options)[0]
+
+    def get_spirv_metadata(self, **options):
+        """Get a dict with info that the SpirV generator derived while
+        producing the SpirV module for the given options (e.g. the id
+        bound, capabilities and execution modes).
+        """
+        return self._get_spirv(options)[1]
+
+    def cache_info(self):
+        """Get a dict with the number of hits and misses of the SpirV
+        cache, and the number of cached results.
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._spirv_cache),
+        }
+
+    def invalidate(self):
+        """Clear the cached SpirV, so that it is re-generated on next use.
+        From then on, the SpirV is not loaded from the disk cache (but the
+        disk cache is updated with the re-generated SpirV). Modules from an
+        archive cannot re-generate, and keep using the archive.
+        """
+        self._spirv_cache.clear()
+        self._use_disk_cache = False
+
+    def _get_spirv(self, options):
+        options = normalize_options(options)
+        key = tuple(sorted(options.items()))
+        result = self._lookup_spirv(key, options)
+        if result is None:
+            collect_stats = _stats.is_enabled()
+            result, stats = generate_spirv(self.to_bytecode(), options, collect_stats)
+            self._store_spirv(key, options, result)
+            if collect_stats:
+                self._record_stats(stats)
+        return result
+
+    def _lookup_spirv(self, key, options):
+        """Get the (spirv, metadata) tuple from the memory or disk cache,
+        or None if it must be generated.
+        """
+        try:
+            result = self._spirv_cache[key]
+        except KeyError:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+            return result
+
+        result = None
+        if self._archive is not None:
+            archive, name = self._archive
+            result = archive.lookup(name, options)
+        if result is None and self._use_disk_cache:
+            self.to_bytecode()  # may trigger lazy conversion, and set the disk key
+            if self._disk_cache_key:
+                from . import _cache
+
+                result = _cache.load_spirv(self._disk_cache_key, options)
+        if result is not None:
+            self._spirv_cache[key] = result
+        return result
+
+    def _store_spirv(self, key, options, result):
+        self._spirv_cache[key] = result
+        if self._disk_cache_key:
+            from . import _cache
+
+            _cache.store_spirv(self._disk_cache_key, options, *result)
+
+    def _record_stats(self, stats):
+        self._compile_stats = _stats.merge_stats(self._compile_stats, stats)
+        _stats.call_hook(self, self._compile_stats)
+
+
+def generate_spirv(bytecode, options, collect_stats=False):
+    """Convert the given bytecode to a (spirv, metadata) tuple. Returns
+    that tuple and a dict with compile stats (or None if collect_stats
+    is False). This is a module-level function so that it can be run in
+    a worker process.
+    """
+    from ._generator_bc import Bytecode2SpirVGenerator  # only import when needed
 
-        gen.convert(self._bytecode)
-        return gen.dump()  # bytes
+    if bytecode is None:
+        raise RuntimeError("Cannot generate SpirV: the bytecode is not available.")
+    gen = Bytecode2SpirVGenerator(**options)
+    gen.convert(bytecode)
+    result = gen.dump(), gen.get_metadata()
+    return result, (gen.get_stats() if collect_stats else None)
@@ -0,0 +1,42 @@
+"""
+Load shaders that were compiled ahead of time with
+``python -m pyshader build``. This does not use the compiler.
+"""
+
+import os
+import json
+
+from ._module import ShaderModule
+from .opcodes import str2bc
+
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def load_shaders(dirname):
+    """Load the shaders that were compiled with ``python -m pyshader build``
+    from the given directory. Returns a dict that maps names of the form
+    "module:qualname" to ShaderModule objects. The SpirV (with default
+    options) is available without compiling, and the bytecode is loaded
+    on first use.
+    """
+    with open(os.path.join(dirname, MANIFEST_FILENAME), "rb") as f:
+        manifest = json.loads(f.read().decode())
+
+    modules = {}
+    for name, info in manifest["shaders"].items():
+        with open(os.path.join(dirname, info["spirv"]), "rb") as f:
+            spirv = f.read()
+        bytecode_filename = os.path.join(dirname, info["bytecode"])
+        m = ShaderModule(name, _bytecode_loader(bytecode_filename), info["description"])
+        m._spirv_cache[()] = spirv, info["metadata"]
+        modules[name] = m
+    return modules
+
+
+def _bytecode_loader(filename):
+    def load_bytecode():
+        with open(filename, "rb") as f:
+            return str2bc(f.read().decode())
+
+    return load_bytecode
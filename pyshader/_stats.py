@@ -0,0 +1,51 @@
+"""
+Opt-in statistics about the compilation of shaders: the wall time spent
+in each compile phase, and counts of e.g. opcodes, SpirV instructions and
+ids. Collecting stats is enabled with ``enable_compile_stats()``, with the
+PYSHADER_COMPILE_STATS environment variable, or by setting a hook with
+``set_compile_stats_hook()``. The stats of a shader are available as
+``ShaderModule.compile_stats``.
+"""
+
+import os
+
+
+_enabled = False
+_hook = None
+
+
+def enable_compile_stats(enabled=True):
+    """Enable (or disable) the collection of compile stats."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def set_compile_stats_hook(callback):
+    """Set a function that is called with (module, stats) each time that
+    a compile step (Python to bytecode, or bytecode to SpirV) of a shader
+    has finished. The stats is the module's ``compile_stats`` dict. Setting
+    a hook also enables collecting stats. Use None to remove the hook.
+    """
+    global _hook
+    if not (callback is None or callable(callback)):
+        raise TypeError("The compile stats hook must be callable or None.")
+    _hook = callback
+
+
+def is_enabled():
+    """Get whether compile stats should be collected."""
+    if _enabled or _hook is not None:
+        return True
+    return os.getenv("PYSHADER_COMPILE_STATS", "").lower() in ("1", "true", "yes")
+
+
+def merge_stats(stats, new_stats):
+    """Get a new dict with the new stats merged into the given stats."""
+    result = {**stats, **new_stats}
+    result["phases"] = {**stats.get("phases", {}), **new_stats.get("phases", {})}
+    return result
+
+
+def call_hook(module, stats):
+    if _hook is not None:
+        _hook(module, stats)
@@ -451,3 +451,5 @@ RES_UNIFORM = "uniform"
 RES_BUFFER = "buffer"
 RES_SAMPLER = "sampler"
 RES_TEXTURE = "texture"
+RES_SHARED = "shared"
+RES_SPECIALIZATION = "specialization"
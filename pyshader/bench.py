@@ -0,0 +1,414 @@
+"""
+Benchmark the compile throughput of pyshader. Usage:
+
+    python -m pyshader.bench [-o results.json] [--compare baseline.json] [--scaling]
+
+The corpus consists of the example shaders in ``examples_py``, the
+shaders in the tests (extracted from the source), and synthetic large
+shaders (with lots of arithmetic and control flow, with hundreds of
+conditions, or with deeply nested control flow). The first two are only
+available in a checkout of the repo.
+Results are written as json, and can be compared with a previous run,
+reporting metrics that regressed by more than a threshold. With
+``--scaling``, synthetic shaders of increasing size (up to 10k+ SpirV
+instructions) are compiled to show how each phase scales.
+"""
+
+import os
+import gc
+import sys
+import ast
+import json
+import time
+import platform
+import argparse
+import warnings
+import tracemalloc
+
+import pyshader
+from pyshader import _stats
+from pyshader.py import python2shader
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHADER_TYPES = "vertex", "fragment", "compute"
+
+# Metrics to compare, and whether higher is better
+METRICS = {
+    "shaders_per_second": True,
+    "total_time": False,
+    "peak_memory": False,
+    "peak_rss": False,
+    "output_size": False,
+}
+
+
+# %% The corpus
+
+
+def get_corpus(synthetic_sizes=(50, 200, 800)):
+    """Get a dict that maps corpus names to lists of Python functions.
+    Note that some of the shaders in the tests are expected to fail to
+    compile; these are left out by ``run_benchmark()``.
+    """
+    corpus = {}
+    corpus["examples"] = _get_shaders_from_dir(os.path.join(ROOT_DIR, "examples_py"))
+    corpus["tests"] = _get_shaders_from_dir(os.path.join(ROOT_DIR, "tests"))
+    corpus["synthetic"] = [_get_synthetic_shader(n) for n in synthetic_sizes]
+    corpus["conditions"] = [_get_conditions_shader(n) for n in synthetic_sizes]
+    corpus["nested"] = [_get_nested_shader(n) for n in synthetic_sizes]
+    return corpus
+
+
+def _get_namespace():
+    ns = {"pyshader": pyshader}
+    for name in pyshader.__all__:
+        ns[name] = getattr(pyshader, name)
+    return ns
+
+
+def _get_shaders_from_dir(dirname):
+    """Extract the shader functions from the Python files in the given dir.
+    Shaders are recognized by their name, and are also found inside other
+    functions (e.g. tests). Each is defined in a namespace with the
+    pyshader types, without its decorators.
+    """
+    funcs = []
+    if not os.path.isdir(dirname):
+        return funcs
+    for fname in sorted(os.listdir(dirname)):
+        if not fname.endswith(".py"):
+            continue
+        filename = os.path.join(dirname, fname)
+        with open(filename, "rb") as f:
+            tree = ast.parse(f.read().decode(), filename)
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.FunctionDef):
+                continue
+            if sum(t in node.name.lower() for t in SHADER_TYPES) != 1:
+                continue
+            if not all(arg.annotation or node.args.defaults for arg in node.args.args):
+                continue
+            node.decorator_list = []
+            ns = _get_namespace()
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    module = ast.Module(body=[node], type_ignores=[])
+                    exec(compile(module, filename, "exec"), ns, ns)
+            except Exception:
+                continue
+            funcs.append(ns[node.name])
+    return funcs
+
+
+def _get_synthetic_shader(n):
+    """Get a compute shader with n blocks of arithmetic and control flow."""
+    lines = [
+        f"def compute_shader_synthetic_{n}(",
+        "    index: ('input', 'GlobalInvocationId', ivec3),",
+        "    data1: ('buffer', 0, Array(f32)),",
+        "    data2: ('buffer', 1, Array(vec4)),",
+        "):",
+        "    i = index.x",
+        "    a = data1[i]",
+        "    v = data2[i]",
+        "    b = 0.0",
+    ]
+    for j in range(n):
+        k = j % 4
+        if k == 0:
+            lines.append(f"    b = b + a * {j}.0 - {j % 7}.5")
+        elif k == 1:
+            lines.append(f"    if a > {j}.0:")
+            lines.append("        b = b * 2.0")
+            lines.append("    else:")
+            lines.append(f"        b = b - v.x * {j % 5}.0")
+        elif k == 2:
+            lines.append(f"    for j{j} in range({j % 9 + 1}):")
+            lines.append("        v = v * 0.5 + vec4(b, a, 1.0, 0.0)")
+        else:
+            lines.append("    a = sqrt(abs(a)) + v.y * v.z")
+    lines.append("    data1[i] = a + b")
+    lines.append("    data2[i] = v")
+    ns = _get_namespace()
+    exec("\n".join(lines), ns, ns)
+    return ns[f"compute_shader_synthetic_{n}"]
+
+
+def _get_conditions_shader(n):
+    """Get a compute shader with n if-statements, with chains of up to
+    four conditions combined with ``or`` and ``and``.
+    """
+    lines = [
+        f"def compute_shader_conditions_{n}(",
+        "    index: ('input', 'GlobalInvocationId', ivec3),",
+        "    data1: ('buffer', 0, Array(f32)),",
+        "):",
+        "    i = index.x",
+        "    a = data1[i]",
+        "    b = 0.0",
+    ]
+    for j in range(n):
+        conditions = [f"a > {j}.0", f"b < {j % 7}.5", f"a == {j % 3}.0", "b > a"]
+        conditions = conditions[: j % 4 + 1]
+        combine = " and " if j % 5 == 4 else " or "
+        lines.append(f"    if {combine.join(conditions)}:")
+        lines.append(f"        b = b + {j % 11}.0")
+    lines.append("    data1[i] = a + b")
+    ns = _get_namespace()
+    exec("\n".join(lines), ns, ns)
+    return ns[f"compute_shader_conditions_{n}"]
+
+
+def _get_nested_shader(n):
+    """Get a compute shader with if-else statements and loops nested (up
+    to 40 deep), with n if-statements in the innermost block.
+    """
+    depth = min(n // 5 + 1, 40)
+    lines = [
+        f"def compute_shader_nested_{n}(",
+        "    index: ('input', 'GlobalInvocationId', ivec3),",
+        "    data1: ('buffer', 0, Array(f32)),",
+        "):",
+        "    i = index.x",
+        "    a = data1[i]",
+        "    b = 0.0",
+    ]
+    indent = "    "
+    for j in range(depth):
+        if j % 4 == 3:
+            lines.append(indent + f"for j{j} in range({j % 5 + 2}):")
+        else:
+            lines.append(indent + f"if a > {j}.0:")
+            lines.append(indent + "    b = b + 1.0")
+            lines.append(indent + "else:")
+        indent += "    "
+        lines.append(indent + f"b = b * {j % 3}.5")
+    for j in range(n):
+        lines.append(indent + f"if b > {j}.0:")
+        lines.append(indent + f"    b = b - {j % 11}.0")
+        if j % 3 == 0:
+            lines.append(indent + "else:")
+            lines.append(indent + "    a = a + b")
+    for j in reversed(range(depth)):
+        indent = indent[:-4]
+        lines.append(indent + f"a = a + {j % 7}.0")
+    lines.append("    data1[i] = a + b")
+    ns = _get_namespace()
+    exec("\n".join(lines), ns, ns)
+    return ns[f"compute_shader_nested_{n}"]
+
+
+def split_corpus(corpus):
+    """Split the corpus in the shaders that can be compiled, and the ones
+    that cannot. Returns two dicts, the second maps corpus names to lists
+    with the (qualified) names of the shaders that failed.
+    """
+    compiled, failures = {}, {}
+    for name, funcs in corpus.items():
+        compiled[name], failures[name] = [], []
+        for func in funcs:
+            try:
+                python2shader(func).to_spirv()
+            except Exception:
+                failures[name].append(func.__qualname__)
+            else:
+                compiled[name].append(func)
+    return compiled, failures
+
+
+# %% Running the benchmark
+
+
+def get_peak_rss():
+    """Get the peak resident set size of this process in bytes, or None
+    if this is not available on this platform.
+    """
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def compile_corpus(funcs):
+    """Compile the given functions, and return a list of ShaderModule objects."""
+    modules = []
+    for func in funcs:
+        m = python2shader(func)
+        m.to_spirv()
+        modules.append(m)
+    return modules
+
+
+def run_benchmark(corpus, repeat=5):
+    """Run the benchmark and return a dict with the results. Shaders
+    that fail to compile are not measured, but listed in the results.
+    """
+    corpus, failures = split_corpus(corpus)
+    funcs = [func for funcs in corpus.values() for func in funcs]
+
+    # The disk cache would make us measure something else
+    cache_dir = os.environ.pop("PYSHADER_CACHE_DIR", None)
+    enabled = _stats._enabled
+    try:
+        _stats.enable_compile_stats(True)  # the overhead is negligible
+        compile_corpus(funcs)  # warmup
+
+        # Measure time (and the time per phase), take the best run
+        best_time, modules = None, []
+        for i in range(repeat):
+            gc.collect()
+            t0 = time.perf_counter()
+            result = compile_corpus(funcs)
+            t = time.perf_counter() - t0
+            if best_time is None or t < best_time:
+                best_time, modules = t, result
+        phases = {}
+        for m in modules:
+            for key, val in m.compile_stats["phases"].items():
+                phases[key] = phases.get(key, 0) + val
+        _stats.enable_compile_stats(False)
+
+        # Measure memory
+        gc.collect()
+        tracemalloc.start()
+        compile_corpus(funcs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    finally:
+        _stats.enable_compile_stats(enabled)
+        if cache_dir is not None:
+            os.environ["PYSHADER_CACHE_DIR"] = cache_dir
+
+    return {
+        "pyshader_version": pyshader.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {name: len(funcs) for name, funcs in corpus.items()},
+        "shaders": len(funcs),
+        "failures": failures,
+        "shaders_per_second": len(funcs) / best_time if best_time else 0.0,
+        "total_time": best_time or 0.0,
+        "phases": phases,
+        "peak_memory": peak_memory,
+        "peak_rss": get_peak_rss(),
+        "output_size": sum(len(m.to_spirv()) for m in modules),
+    }
+
+
+def run_scaling(sizes=(250, 500, 1000, 2000)):
+    """Compile synthetic shaders of the given sizes, and return a list of
+    dicts with the number of SpirV instructions and the time per phase.
+    """
+    cache_dir = os.environ.pop("PYSHADER_CACHE_DIR", None)
+    enabled = _stats._enabled
+    try:
+        _stats.enable_compile_stats(True)
+        scaling = []
+        for n in sizes:
+            func = _get_synthetic_shader(n)
+            gc.collect()
+            stats = compile_corpus([func])[0].compile_stats
+            scaling.append(
+                {
+                    "size": n,
+                    "instructions": stats["instructions"],
+                    "phases": stats["phases"],
+                }
+            )
+    finally:
+        _stats.enable_compile_stats(enabled)
+        if cache_dir is not None:
+            os.environ["PYSHADER_CACHE_DIR"] = cache_dir
+    return scaling
+
+
+def compare_results(results, baseline, threshold=0.1):
+    """Compare results with a baseline. Returns a list of (metric, old,
+    new, relative change, regressed) tuples. More shaders that fail to
+    compile is always a regression.
+    """
+    comparison = []
+    metrics = [(key, METRICS[key], results, baseline) for key in METRICS]
+    for key in sorted(set(results["phases"]) & set(baseline["phases"])):
+        metrics.append((key, False, results["phases"], baseline["phases"]))
+    for key, higher_is_better, new_values, old_values in metrics:
+        old, new = old_values.get(key), new_values.get(key)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        regressed = (-change if higher_is_better else change) > threshold
+        comparison.append((key, old, new, change, regressed))
+    if "failures" in results and "failures" in baseline:
+        old = sum(len(names) for names in baseline["failures"].values())
+        new = sum(len(names) for names in results["failures"].values())
+        comparison.append(("failures", old, new, (new - old) / max(old, 1), new > old))
+    return comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pyshader.bench")
+    parser.add_argument("-o", "--output", help="write the results to this json file")
+    parser.add_argument("--compare", help="a json file with results to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative regression threshold"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs")
+    parser.add_argument(
+        "--scaling", action="store_true", help="also measure how the phases scale"
+    )
+    args = parser.parse_args(argv)
+
+    corpus = get_corpus()
+    results = run_benchmark(corpus, args.repeat)
+
+    print(f"Compiled {results['shaders']} shaders {results['corpus']}")
+    print(f"  shaders per second: {results['shaders_per_second']:0.1f}")
+    print(f"  total time: {results['total_time'] * 1000:0.1f} ms")
+    for key, val in results["phases"].items():
+        print(f"    {key}: {val * 1000:0.1f} ms")
+    print(f"  peak memory: {results['peak_memory'] / 1024:0.0f} KiB")
+    if results["peak_rss"]:
+        print(f"  peak rss: {results['peak_rss'] / 1024:0.0f} KiB")
+    print(f"  output size: {results['output_size']} bytes")
+    for name, names in results["failures"].items():
+        if names:
+            print(f"  failed to compile ({name}): {len(names)}")
+            if name != "tests":  # some of the test shaders are expected to fail
+                print("    " + ", ".join(names))
+
+    if args.scaling:
+        results["scaling"] = run_scaling()
+        print("Scaling (time per instruction, in us):")
+        for item in results["scaling"]:
+            n = item["instructions"]
+            times = [f"{key} {t / n * 1e6:0.2f}" for key, t in item["phases"].items()]
+            print(f"  {n} instructions: " + ", ".join(times))
+
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(json.dumps(results, indent=2).encode())
+
+    if args.compare:
+        with open(args.compare, "rb") as f:
+            baseline = json.loads(f.read().decode())
+        comparison = compare_results(results, baseline, args.threshold)
+        print(f"Compared with {args.compare} (threshold {args.threshold:0.0%}):")
+        for key, old, new, change, regressed in comparison:
+            flag = "REGRESSION" if regressed else ""
+            print(f"  {key}: {old:0.4g} -> {new:0.4g} ({change:+0.1%}) {flag}")
+        if any(c[-1] for c in comparison):
+            return 1
+    # Only some of the test shaders are expected to fail
+    if any(names for name, names in results["failures"].items() if name != "tests"):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
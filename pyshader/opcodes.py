@@ -87,9 +87,12 @@ class OpCodeDefinitions:
 
     def co_resource(self, name, kind, slot, typename):
         """Define a shader resource, to be available under the given name.
-        Kind can be 'input', 'output', 'uniform', 'buffer', 'texture' or 'sampler'.
-        Slot is typically an int defining the location/binding slot,
-        but can also be a string specifying a builtin (for input and output).
+        Kind can be 'input', 'output', 'uniform', 'buffer', 'texture', 'sampler',
+        'shared' or 'specialization'. Slot is typically an int defining the
+        location/binding slot, but can also be a string specifying a builtin
+        (for input and output). For shared (workgroup) memory the slot is None.
+        For specialization constants the slot is a list (id, default), where
+        the default value can be None.
         """
         raise NotImplementedError()
 
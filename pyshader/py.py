@@ -1,10 +1,13 @@
 import os
 import math
 import inspect
+from time import perf_counter
 from dis import dis as pprint_bytecode
 from dis import cmp_op
 
 from ._coreutils import ShaderError
+from . import _cache
+from . import _stats
 from ._module import ShaderModule
 from .opcodes import OpCodeDefinitions as op
 from ._dis import dis
@@ -14,15 +17,35 @@ from .stdlib import __all__ as stdlib_func_names
 
 EXTENDED_ARG = dis.opmap["EXTENDED_ARG"]
 
+# The default limits of WebGPU, which are supported by all adapters
+MAX_WORKGROUP_SIZE = 256, 256, 64
+MAX_WORKGROUP_INVOCATIONS = 256
 
-def python2shader(func):
+
+def python2shader(func=None, *, lazy=None, workgroup_size=None):
     """Convert a Python function to a ShaderModule object.
 
     Takes the bytecode of the given function and converts it to our
     internal bytecode. From there it can be converted to binary SpirV.
     All in dependency-free pure Python.
+
+    Can be used as a decorator, with or without arguments. If ``lazy``
+    is True, only the shader type is checked at decoration time, and the
+    conversion is deferred until the bytecode or SpirV is first needed.
+    The default for ``lazy`` can be set with the PYSHADER_LAZY environment
+    variable.
+
+    For compute shaders, ``workgroup_size`` sets the number of invocations
+    in a workgroup: an int or a tuple of up to three ints (x, y, z). The
+    default is 1. An element of the tuple can also be the name of an i32
+    specialization constant, so that it can be set when creating the pipeline.
     """
 
+    if func is None:
+        return lambda func: python2shader(
+            func, lazy=lazy, workgroup_size=workgroup_size
+        )
+
     if not inspect.isfunction(func):
         raise TypeError("python2shader expects a Python function.")
 
@@ -38,29 +61,93 @@ def python2shader(func):
     else:
         raise NameError("Ambiguous function name: is it a vert, frag or comp shader?")
 
-    # Convert to bytecode
-    converter = PyBytecode2Bytecode()
-    converter.convert(func, shader_type)
-    bytecode = converter.dump()
-
-    return ShaderModule(func, bytecode, f"shader from {func.__name__}")
+    execution_modes = {}
+    if workgroup_size is not None:
+        if shader_type != "compute":
+            raise TypeError("The workgroup_size only applies to compute shaders.")
+        execution_modes["LocalSize"] = list(get_workgroup_size(workgroup_size))
+
+    if lazy is None:
+        lazy = os.getenv("PYSHADER_LAZY", "").lower() in ("1", "true", "yes")
+
+    def get_bytecode():
+        # Get bytecode from the disk cache, or convert it
+        cache_key = None
+        bytecode = None
+        if _cache.get_cache_dir():
+            cache_key = _cache.get_function_hash(func, execution_modes)
+            bytecode = _cache.load_bytecode(cache_key)
+        if bytecode is None:
+            converter = PyBytecode2Bytecode()
+            converter.convert(func, shader_type, execution_modes)
+            bytecode = converter.dump()
+            if cache_key:
+                _cache.store_bytecode(cache_key, bytecode)
+            if _stats.is_enabled():
+                m._record_stats(converter.get_stats())
+        m._disk_cache_key = cache_key
+        return bytecode
+
+    m = ShaderModule(func, get_bytecode, f"shader from {func.__name__}")
+    if not lazy:
+        m.to_bytecode()
+    return m
+
+
+def get_workgroup_size(workgroup_size):
+    """Get the workgroup size as a tuple of three ints, validated
+    against the limits of WebGPU. Names of specialization constants
+    are passed through as-is (these are checked by the generator).
+    """
+    if isinstance(workgroup_size, int) and not isinstance(workgroup_size, bool):
+        workgroup_size = (workgroup_size,)
+    if not (
+        isinstance(workgroup_size, (tuple, list))
+        and 1 <= len(workgroup_size) <= 3
+        and all(isinstance(n, (int, str)) for n in workgroup_size)
+        and not any(isinstance(n, bool) for n in workgroup_size)
+    ):
+        raise TypeError(
+            f"The workgroup_size must be an int or a tuple of 1-3 ints, not {workgroup_size!r}."
+        )
+    workgroup_size = tuple(workgroup_size) + (1,) * (3 - len(workgroup_size))
+    for n, max_n, dim in zip(workgroup_size, MAX_WORKGROUP_SIZE, "xyz"):
+        if isinstance(n, int) and not 1 <= n <= max_n:
+            raise ValueError(
+                f"The workgroup_size in {dim} must be between 1 and {max_n}, not {n}."
+            )
+    x, y, z = (n if isinstance(n, int) else 1 for n in workgroup_size)
+    if x * y * z > MAX_WORKGROUP_INVOCATIONS:
+        raise ValueError(
+            f"The workgroup_size {workgroup_size} has more than "
+            f"{MAX_WORKGROUP_INVOCATIONS} invocations."
+        )
+    return workgroup_size
 
 
 def get_line_bumps_from_code_object(co):
     """Get a list of tuples that define what instruction mark the beginning
     of a new line.
     """
-    # Convert Python's specific compressed format to a list of (absolute) tuples.
-    # https://svn.python.org/projects/python/branches/pep-0384/Objects/lnotab_notes.txt
-    lineno, addr = co.co_firstlineno, 0
     line_bumps = []
-    for i in range(0, len(co.co_lnotab), 2):
-        addr_incr = co.co_lnotab[i]
-        line_incr = co.co_lnotab[i + 1]
-        addr += addr_incr
-        lineno += line_incr
-        if line_incr:
-            line_bumps.append((addr, lineno))
+    if hasattr(co, "co_lines"):  # pragma: no cover
+        # Python 3.10+ provides (start, end, lineno) ranges
+        prev_lineno = co.co_firstlineno
+        for addr, _, lineno in co.co_lines():
+            if lineno is not None and lineno != prev_lineno:
+                line_bumps.append((addr, lineno))
+                prev_lineno = lineno
+    else:
+        # Convert Python's specific compressed format to a list of (absolute) tuples.
+        # https://svn.python.org/projects/python/branches/pep-0384/Objects/lnotab_notes.txt
+        lineno, addr = co.co_firstlineno, 0
+        for i in range(0, len(co.co_lnotab), 2):
+            addr_incr = co.co_lnotab[i]
+            line_incr = co.co_lnotab[i + 1]
+            addr += addr_incr
+            lineno += line_incr
+            if line_incr:
+                line_bumps.append((addr, lineno))
     # Add an entry at the beginning (co_firstlineno may not match the first entry)
     line_bumps.insert(0, (-1, co.co_firstlineno))
     # Add an entry at the end, making processing easier.
@@ -68,6 +155,42 @@ def get_line_bumps_from_code_object(co):
     return line_bumps
 
 
+def get_instructions_from_code_object(co, line_bumps):
+    """Decode the bytecode of a code object into a list of instructions,
+    and a dict that maps byte offsets to indices in that list. Each
+    instruction is a tuple (offset, opname, arg, linenr, target).
+    EXTENDED_ARG's are merged into the instruction that they belong to,
+    and its offset (as well as the instruction's) maps to its index. The
+    linenr is set if the instruction starts a new line (None otherwise),
+    and the target is the offset that a jump instruction jumps to.
+    """
+    code = co.co_code
+    line_bump_index = 0
+    instructions = []
+    index = {}
+    arg = 0
+    for offset in range(0, len(code), 2):
+        index[offset] = len(instructions)
+        opcode = code[offset]
+        arg = arg * 256 + code[offset + 1]
+        if opcode == EXTENDED_ARG:
+            continue
+        # Each instruction can move up one line bump
+        linenr = None
+        if offset >= line_bumps[line_bump_index + 1][0]:
+            line_bump_index += 1
+            linenr = line_bumps[line_bump_index][1]
+        # Get jump target
+        target = None
+        if opcode in dis.hasjrel:
+            target = offset + 2 + arg
+        elif opcode in dis.hasjabs:
+            target = arg
+        instructions.append((offset, dis.opname[opcode], arg, linenr, target))
+        arg = 0
+    return instructions, index
+
+
 class PyBytecode2Bytecode:
     """Convert Python bytecode to our own well-defined bytecode.
     Python bytecode depends on other variables on the code object, and differs
@@ -79,20 +202,24 @@ class PyBytecode2Bytecode:
         """For debugging purposes."""
         pprint_bytecode(self._co)
 
-    def convert(self, py_func, shader_type):
+    def convert(self, py_func, shader_type, execution_modes=None):
 
         # Attributes of code objects: co_code, co_name, co_filename, co_firstlineno,
         # co_argcount, co_kwonlyargcount, co_nlocals, co_consts, co_varnames,
         # co_names, co_cellvars, co_freevars, co_stacksize, co_flags, co_lnotab
         # -> co_lnotab  is line number table
         #    https://svn.python.org/projects/python/branches/pep-0384/Objects/lnotab_notes.txt
+        self._t_start = perf_counter()
+        self._phase_times = {}
         self._py_func = py_func
         self._co = self._py_func.__code__
         self._py_bytecode = self._co.co_code
 
-        # Get line bumps, and add an element for ease of use
-        self._line_bumps = get_line_bumps_from_code_object(self._co)
-        self._line_bump_index = len(self._line_bumps) - 2  # set at the last line
+        # Decode the bytecode once, into a table of instructions
+        line_bumps = get_line_bumps_from_code_object(self._co)
+        table = get_instructions_from_code_object(self._co, line_bumps)
+        self._instructions, self._instruction_index = table
+        self._linenr = line_bumps[-2][1]  # set at the last line
 
         self._opcodes = []  # The resulting "bytecode"
 
@@ -102,6 +229,8 @@ class PyBytecode2Bytecode:
         self._buffer = {}
         self._texture = {}
         self._sampler = {}
+        self._shared = {}
+        self._specialization = {}
 
         # Keep track of labels
         self._labels = {}
@@ -129,7 +258,9 @@ class PyBytecode2Bytecode:
 
         # todo: allow user to specify name otherwise?
         entrypoint_name = "main"  # py_func.__name__
-        self.emit(op.co_entrypoint, entrypoint_name, shader_type, {})
+        self.emit(
+            op.co_entrypoint, entrypoint_name, shader_type, dict(execution_modes or {})
+        )
 
         KINDMAP = {
             "input": self._input,
@@ -138,6 +269,8 @@ class PyBytecode2Bytecode:
             "buffer": self._buffer,
             "sampler": self._sampler,
             "texture": self._texture,
+            "shared": self._shared,
+            "specialization": self._specialization,
         }
 
         defaults = list(py_func.__defaults__ or [])
@@ -155,6 +288,24 @@ class PyBytecode2Bytecode:
                 raise TypeError(
                     f"pyshader arg {argname} needs type info either as default value or annotation."
                 )
+            elif (
+                isinstance(resource, tuple)
+                and len(resource) == 2
+                and resource[0] == "shared"
+            ):
+                # Shared memory has no slot
+                kind, slot, subtype = resource[0], None, resource[1]
+                assert isinstance(subtype, (type, str))
+            elif (
+                isinstance(resource, tuple)
+                and len(resource) in (3, 4)
+                and resource[0] == "specialization"
+            ):
+                # The slot is the constant id, with the (optional) default value
+                kind, spec_id, subtype, *default = resource
+                assert isinstance(spec_id, int)
+                assert isinstance(subtype, (type, str))
+                slot = [spec_id, default[0] if default else None]
             elif isinstance(resource, tuple) and len(resource) == 3:
                 kind, slot, subtype = resource
                 assert isinstance(kind, str)
@@ -219,9 +370,15 @@ class PyBytecode2Bytecode:
     def dump(self):
         return self._opcodes
 
+    def get_stats(self):
+        """Get a dict with statistics of the conversion: the time spent in
+        each phase (in seconds).
+        """
+        return {"phases": dict(self._phase_times)}
+
     def _convert(self):
 
-        self._line_bump_index = 0
+        self._linenr = self._co.co_firstlineno
         self._pointer = 0
         while self._pointer < len(self._py_bytecode):
             if (
@@ -258,10 +415,17 @@ class PyBytecode2Bytecode:
             else:
                 method(arg)
 
+        self._phase_times["decode"] = perf_counter() - self._t_start
+
         # Some post-processing (order is important)
-        self._fix_empty_blocks()
-        self._fix_or_control_flow()
-        self._fix_consistent_labels()
+        for fix in (
+            self._fix_empty_blocks,
+            self._fix_or_control_flow,
+            self._fix_consistent_labels,
+        ):
+            t0 = perf_counter()
+            fix()
+            self._phase_times[fix.__name__.lstrip("_")] = perf_counter() - t0
 
         # Note: at some point we tried to detect ternary ops (xx if yy else zz)
         # and resolved them into op_select. This detection relied on the fact that
@@ -290,15 +454,10 @@ class PyBytecode2Bytecode:
             "JUMP_IF_TRUE_OR_POP",
         )
 
-        self._pointer = 0
-        while self._pointer < len(self._py_bytecode):
-            opname, arg = self._next()
-            # Get index to this instruction. Do this after calling next(), because
-            # it may have jumped over EXTENDED_ARG instructions.
-            i = self._pointer - 2
+        for i, opname, arg, _, target in self._instructions:
             if "JUMP" in opname:
                 assert opname in jump_ops
-                jumps[i] = (i + 2 + arg) if opname == "JUMP_FORWARD" else arg
+                jumps[i] = target
 
         # Look for loop starts
         loop_starts = []
@@ -441,15 +600,21 @@ class PyBytecode2Bytecode:
                 label = labels_to_replace[label]
             labels_to_replace[label] = new_label
 
-        for i in reversed(range(len(self._opcodes) - 1)):
+        # Walk backwards, building the result in reverse, so that we
+        # can drop an empty block by popping the branch that follows it.
+        opcodes = []
+        for opcode in reversed(self._opcodes):
             if (
-                self._opcodes[i][0] == "co_label"
-                and self._opcodes[i + 1][0] == "co_branch"
-                and self._opcodes[i][1] not in self._protected_labels
+                opcode[0] == "co_label"
+                and opcodes
+                and opcodes[-1][0] == "co_branch"
+                and opcode[1] not in self._protected_labels
             ):
-                _set_new_label(self._opcodes[i][1], self._opcodes[i + 1][1])
-                self._opcodes.pop(i)
-                self._opcodes.pop(i)
+                _set_new_label(opcode[1], opcodes.pop(-1)[1])
+            else:
+                opcodes.append(opcode)
+        opcodes.reverse()
+        self._opcodes = opcodes
 
         self._replace_labels(labels_to_replace)
 
@@ -462,64 +627,92 @@ class PyBytecode2Bytecode:
         # the pattern. In `a and b`, `b` is not evaluated when `a`
         # evaluates to falsy. But in this case the resulting control
         # flow is fine, and we're probably unable to detect it reliably.
-
-        def _get_block_to_resolve():
-            conditional_branches = {}
-            cur_block = None
-            cur_block_i = 0
-            for i in range(len(self._opcodes)):
-                opcode, *args = self._opcodes[i]
-                if opcode == "co_label":
-                    cur_block = args[0]
-                    cur_block_i = i
-                elif opcode == "co_branch_conditional":
-                    # Detect that this conditional branch is part of an earlier comparison
-                    if args[0] in conditional_branches:
-                        other, ii = conditional_branches[args[0]]
-                        if other == cur_block:
-                            return ii, cur_block_i, i
-                    elif args[1] in conditional_branches:
-                        other, ii = conditional_branches[args[1]]
-                        if other == cur_block:
-                            return ii, cur_block_i, i
-                    # Register this branch (note that this may overwrite keys, which is ok)
-                    conditional_branches[args[0]] = args[1], i
-                    conditional_branches[args[1]] = args[0], i
-                elif "store" in opcode:
-                    # If there's any store ops here, this cannot have been an OR,
-                    # and we should not touch it, otherwise we break the flow.
-                    cur_block = None
-
-        while True:
-            block = _get_block_to_resolve()
-            if not block:
-                break
-            i_ins, i_label, i_cond = block
-            # Get all the labels
-            labels1 = self._opcodes[i_ins][1:]  # this label and the common block
-            labels2 = self._opcodes[i_cond][1:]  # the common block and the else
-            # Rip out the current label
-            selection = self._opcodes[i_label + 1 : i_cond]
-            # assert all(op[0] != "co_src_linenr" for op in selection
-            self._opcodes[i_label : i_cond + 1] = []
-            # Determine how to combine these
-            if labels1[0] == labels2[0]:  # comp1 is true or comp2 is true
-                selection.append(("co_binary_op", "or"))
-                selection.append(("co_branch_conditional", labels1[0], labels2[1]))
-            elif labels1[0] == labels2[1]:  # comp1 is true or comp2 is false
-                selection.append(("co_unary_op", "not"))
-                selection.append(("co_binary_op", "or"))
-                selection.append(("co_branch_conditional", labels1[0], labels2[0]))
-            elif labels1[1] == labels2[0]:  # comp1 is false or comp2 is true
-                selection.insert(0, ("co_unary_op", "not"))
-                selection.append(("co_binary_op", "or"))
-                selection.append(("co_branch_conditional", labels1[1], labels2[1]))
-            elif labels1[1] == labels2[1]:  # comp1 is false or comp2 is false
-                selection.append(("co_binary_op", "and"))
-                selection.append(("co_unary_op", "not"))
-                selection.append(("co_branch_conditional", labels1[1], labels2[0]))
-            # Put it back in with the parent label
-            self._opcodes[i_ins : i_ins + 1] = selection
+        #
+        # We do this in a single pass, moving opcodes from a stack of
+        # todo's to the result. When the conditional branch of a block
+        # combines with an earlier conditional branch, the block is merged
+        # into the block of that earlier branch, and the new conditional
+        # branch (and whatever came after the earlier branch) is put back
+        # on the stack, so it can be combined again, e.g. in `a or b or c`.
+
+        todo = list(reversed(self._opcodes))
+        opcodes = []
+        # Maps label -> (other label, index of the conditional branch)
+        conditional_branches = {}
+        # Log of (index, label, previous value, cur_block, cur_block_i),
+        # so we can undo the registration of conditional branches.
+        log = []
+        cur_block = None
+        cur_block_i = 0
+
+        while todo:
+            opcode, *args = todo.pop(-1)
+            if opcode == "co_label":
+                cur_block = args[0]
+                cur_block_i = len(opcodes)
+            elif opcode == "co_branch_conditional":
+                # Detect that this conditional branch is part of an earlier comparison
+                block = None
+                if args[0] in conditional_branches:
+                    other, ii = conditional_branches[args[0]]
+                    if other == cur_block:
+                        block = ii, cur_block_i
+                elif args[1] in conditional_branches:
+                    other, ii = conditional_branches[args[1]]
+                    if other == cur_block:
+                        block = ii, cur_block_i
+                if block:
+                    i_ins, i_label = block
+                    # Get all the labels
+                    labels1 = opcodes[i_ins][1:]  # this label and the common block
+                    labels2 = args  # the common block and the else
+                    # Rip out the current label, and what's between it and i_ins
+                    selection = opcodes[i_label + 1 :]
+                    between = opcodes[i_ins + 1 : i_label]
+                    del opcodes[i_ins:]
+                    # Determine how to combine these
+                    if labels1[0] == labels2[0]:  # comp1 is true or comp2 is true
+                        selection.append(("co_binary_op", "or"))
+                        branch = "co_branch_conditional", labels1[0], labels2[1]
+                    elif labels1[0] == labels2[1]:  # comp1 is true or comp2 is false
+                        selection.append(("co_unary_op", "not"))
+                        selection.append(("co_binary_op", "or"))
+                        branch = "co_branch_conditional", labels1[0], labels2[0]
+                    elif labels1[1] == labels2[0]:  # comp1 is false or comp2 is true
+                        selection.insert(0, ("co_unary_op", "not"))
+                        selection.append(("co_binary_op", "or"))
+                        branch = "co_branch_conditional", labels1[1], labels2[1]
+                    elif labels1[1] == labels2[1]:  # comp1 is false or comp2 is false
+                        selection.append(("co_binary_op", "and"))
+                        selection.append(("co_unary_op", "not"))
+                        branch = "co_branch_conditional", labels1[1], labels2[0]
+                    # Put it back in with the parent label. The selection has
+                    # no labels, branches or stores, so it does not affect the
+                    # state. The new branch and what follows it are revisited.
+                    opcodes += selection
+                    todo += reversed(between)
+                    todo.append(branch)
+                    # Undo the registrations from the earlier branch onwards
+                    while log and log[-1][0] >= i_ins:
+                        _, label, prev, cur_block, cur_block_i = log.pop(-1)
+                        if prev is None:
+                            conditional_branches.pop(label)
+                        else:
+                            conditional_branches[label] = prev
+                    continue
+                # Register this branch (note that this may overwrite keys, which is ok)
+                i = len(opcodes)
+                for label, other in [(args[0], args[1]), (args[1], args[0])]:
+                    prev = conditional_branches.get(label, None)
+                    log.append((i, label, prev, cur_block, cur_block_i))
+                    conditional_branches[label] = other, i
+            elif "store" in opcode:
+                # If there's any store ops here, this cannot have been an OR,
+                # and we should not touch it, otherwise we break the flow.
+                cur_block = None
+            opcodes.append((opcode, *args))
+
+        self._opcodes = opcodes
 
     def _fix_consistent_labels(self):
         # Rename the block labels, so that they are numbered in order
@@ -544,39 +737,22 @@ class PyBytecode2Bytecode:
         self._replace_labels(labels_to_replace)
 
     def _get_next_pos(self, pos, delta):
-        # Move forward until we are at an actual instruction
-        if pos % 2 == 0:
-            while self._py_bytecode[pos] == EXTENDED_ARG:
-                pos += 2
-        else:
-            while self._py_bytecode[pos - 1] == EXTENDED_ARG:
-                pos += 2
-        if delta:
-            return self._get_next_pos(pos + 1, delta - 1)
-        return pos
+        # Move forward until we are at an actual instruction. Positions
+        # are byte offsets, where odd positions refer to the argument.
+        # Each delta moves to the next opcode/argument.
+        h = 2 * self._instruction_index[pos - pos % 2] + pos % 2 + delta
+        return self._instructions[h // 2][0] + h % 2
 
     def _next(self):
         assert self._pointer % 2 == 0
-        # Skip over extended args first, easier to backtrack later
-        while self._py_bytecode[self._pointer] == EXTENDED_ARG:
-            self._pointer += 2
-        # Get opcode
-        opcode = self._py_bytecode[self._pointer]
-        opname = dis.opname[opcode]
-        # Get arg value
-        arg = self._py_bytecode[self._pointer + 1]
-        n, i = 1, self._pointer
-        while self._py_bytecode[i - 2] == EXTENDED_ARG:
-            arg += self._py_bytecode[i - 1] * 256 ** n
-            n += 1
-            i -= 2
+        index = self._instruction_index[self._pointer]
+        offset, opname, arg, linenr, _ = self._instructions[index]
         # Increase line number?
-        if self._pointer >= self._line_bumps[self._line_bump_index + 1][0]:
-            self._line_bump_index += 1
-            linenr = self._line_bumps[self._line_bump_index][1]
+        if linenr is not None:
+            self._linenr = linenr
             self.emit(op.co_src_linenr, linenr)
         # Done
-        self._pointer += 2
+        self._pointer = offset + 2
         return opname, arg
 
     def _peek(self, pos=None, delta=0):
@@ -584,19 +760,9 @@ class PyBytecode2Bytecode:
         pos = self._pointer if pos is None else pos
         pos = self._get_next_pos(pos, delta)
         # Now get the result, which is either the instruction, or its value
-        if pos % 2 == 0:
-            # Resolve name
-            res = self._py_bytecode[pos]
-            res = dis.opname[res]
-        else:
-            # Resolve value, taking EXTENDED_ARG into account
-            res = self._py_bytecode[pos]
-            n, i = 1, pos - 1
-            while self._py_bytecode[i - 2] == EXTENDED_ARG:
-                res += self._py_bytecode[i - 1] * 256 ** n
-                n += 1
-                i -= 2
-        return res
+        index = self._instruction_index[pos - pos % 2]
+        _, opname, arg, _, _ = self._instructions[index]
+        return arg if pos % 2 else opname
 
     def _get_label(self, pointer_pos):
         loop_labels = self._loop_stack[-1].get("labelmap", {})
@@ -616,7 +782,7 @@ class PyBytecode2Bytecode:
         variables.
         """
         filename = self._co.co_filename
-        linenr = self._line_bumps[self._line_bump_index][1]
+        linenr = self._linenr
         text = ""
         # Start with basic info about the line
         if filename:
@@ -705,6 +871,12 @@ class PyBytecode2Bytecode:
         elif name in self._texture:
             self.emit(op.co_load_name, "texture." + name)
             self._stack.append("texture." + name)
+        elif name in self._shared:
+            self.emit(op.co_load_name, "shared." + name)
+            self._stack.append("shared." + name)
+        elif name in self._specialization:
+            self.emit(op.co_load_name, "specialization." + name)
+            self._stack.append("specialization." + name)
         else:
             # Normal load
             self.emit(op.co_load_name, name)
@@ -726,6 +898,10 @@ class PyBytecode2Bytecode:
             self.emit(op.co_store_name, "sampler." + name)
         elif name in self._texture:
             self.emit(op.co_store_name, "texture." + name)
+        elif name in self._shared:
+            self.emit(op.co_store_name, "shared." + name)
+        elif name in self._specialization:
+            self.emit(op.co_store_name, "specialization." + name)
         else:
             # Normal store
             self.emit(op.co_store_name, name)
@@ -10,6 +10,28 @@ NI = "Only works in the shader."
 
 
 tex_functions = {"imageLoad", "read", "imageStore", "write", "sample"}
+sync_functions = {"barrier", "workgroup_barrier", "memory_barrier"}
+atomic_functions = {
+    "atomic_add",
+    "atomic_sub",
+    "atomic_min",
+    "atomic_max",
+    "atomic_and",
+    "atomic_or",
+    "atomic_xor",
+    "atomic_exchange",
+    "atomic_compare_exchange",
+}
+subgroup_functions = {
+    "subgroup_add",
+    "subgroup_min",
+    "subgroup_max",
+    "subgroup_inclusive_add",
+    "subgroup_exclusive_add",
+    "subgroup_ballot",
+    "subgroup_broadcast",
+    "subgroup_shuffle",
+}
 
 
 def read(texture, tex_coords):  # noqa: N802
@@ -36,6 +58,139 @@ def sample(texture, sampler, tex_coords):  # noqa: N802
     raise NotImplementedError(NI)
 
 
+# %% Synchronization
+
+
+def barrier():
+    """Wait until all invocations in the workgroup have reached this
+    barrier, and make their writes to shared memory, buffers and textures
+    visible to each-other. Only in compute shaders, and only in control
+    flow that is the same for all invocations in the workgroup.
+    """
+    raise NotImplementedError(NI)
+
+
+def workgroup_barrier():
+    """Like barrier(), but only for shared (workgroup) memory. Use this
+    between the steps of e.g. a tiled reduction.
+    """
+    raise NotImplementedError(NI)
+
+
+def memory_barrier():
+    """Order the writes to shared memory, buffers and textures by this
+    invocation, so that other invocations that see a later write also see
+    the earlier ones. Does not wait for other invocations.
+    """
+    raise NotImplementedError(NI)
+
+
+# %% Atomic operations
+
+# The first argument of these functions is an i32 element of a buffer or
+# of shared memory, e.g. atomic_add(data[i], 1). The other invocations
+# cannot see (or modify) the element while the operation is in progress.
+# Each function returns the value of the element before the operation.
+
+
+def atomic_add(ref, value):
+    """Add value to the element."""
+    raise NotImplementedError(NI)
+
+
+def atomic_sub(ref, value):
+    """Subtract value from the element."""
+    raise NotImplementedError(NI)
+
+
+def atomic_min(ref, value):
+    """Set the element to the minimum of the element and value."""
+    raise NotImplementedError(NI)
+
+
+def atomic_max(ref, value):
+    """Set the element to the maximum of the element and value."""
+    raise NotImplementedError(NI)
+
+
+def atomic_and(ref, value):
+    """Set the element to the bitwise and of the element and value."""
+    raise NotImplementedError(NI)
+
+
+def atomic_or(ref, value):
+    """Set the element to the bitwise or of the element and value."""
+    raise NotImplementedError(NI)
+
+
+def atomic_xor(ref, value):
+    """Set the element to the bitwise xor of the element and value."""
+    raise NotImplementedError(NI)
+
+
+def atomic_exchange(ref, value):
+    """Set the element to value."""
+    raise NotImplementedError(NI)
+
+
+def atomic_compare_exchange(ref, compare, value):
+    """Set the element to value, but only if it is equal to compare."""
+    raise NotImplementedError(NI)
+
+
+# %% Subgroup operations
+
+# A subgroup is a set of invocations that run in lockstep on the GPU
+# (e.g. 32 or 64 of them). These functions operate on the value of all
+# active invocations in the subgroup. They need SpirV version 1.3.
+
+
+def subgroup_add(value):
+    """Get the sum of value over the subgroup."""
+    raise NotImplementedError(NI)
+
+
+def subgroup_min(value):
+    """Get the minimum of value over the subgroup."""
+    raise NotImplementedError(NI)
+
+
+def subgroup_max(value):
+    """Get the maximum of value over the subgroup."""
+    raise NotImplementedError(NI)
+
+
+def subgroup_inclusive_add(value):
+    """Get the sum of value over the invocations in the subgroup, up to
+    and including this one.
+    """
+    raise NotImplementedError(NI)
+
+
+def subgroup_exclusive_add(value):
+    """Get the sum of value over the invocations in the subgroup that
+    come before this one.
+    """
+    raise NotImplementedError(NI)
+
+
+def subgroup_ballot(condition):
+    """Get an ivec4 of which the bits are set for the invocations in the
+    subgroup for which condition is True.
+    """
+    raise NotImplementedError(NI)
+
+
+def subgroup_broadcast(value, id):
+    """Get value of the invocation with the given id (a constant i32)."""
+    raise NotImplementedError(NI)
+
+
+def subgroup_shuffle(value, id):
+    """Get value of the invocation with the given id (an i32)."""
+    raise NotImplementedError(NI)
+
+
 # %% Funcions from extension instruction sets
 
 # For the function definitions and docs, see:
@@ -396,4 +551,5 @@ def nclamp(x, min_val, max_val):
 
 # %% all
 
-__all__ = list(tex_functions) + list(ext_functions)
+__all__ = list(tex_functions) + list(sync_functions) + list(atomic_functions)
+__all__ += list(subgroup_functions) + list(ext_functions)
@@ -1,5 +1,7 @@
 import pyshader
 
+from pytest import raises
+
 
 def test_api():
     assert isinstance(pyshader.__version__, str)
@@ -30,6 +32,51 @@ def test_shader_module_class():
     assert isinstance(bb, bytes)
 
 
+def test_shader_module_spirv_cache():
+
+    ShaderModule = pyshader.ShaderModule
+    entrypoint = ("CO_ENTRYPOINT", "main", "vertex", {})
+    m = ShaderModule(42, [entrypoint], "stub")
+    assert m.cache_info() == {"hits": 0, "misses": 0, "size": 0}
+
+    # First call generates, second call is a hit
+    bb1 = m.to_spirv()
+    bb2 = m.to_spirv()
+    assert bb1 is bb2
+    assert m.cache_info() == {"hits": 1, "misses": 1, "size": 1}
+
+    # Metadata is cached with the same key
+    meta = m.get_spirv_metadata()
+    assert meta["bound"] > 1
+    assert "Capability_Shader" in meta["capabilities"]
+    assert meta["execution_modes"] == {}
+    assert m.cache_info()["hits"] == 2
+
+    # Invalid options are not cached
+    with raises(TypeError):
+        m.to_spirv(not_an_option=True)
+    assert m.cache_info()["size"] == 1
+
+    # Invalidate
+    m.invalidate()
+    assert m.cache_info()["size"] == 0
+    bb3 = m.to_spirv()
+    assert bb3 == bb1 and bb3 is not bb1
+    assert m.cache_info() == {"hits": 2, "misses": 3, "size": 1}
+
+
+def test_default_options():
+    from pyshader import _module, _generator_bc
+
+    cls = _generator_bc.Bytecode2SpirVGenerator
+    assert _module.DEFAULT_OPTIONS == cls.default_options
+    options = {"fold_constants": False, "eliminate_dead_code": True, "foo": 1}
+    assert _module.normalize_options(options) == {
+        "eliminate_dead_code": True,
+        "foo": 1,
+    }
+
+
 def test_spirv_constants():
     cc = pyshader._spirv_constants
     assert cc.AccessQualifier_ReadWrite
@@ -67,6 +114,30 @@ def test_that_bytecode_generator_matches_opcode_definitions():
     assert count > 12  # Just make sure we're not skipping all
 
 
+def test_opcode_dispatch_tables():
+    from pyshader import _generator_bc, _types
+    from pyshader import _spirv_constants as cc
+
+    cls = _generator_bc.Bytecode2SpirVGenerator
+    table = cls._get_method_table()
+    assert cls._get_method_table() is table  # cached
+    assert set(table) == {name for name in dir(cls) if name.startswith("co_")}
+
+    assert _generator_bc.get_type_kind(_types.f32) == (_types.f32, "float", "scalar")
+    assert _generator_bc.get_type_kind(_types.ivec3) == (_types.i32, "int", "vector")
+    assert _generator_bc.get_type_kind(_types.mat4) == (_types.f32, "float", "matrix")
+    assert _generator_bc.get_type_kind(_types.bvec2)[1:] == ("bool", "vector")
+
+    binary_opcodes = _generator_bc.BINARY_OPCODES
+    assert binary_opcodes[("idiv", "int", "vector")] == cc.OpSDiv
+    assert binary_opcodes[("mmul", "float", "vector")] == cc.OpDot
+    assert ("idiv", "float", "scalar") not in binary_opcodes
+    compare_opcodes = _generator_bc.COMPARE_OPCODES
+    assert compare_opcodes[("<", "int")] == cc.OpSLessThan
+    assert compare_opcodes[("!=", "int")] == cc.OpINotEqual
+    assert compare_opcodes[(">=", "float")] == cc.OpFOrdGreaterThanEqual
+
+
 def test_some_internal_apis_too():
     x = pyshader._generator_base.AnyId()
     assert "?" in repr(x)
@@ -74,3 +145,111 @@ def test_some_internal_apis_too():
     assert "23" in repr(x)
     x = pyshader._generator_base.AnyId("foo")
     assert "foo" in repr(x)
+
+    # Ids are small objects without a __dict__
+    for x in [
+        pyshader._generator_base.AnyId(),
+        pyshader._generator_base.TypeId(pyshader.f32),
+        pyshader._generator_base.ValueId(pyshader.f32),
+        pyshader._generator_base.VariableAccessId(None, 0, pyshader.f32),
+        pyshader._generator_base.WordPlaceholder(0),
+    ]:
+        assert not hasattr(x, "__dict__")
+
+
+def test_spirv_dump():
+    from io import BytesIO
+    from pyshader._generator_bc import Bytecode2SpirVGenerator
+
+    entrypoint = ("CO_ENTRYPOINT", "main", "vertex", {})
+    gen = Bytecode2SpirVGenerator()
+    gen.convert([entrypoint])
+    bb = gen.dump()
+    assert isinstance(bb, bytes)
+    assert len(bb) % 4 == 0
+    assert bb[:4] == (0x07230203).to_bytes(4, "little")
+
+    # As a memoryview
+    m = gen.dump(as_memoryview=True)
+    assert isinstance(m, memoryview)
+    assert m.nbytes == len(bb) and m == bb
+
+    # Into a bytearray or file
+    buffer = bytearray(b"xx")
+    assert gen.dump(out=buffer) == len(bb)
+    assert buffer == b"xx" + bb
+    f = BytesIO()
+    assert gen.dump(out=f) == len(bb)
+    assert f.getvalue() == bb
+
+
+def test_spirv_words():
+    from pyshader._generator_base import str_to_words, bytes_to_words
+
+    # Strings are zero-terminated and padded
+    assert str_to_words("") == (0,)
+    assert str_to_words("abc") == (0x00636261,)
+    assert str_to_words("abcd") == (0x64636261, 0)
+    # Bytes can be multiple words (e.g. 64 bit constants)
+    assert bytes_to_words(b"\x01\x00\x00\x00\x02\x00\x00\x00") == (1, 2)
+    with raises(RuntimeError):
+        bytes_to_words(b"\x01\x00")
+
+
+def test_function_layout():
+    from pyshader import _spirv_constants as cc
+    from pyshader._generator_base import BaseSpirVGenerator
+
+    def function(name, nparams, nblocks):
+        instructions = [(cc.OpFunction, name)]
+        instructions += [(cc.OpFunctionParameter, name, i) for i in range(nparams)]
+        instructions.append((cc.OpLabel, name, 0))
+        for i in range(nblocks):
+            instructions.append((cc.OpVariable, name, i))
+            instructions.append((cc.OpStore, name, i))
+            instructions.append((cc.OpLabel, name, i + 1))
+        instructions.append((cc.OpFunctionEnd, name))
+        return instructions
+
+    # Multiple functions, one with params, one big one (10k+ instructions)
+    instructions = function("a", 0, 2) + function("b", 2, 3) + function("c", 0, 4000)
+    result = BaseSpirVGenerator()._layout_functions(instructions)
+    assert sorted(result) == sorted(instructions)
+
+    assert [x[0] for x in result[:11]] == [
+        cc.OpFunction,
+        cc.OpLabel,
+        cc.OpVariable,
+        cc.OpVariable,
+        cc.OpStore,
+        cc.OpLabel,
+        cc.OpStore,
+        cc.OpLabel,
+        cc.OpFunctionEnd,
+        cc.OpFunction,
+        cc.OpFunctionParameter,
+    ]
+    b = [x for x in result if x[1] == "b"]
+    assert [x[0] for x in b[3:7]] == [cc.OpLabel] + [cc.OpVariable] * 3
+    c = [x for x in result if x[1] == "c"]
+    assert all(x[0] == cc.OpVariable for x in c[2:4002])
+    assert [x[2] for x in c[2:4002]] == list(range(4000))
+    assert c[-1][0] == cc.OpFunctionEnd
+
+
+def test_branch_tree():
+    from pyshader._generator_bc import Branch
+
+    root = Branch(None, 0, "")
+    a, b = Branch(root, 0, "a"), Branch(root, 1, "b")
+    root.set_children([a, b])
+    c, d = Branch(b, 0, "c"), Branch(b, 1, "d")
+    b.set_children([c, d])
+    assert [x.depth for x in (root, a, c)] == [0, 1, 2]
+    assert sorted([d, a, c], key=lambda x: x.path) == [a, c, d]
+
+    # Children that are removed are detached, including their children
+    root.set_children([a])
+    assert not a.detached
+    assert b.detached and c.detached and d.detached
+    assert Branch(d, 0, "e").detached
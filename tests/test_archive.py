@@ -0,0 +1,86 @@
+"""
+Tests for the memory-mapped shader archive.
+"""
+
+import os
+
+import pyshader
+from pyshader import _archive
+
+from pytest import raises
+
+
+def get_entries(n):
+    entries = []
+    for i in range(n):
+        name = f"module:shader{i}"
+        spirv = bytes(range(i % 7, i % 7 + 4 * (i % 5 + 1)))
+        entries.append((name, spirv, {"bound": i}))
+        # A variant with options
+        key = _archive.get_archive_key(name, {"foo": True})
+        entries.append((key, spirv[::-1], {"bound": i, "foo": True}))
+    return entries
+
+
+def test_archive_roundtrip(tmpdir):
+    filename = os.path.join(str(tmpdir), "shaders.psa")
+    entries = get_entries(100)
+    pyshader.write_archive(filename, entries)
+
+    archive = pyshader.ShaderArchive(filename)
+    assert len(archive) == 200
+    assert "module:shader0" in archive
+    assert "module:shader99" in archive
+    assert "module:shader100" not in archive
+    assert "200 entries" in repr(archive)
+
+    for i in range(100):
+        name, spirv, meta = entries[i * 2]
+        spirv2 = archive.get_spirv(name)
+        assert isinstance(spirv2, memoryview)
+        assert spirv2 == spirv
+        assert archive.lookup(name)[1] == meta
+        spirv3, meta3 = archive.lookup(name, {"foo": True})
+        assert spirv3 == spirv[::-1]
+        assert meta3 == {"bound": i, "foo": True}
+        assert archive.lookup(name, {"foo": False}) is None
+
+    with raises(KeyError):
+        archive.get_spirv("module:shader100")
+
+    del spirv2, spirv3
+    archive.close()
+
+
+def test_archive_module(tmpdir):
+    filename = os.path.join(str(tmpdir), "shaders.psa")
+    entries = get_entries(3)
+    _archive.write_archive(filename, entries)
+    archive = pyshader.ShaderArchive(filename)
+
+    m = archive.get_module("module:shader1")
+    assert isinstance(m, pyshader.ShaderModule)
+    assert m.to_spirv() == entries[2][1]
+    assert isinstance(m.to_spirv(), memoryview)
+    assert m.get_spirv_metadata() == {"bound": 1}
+    assert m.to_spirv(foo=True) == entries[3][1]
+    assert m.cache_info() == {"hits": 2, "misses": 2, "size": 2}
+
+    # Variants that are not in the archive cannot be generated
+    with raises(RuntimeError):
+        m.to_spirv(foo=False)
+
+    with raises(KeyError):
+        archive.get_module("module:shader3")
+
+
+def test_archive_errors(tmpdir):
+    filename = os.path.join(str(tmpdir), "shaders.psa")
+
+    with raises(ValueError):
+        _archive.write_archive(filename, [("a", b"", {}), ("a", b"", {})])
+
+    with open(filename, "wb") as f:
+        f.write(b"not an archive")
+    with raises(ValueError):
+        pyshader.ShaderArchive(filename)
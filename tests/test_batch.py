@@ -0,0 +1,71 @@
+"""
+Tests for compiling multiple shaders at once.
+"""
+
+import pyshader
+from pyshader import i32, ivec3, Array
+
+from pytest import raises
+
+
+def compute_shader1(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data: ("buffer", 0, Array(i32)),
+):
+    data[index.x] = index.x
+
+
+def compute_shader2(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data: ("buffer", 0, Array(i32)),
+):
+    data[index.x] = index.x * 2
+
+
+def compute_shader3(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data: ("buffer", 0, Array(i32)),
+):
+    data[index.x] = index.x * 3
+
+
+funcs = [compute_shader1, compute_shader2, compute_shader3]
+
+
+def test_compile_many_serial():
+    modules = pyshader.compile_many(funcs, workers=1)
+    assert len(modules) == 3
+    for func, m in zip(funcs, modules):
+        assert isinstance(m, pyshader.ShaderModule)
+        assert m.input is func
+        assert m.cache_info()["size"] == 1
+        assert m.to_spirv() == pyshader.python2shader(func).to_spirv()
+        assert m.cache_info()["hits"] == 1
+
+
+def test_compile_many_processes():
+    modules = pyshader.compile_many(funcs, workers=2)
+    assert len(modules) == 3
+    for func, m in zip(funcs, modules):
+        assert m.cache_info()["size"] == 1
+        m_ref = pyshader.python2shader(func)
+        assert m.to_spirv() == m_ref.to_spirv()
+        assert m.get_spirv_metadata() == m_ref.get_spirv_metadata()
+        assert m.cache_info()["misses"] == 1  # only the initial lookup
+
+
+def test_compile_many_modules():
+    m1 = pyshader.python2shader(compute_shader1)
+    spirv1 = m1.to_spirv()
+    m2 = pyshader.python2shader(compute_shader2, lazy=True)
+
+    # Modules are passed through, already compiled ones are not compiled again
+    modules = pyshader.compile_many([m1, m2, m2], workers=2)
+    assert modules[0] is m1 and modules[1] is m2 and modules[2] is m2
+    assert m1.to_spirv() == spirv1
+    assert m1.cache_info()["size"] == 1
+    assert m2.cache_info()["size"] == 1
+
+    # Invalid options are reported
+    with raises(TypeError):
+        pyshader.compile_many([m1], workers=2, not_an_option=True)
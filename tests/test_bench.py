@@ -0,0 +1,82 @@
+"""
+Tests for the benchmark runner (not the benchmark itself).
+"""
+
+import os
+import json
+
+from pyshader import bench
+
+
+def test_bench_corpus():
+    corpus = bench.get_corpus(synthetic_sizes=(4, 8))
+    assert len(corpus["examples"]) >= 9
+    assert len(corpus["tests"]) > 50
+    assert len(corpus["synthetic"]) == 2
+    assert len(corpus["conditions"]) == 2
+    assert len(corpus["nested"]) == 2
+    for funcs in corpus.values():
+        assert all(callable(func) for func in funcs)
+
+
+def compute_shader_broken(
+    index: ("input", "GlobalInvocationId", "ivec3"),
+):
+    index = 3  # noqa - cannot store to input
+
+
+def test_bench_run():
+    corpus = {"synthetic": [bench._get_synthetic_shader(n) for n in (4, 8)]}
+    corpus["tests"] = [compute_shader_broken]
+    results = bench.run_benchmark(corpus, repeat=1)
+    assert results["shaders"] == 2
+    assert results["failures"] == {"synthetic": [], "tests": ["compute_shader_broken"]}
+    assert results["shaders_per_second"] > 0
+    assert results["peak_memory"] > 0
+    assert results["peak_rss"] is None or results["peak_rss"] > results["peak_memory"]
+    assert results["output_size"] > 0
+    assert "decode" in results["phases"] and "dump" in results["phases"]
+    json.dumps(results)
+
+    # Compare with itself: no regressions
+    comparison = bench.compare_results(results, results)
+    assert len(comparison) == len(bench.METRICS) + len(results["phases"]) + 1
+    assert not any(regressed for *_, regressed in comparison)
+
+    # Compare with a faster baseline
+    baseline = results.copy()
+    baseline["shaders_per_second"] *= 2
+    baseline["total_time"] /= 2
+    comparison = {c[0]: c for c in bench.compare_results(results, baseline, 0.1)}
+    assert comparison["shaders_per_second"][-1]
+    assert comparison["total_time"][-1]
+    assert not comparison["output_size"][-1]
+    assert not comparison["failures"][-1]
+
+    # More shaders that fail is a regression
+    baseline = results.copy()
+    baseline["failures"] = {"tests": []}
+    comparison = {c[0]: c for c in bench.compare_results(results, baseline, 0.1)}
+    assert comparison["failures"][1:3] == (0, 1)
+    assert comparison["failures"][-1]
+
+
+def test_bench_scaling():
+    scaling = bench.run_scaling((4, 16))
+    assert [item["size"] for item in scaling] == [4, 16]
+    assert scaling[0]["instructions"] < scaling[1]["instructions"]
+    assert "post_convert" in scaling[1]["phases"]
+
+
+def test_bench_main(tmpdir, monkeypatch):
+    corpus = {"synthetic": [bench._get_synthetic_shader(4)]}
+    monkeypatch.setattr(bench, "get_corpus", lambda: corpus)
+    filename = os.path.join(str(tmpdir), "results.json")
+    assert bench.main(["-o", filename, "--repeat", "1"]) == 0
+    assert (
+        bench.main(["--compare", filename, "--threshold", "100", "--repeat", "1"]) == 0
+    )
+
+    # Shaders that fail to compile are reported, and fail the run
+    corpus["synthetic"].append(compute_shader_broken)
+    assert bench.main(["--repeat", "1"]) == 1
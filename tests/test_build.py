@@ -0,0 +1,149 @@
+"""
+Tests for ahead-of-time compilation and loading of precompiled shaders.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+import pyshader
+
+
+SHADER_CODE = """
+from pyshader import python2shader, i32, ivec3, Array
+
+@python2shader
+def compute_shader(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data: ("buffer", (0, 1), Array(i32)),
+):
+    data[index.x] = index.x
+"""
+
+OTHER_CODE = """
+from pyshader import python2shader, vec4
+from .shaders import compute_shader  # not found twice
+
+@python2shader
+def vertex_shader(out_pos: ("output", "Position", vec4)):
+    out_pos = vec4(0.0, 0.0, 0.0, 1.0)  # noqa
+"""
+
+
+def make_package(tmpdir, name):
+    dirname = os.path.join(str(tmpdir), name)
+    os.mkdir(dirname)
+    for fname, code in [
+        ("__init__.py", ""),
+        ("shaders.py", SHADER_CODE),
+        ("other.py", OTHER_CODE),
+    ]:
+        with open(os.path.join(dirname, fname), "wb") as f:
+            f.write(code.encode())
+
+
+def test_build_and_load(monkeypatch, tmpdir):
+    make_package(tmpdir, "aot_pkg1")
+    monkeypatch.syspath_prepend(str(tmpdir))
+    outdir = os.path.join(str(tmpdir), "out")
+
+    from pyshader._build import build_shaders
+
+    manifest = build_shaders(["aot_pkg1"], outdir, workers=1)
+    names = ["aot_pkg1.other:vertex_shader", "aot_pkg1.shaders:compute_shader"]
+    assert sorted(manifest["shaders"]) == names
+    with open(os.path.join(outdir, "manifest.json"), "rb") as f:
+        assert json.loads(f.read().decode()) == manifest
+
+    info = manifest["shaders"]["aot_pkg1.shaders:compute_shader"]
+    assert info["qualname"] == "compute_shader"
+    assert info["shader_type"] == "compute"
+    assert info["resources"] == [
+        {
+            "name": "index",
+            "kind": "input",
+            "slot": "GlobalInvocationId",
+            "type": "Vector(3,i32)",
+        },
+        {"name": "data", "kind": "buffer", "slot": [0, 1], "type": "Array(i32)"},
+    ]
+    assert manifest["shaders"]["aot_pkg1.other:vertex_shader"]["shader_type"] == (
+        "vertex"
+    )
+
+    # Load the compiled shaders
+    compute_shader = sys.modules["aot_pkg1.shaders"].compute_shader
+    modules = pyshader.load_shaders(outdir)
+    assert sorted(modules) == names
+    m = modules["aot_pkg1.shaders:compute_shader"]
+    assert isinstance(m, pyshader.ShaderModule)
+    assert m.to_spirv() == compute_shader.to_spirv()
+    assert m.get_spirv_metadata() == compute_shader.get_spirv_metadata()
+    assert m.cache_info()["misses"] == 0
+    assert m.to_bytecode() == compute_shader.to_bytecode()
+
+    # The code hash includes the execution modes, e.g. the workgroup size
+    from pyshader._cache import get_function_hash
+    from pyshader._build import _get_execution_modes
+
+    assert info["code_hash"] == get_function_hash(compute_shader.input, {})
+    m8 = pyshader.python2shader(compute_shader.input, workgroup_size=8)
+    modes = {"LocalSize": [8, 1, 1]}
+    assert _get_execution_modes(m8.to_bytecode()) == modes
+    assert info["code_hash"] != get_function_hash(compute_shader.input, modes)
+
+
+def test_build_cli(tmpdir):
+    make_package(tmpdir, "aot_pkg2")
+    outdir = os.path.join(str(tmpdir), "out")
+    env = os.environ.copy()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join([str(tmpdir), root])
+    cmd = [sys.executable, "-m", "pyshader", "build", "aot_pkg2.shaders"]
+    cmd += ["-o", outdir]
+    subprocess.check_output(cmd, env=env, cwd=str(tmpdir))
+    assert "aot_pkg2.shaders:compute_shader" in pyshader.load_shaders(outdir)
+
+
+def test_build_archive(monkeypatch, tmpdir):
+    make_package(tmpdir, "aot_pkg3")
+    monkeypatch.syspath_prepend(str(tmpdir))
+    filename = os.path.join(str(tmpdir), "shaders.psa")
+
+    from pyshader.__main__ import main
+
+    assert main(["build", "aot_pkg3", "--archive", filename, "-j", "1"]) == 0
+
+    compute_shader = sys.modules["aot_pkg3.shaders"].compute_shader
+    archive = pyshader.ShaderArchive(filename)
+    assert len(archive) == 2
+    m = archive.get_module("aot_pkg3.shaders:compute_shader")
+    assert m.to_spirv() == compute_shader.to_spirv()
+    assert m.get_spirv_metadata() == compute_shader.get_spirv_metadata()
+
+
+def test_load_without_compiler(monkeypatch, tmpdir):
+    make_package(tmpdir, "aot_pkg4")
+    monkeypatch.syspath_prepend(str(tmpdir))
+    outdir = os.path.join(str(tmpdir), "out")
+
+    from pyshader._build import build_shaders
+
+    build_shaders(["aot_pkg4.shaders"], outdir, workers=1)
+
+    # Load the shaders in a fresh process, and check what got imported
+    code = f"""if True:
+        import sys, pyshader
+        m = pyshader.load_shaders({outdir!r})["aot_pkg4.shaders:compute_shader"]
+        assert isinstance(m.to_spirv(), bytes)
+        print(" ".join(sys.modules))
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = os.environ.copy()
+    env["PYTHONPATH"] = root
+    out = subprocess.check_output([sys.executable, "-c", code], env=env)
+    modules = out.decode().split()
+    assert "pyshader._precompiled" in modules
+    for name in ["pyshader.py", "pyshader._generator_bc", "pyshader._types"]:
+        assert name not in modules
@@ -0,0 +1,103 @@
+"""
+Tests for the persistent on-disk compile cache.
+"""
+
+import os
+
+import pyshader
+from pyshader import _cache, i32, ivec3, Array
+
+
+def compute_shader(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data: ("buffer", 0, Array(i32)),
+):
+    data[index.x] = index.x
+
+
+def compute_shader_other(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data: ("buffer", 0, Array(i32)),
+):
+    data[index.x] = index.x + 1
+
+
+def get_cache_files(cache_dir):
+    return sorted(fname for fname in os.listdir(cache_dir) if fname.endswith(".spv"))
+
+
+def test_function_hash():
+    h1 = _cache.get_function_hash(compute_shader)
+    h2 = _cache.get_function_hash(compute_shader_other)
+    h3 = _cache.get_function_hash(compute_shader, {"foo": 1})
+    assert h1 == _cache.get_function_hash(compute_shader)
+    assert len({h1, h2, h3}) == 3
+
+
+def test_cache_disabled(monkeypatch):
+    monkeypatch.delenv("PYSHADER_CACHE_DIR", raising=False)
+    m = pyshader.python2shader(compute_shader)
+    assert m._disk_cache_key is None
+
+
+def test_cache_roundtrip(monkeypatch, tmpdir):
+    cache_dir = str(tmpdir)
+    monkeypatch.setenv("PYSHADER_CACHE_DIR", cache_dir)
+
+    # First compile fills the cache
+    m1 = pyshader.python2shader(compute_shader)
+    spirv1 = m1.to_spirv()
+    key = m1._disk_cache_key
+    assert os.path.isfile(os.path.join(cache_dir, key + ".bc"))
+    assert len(get_cache_files(cache_dir)) == 1
+
+    # Second compile comes from the cache (without compiling)
+    assert _cache.load_bytecode(key) == m1.to_bytecode()
+    m2 = pyshader.python2shader(compute_shader)
+    assert m2.to_bytecode() == m1.to_bytecode()
+    assert m2.to_spirv() == spirv1
+    assert m2.get_spirv_metadata() == m1.get_spirv_metadata()
+    assert len(get_cache_files(cache_dir)) == 1
+
+    # The spirv is keyed by the options too
+    assert _cache.load_spirv(key, {}) is not None
+    assert _cache.load_spirv(key, {"foo": 1}) is None
+
+    # Options with their default value are left out
+    assert m2.to_spirv(fold_constants=False) is m2.to_spirv()
+    assert m2.cache_info()["size"] == 1
+    assert len(get_cache_files(cache_dir)) == 1
+
+    # After invalidating, the spirv is re-generated instead of loaded
+    _cache.store_spirv(key, {}, b"xxxx", {})
+    assert pyshader.python2shader(compute_shader).to_spirv() == b"xxxx"
+    m2.invalidate()
+    assert m2.to_spirv() == spirv1
+    assert _cache.load_spirv(key, {})[0] == spirv1
+
+    # And the bytecode by the workgroup size
+    m3 = pyshader.python2shader(compute_shader, workgroup_size=8)
+    assert m3._disk_cache_key != key
+    assert m3.workgroup_size == (8, 1, 1)
+    assert pyshader.python2shader(compute_shader).workgroup_size == (1, 1, 1)
+
+    # No temporary files are left behind
+    assert not [fname for fname in os.listdir(cache_dir) if fname.startswith(".tmp")]
+
+
+def test_cache_eviction(monkeypatch, tmpdir):
+    cache_dir = str(tmpdir)
+    monkeypatch.setenv("PYSHADER_CACHE_DIR", cache_dir)
+
+    pyshader.python2shader(compute_shader).to_spirv()
+    old_files = set(os.listdir(cache_dir))
+    size = sum(os.path.getsize(os.path.join(cache_dir, f)) for f in old_files)
+    # Make the old entries look old
+    for fname in old_files:
+        os.utime(os.path.join(cache_dir, fname), (1, 1))
+
+    # Limit the size, so that the old entries must be evicted
+    monkeypatch.setenv("PYSHADER_CACHE_SIZE", str(size))
+    pyshader.python2shader(compute_shader_other).to_spirv()
+    new_files = set(os.listdir(cache_dir))
+    assert new_files and not new_files.intersection(old_files)
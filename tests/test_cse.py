@@ -0,0 +1,52 @@
+"""
+Tests for the elimination of common subexpressions.
+"""
+
+from pyshader import python2shader, ivec3, vec4, Array
+from pyshader import _spirv_constants as cc
+
+from testutils import get_generator, get_function_opcodes
+from testutils import validate_module, run_test_and_print_new_hashes
+
+
+def compute_shader(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data1: ("buffer", 0, Array(vec4)),
+):
+    i = index.x
+    a = data1[i]
+    n = normalize(a.xyz) + normalize(a.xyz)  # noqa
+    data1[i] = vec4(n, 1.0)
+    b = data1[i]  # must not re-use the earlier load of data1[i]
+    data1[i] = b * 2.0
+
+
+def test_cse():
+    m = python2shader(compute_shader)
+    opcodes1 = get_function_opcodes(get_generator(m))
+    assert opcodes1.count(cc.OpExtInst) == 2
+    assert opcodes1.count(cc.OpVectorShuffle) == 2
+
+    gen = get_generator(m, eliminate_common_subexpressions=True)
+    opcodes2 = get_function_opcodes(gen)
+    assert len(opcodes2) < len(opcodes1)
+    assert opcodes2.count(cc.OpExtInst) == 1
+    assert opcodes2.count(cc.OpVectorShuffle) == 1
+    # The second load of a and i are re-used, but after storing into data1,
+    # i and data1[i] are loaded again
+    assert opcodes2.count(cc.OpLoad) == opcodes1.count(cc.OpLoad) - 3
+    assert opcodes2.count(cc.OpStore) == opcodes1.count(cc.OpStore)
+
+
+def test_cse_hashes():
+    m = python2shader(compute_shader)
+    validate_module(m, HASHES, options={"eliminate_common_subexpressions": True})
+
+
+HASHES = {
+    "compute_shader": ("667638c597c811f1", "e76dff9acbd45b9b"),
+}
+
+
+if __name__ == "__main__":
+    run_test_and_print_new_hashes(globals())
@@ -0,0 +1,83 @@
+"""
+Tests for the elimination of dead code.
+"""
+
+from pyshader import python2shader, f32, ivec3, Array
+from pyshader import _spirv_constants as cc
+from pyshader._generator_base import AnyId
+
+from testutils import get_generator, get_function_opcodes
+from testutils import validate_module, run_test_and_print_new_hashes
+
+
+def compute_shader(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data1: ("buffer", 0, Array(f32)),
+):
+    i = index.x
+    unused = data1[i] * 3.0  # noqa
+    tmp = 2.0
+    tmp = tmp + 1.0
+    for j in range(3):
+        data1[i] = data1[i] + 1.0
+
+
+def get_names(gen):
+    return [instr[2] for instr in gen._sections["debug"] if instr[0] == cc.OpName]
+
+
+def test_dce_off_by_default():
+    gen = get_generator(python2shader(compute_shader))
+    assert "unused" in get_names(gen)
+    assert "tmp" in get_names(gen)
+
+
+def test_dce():
+    m = python2shader(compute_shader)
+    gen1 = get_generator(m)
+    gen2 = get_generator(m, eliminate_dead_code=True)
+    assert len(gen2.dump()) < len(gen1.dump())
+    assert gen2.get_metadata()["bound"] < gen1.get_metadata()["bound"]
+
+    # Unused variables, their computations and their names are removed
+    names = get_names(gen2)
+    assert "unused" not in names and "3.0" not in names
+    assert "tmp" not in names and "2.0" not in names
+    assert "i" in names and "j" in names and "data1" in names
+    opcodes = get_function_opcodes(gen2)
+    assert cc.OpFMul not in opcodes
+    assert opcodes.count(cc.OpFAdd) == 1
+    assert opcodes.count(cc.OpStore) == 7  # i, j (2x), j-step, j-stop, j-start, data1
+
+    # No duplicate pointer types
+    types = gen2._sections["types"]
+    pointers = [(i[2], i[3].id) for i in types if i[0] == cc.OpTypePointer]
+    assert len(pointers) == len(set(pointers))
+
+    # The ids are compact, and all references are defined
+    ids = set()
+    for instructions in gen2._sections.values():
+        for instr in instructions:
+            ids.update(word.id for word in instr if isinstance(word, AnyId))
+    assert ids == set(range(1, gen2.get_metadata()["bound"]))
+
+    # Including the labels that branches refer to by number
+    functions = gen2._sections["functions"]
+    labels = {instr[1].id for instr in functions if instr[0] == cc.OpLabel}
+    targets = [instr[1] for instr in functions if instr[0] == cc.OpBranch]
+    targets = [x.id if isinstance(x, AnyId) else x for x in targets]
+    assert targets and set(targets) <= labels
+
+
+def test_dce_hashes():
+    m = python2shader(compute_shader)
+    validate_module(m, HASHES, options={"eliminate_dead_code": True})
+
+
+HASHES = {
+    "compute_shader": ("7f24f79db55b098f", "c3a7b91b77ee7e13"),
+}
+
+
+if __name__ == "__main__":
+    run_test_and_print_new_hashes(globals())
@@ -0,0 +1,139 @@
+"""
+Tests for constant folding.
+"""
+
+import math
+import struct
+
+from pyshader import python2shader, f32, i32, i16, u8, vec3, ivec3, bvec3, Array
+from pyshader import _folding, _types
+from pyshader import _spirv_constants as cc
+from pyshader._generator_bc import Bytecode2SpirVGenerator
+
+from pytest import raises
+
+from testutils import get_generator, get_function_opcodes
+from testutils import validate_module, run_test_and_print_new_hashes
+
+
+def test_fold_float():
+    # Results are rounded to f32
+    assert _folding.fold_binary_op("mul", f32, 2.0, f32, 0.1) == (
+        f32,
+        _folding.normalize(f32, 0.2),
+    )
+    assert _folding.fold_binary_op("mul", _types.f64, 2.0, _types.f64, 0.1) == (
+        _types.f64,
+        0.2,
+    )
+    assert _folding.fold_binary_op("add", f32, 3e38, f32, 3e38) == (f32, math.inf)
+    # Division by zero, -0.0 and mod are not folded
+    assert _folding.fold_binary_op("div", f32, 1.0, f32, 0.0) is None
+    assert _folding.fold_binary_op("mul", f32, -1.0, f32, 0.0) is None
+    assert _folding.fold_binary_op("mod", f32, 3.0, f32, 2.0) is None
+    # Int ops on floats are not folded
+    assert _folding.fold_binary_op("idiv", f32, 3.0, f32, 2.0) is None
+
+
+def test_fold_int():
+    # Integers wrap around
+    assert _folding.fold_binary_op("add", i32, 2147483647, i32, 1) == (i32, -2147483648)
+    assert _folding.fold_binary_op("mul", u8, 16, u8, 17) == (u8, 16)
+    assert _folding.fold_binary_op("sub", u8, 0, u8, 1) == (u8, 255)
+    # Division truncates, mod has the sign of the divisor, rem that of the dividend
+    assert _folding.fold_binary_op("idiv", i32, -7, i32, 2) == (i32, -3)
+    assert _folding.fold_binary_op("mod", i32, -7, i32, 2) == (i32, 1)
+    assert _folding.fold_binary_op("rem", i32, -7, i32, 2) == (i32, -1)
+    assert _folding.fold_binary_op("idiv", i32, 7, i32, 0) is None
+    # Signed ops interpret unsigned ints as signed
+    assert _folding.fold_binary_op("idiv", u8, 200, u8, 2) == (u8, 228)
+    assert _folding.fold_compare("<", u8, 200, 2) == (_types.boolean, True)
+    assert _folding.fold_unary_op("neg", i32, -2147483648) == (i32, -2147483648)
+
+
+def test_fold_compare_and_convert():
+    assert _folding.fold_compare("<", f32, 1.0, 2.0) == (_types.boolean, True)
+    assert _folding.fold_compare("!=", f32, math.nan, 2.0) == (_types.boolean, False)
+    assert _folding.fold_compare(">=", ivec3, (1, 2, 3), (3, 2, 1)) == (
+        bvec3,
+        (False, True, True),
+    )
+    assert _folding.fold_convert(i32, i32, f32, -7.9) == (i32, -7)
+    assert _folding.fold_convert(i32, i32, f32, 3e9) is None
+    assert _folding.fold_convert(u8, u8, i32, -1) == (u8, 255)
+    assert _folding.fold_convert(i32, i32, u8, 255) == (i32, -1)  # OpSConvert
+    assert _folding.fold_convert(f32, f32, _types.f64, 0.1)[1] != 0.1
+    assert _folding.fold_convert(vec3, f32, i32, (1, 2, 3)) == (vec3, (1.0, 2.0, 3.0))
+    assert _folding.fold_convert(_types.boolean, _types.boolean, f32, math.nan) == (
+        _types.boolean,
+        False,
+    )
+
+
+def compute_shader(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data1: ("buffer", 0, Array(f32)),
+    data2: ("buffer", 1, Array(vec3)),
+    data3: ("buffer", 2, Array(i32)),
+):
+    i = index.x
+    data1[i] = data1[i] * (2.0 * math.pi / 360.0)
+    data2[i] = vec3(1.0, 2.0, 3.0) * 0.5 + vec3(ivec3(1, 2, 3))
+    data3[i] = i32(2147483647) + 1 + i32(7.9) + i32(3 < 4)
+
+
+def test_fold_constants_in_shader():
+    m = python2shader(compute_shader)
+
+    # Off by default
+    opcodes = get_function_opcodes(get_generator(m))
+    assert opcodes.count(cc.OpFMul) == 2
+    assert cc.OpIAdd in opcodes and cc.OpConvertSToF in opcodes
+
+    gen = get_generator(m, fold_constants=True)
+    opcodes = get_function_opcodes(gen)
+    assert opcodes.count(cc.OpFMul) == 1  # data1[i] * constant
+    for opcode in (cc.OpFDiv, cc.OpFAdd, cc.OpIAdd, cc.OpConvertSToF, cc.OpSelect):
+        assert opcode not in opcodes
+
+    values = {(c.type, v) for c, v in gen._constant_values.items()}
+    two_pi = _folding.normalize(f32, 2 * _folding.normalize(f32, math.pi))
+    assert (f32, _folding.normalize(f32, two_pi / 360)) in values
+    assert (vec3, (1.5, 3.0, 4.5)) in values
+    assert (i32, -2147483640) in values
+
+    with raises(TypeError):
+        Bytecode2SpirVGenerator(fold_constant=True)
+
+
+def test_fold_narrow_constants():
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        data[index.x] = i32(i16(-3.0)) + i32(u8(200))
+
+    m = python2shader(compute_shader)
+    gen = get_generator(m, fold_constants=True)
+    values = {(c.type, v) for c, v in gen._constant_values.items()}
+    assert (i16, -3) in values and (u8, 200) in values
+    assert (i32, -59) in values
+
+    # Constants narrower than 32 bits are extended to a full word
+    spirv = m.to_spirv(fold_constants=True)
+    assert len(spirv) % 4 == 0
+    assert struct.pack("<i", -3) in spirv
+
+
+def test_fold_constants_hashes():
+    m = python2shader(compute_shader)
+    validate_module(m, HASHES, options={"fold_constants": True})
+
+
+HASHES = {
+    "compute_shader": ("3ccd550cbeae80b7", "461dead302c7db41"),
+}
+
+
+if __name__ == "__main__":
+    run_test_and_print_new_hashes(globals())
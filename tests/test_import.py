@@ -0,0 +1,90 @@
+"""
+Tests (and a benchmark) for the import time of pyshader. Importing pyshader
+should not import the compiler, so that it's fast.
+"""
+
+import sys
+import subprocess
+
+import pyshader
+
+
+COMPILER_MODULES = [
+    "pyshader.py",
+    "pyshader.stdlib",
+    "pyshader._dis",
+    "pyshader._generator_base",
+    "pyshader._generator_bc",
+    "pyshader._spirv_constants",
+    "pyshader._types",
+]
+
+
+def run_python(code, *args):
+    cmd = [sys.executable, *args, "-c", code]
+    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert p.returncode == 0, p.stderr.decode()
+    return p.stdout.decode(), p.stderr.decode()
+
+
+def get_import_time(code):
+    """Get the time in microseconds spent importing pyshader (sub)modules,
+    using Python's -X importtime.
+    """
+    _, log = run_python(code, "-X", "importtime")
+    total = 0
+    for line in log.splitlines():
+        parts = line.split("|")
+        # Only count the top-level imports; nested ones are included in these
+        if len(parts) == 3 and parts[2].startswith(" pyshader"):
+            total += int(parts[1])
+    return total
+
+
+def test_import_is_lazy():
+    code = "import sys, pyshader; print(' '.join(sys.modules))"
+    modules = run_python(code)[0].split()
+    assert "pyshader" in modules
+    for name in COMPILER_MODULES:
+        assert name not in modules
+
+
+def test_lazy_attributes():
+    assert isinstance(pyshader.vec3, type)
+    assert pyshader.vec3 is pyshader._types.vec3
+    assert pyshader.python2shader is pyshader.py.python2shader
+    assert callable(pyshader.dev.glsl2spirv)
+    assert "python2shader" in dir(pyshader)
+    assert "_generator_bc" in dir(pyshader)
+
+    from pyshader import compile_many, Array  # noqa
+
+    ns = {}
+    exec("from pyshader import *", ns, ns)
+    assert "python2shader" in ns and "ShaderModule" in ns and "ivec3" in ns
+    assert "sys" not in ns
+
+    try:
+        pyshader.not_an_attribute
+    except AttributeError:
+        pass
+    else:  # pragma: no cover
+        assert False, "expected AttributeError"
+
+
+def test_spirv_constants_are_lazy():
+    cc = pyshader._spirv_constants
+    assert cc.OpTypeInt is cc.OpTypeInt
+    assert cc.OpTypeInt == 21 and repr(cc.OpTypeInt) == "OpTypeInt"
+    assert cc.builtins["Position"] is cc.BuiltIn_Position
+    assert "Decoration_Binding" in dir(cc)
+    assert not hasattr(cc, "NotASpirVConstant")
+
+
+def test_import_time():
+    # Benchmark: the lazy import should be way faster than the full import
+    t_lazy = min(get_import_time("import pyshader") for i in range(3))
+    code = "import pyshader; pyshader.python2shader, pyshader._generator_bc.cc.builtins"
+    t_full = min(get_import_time(code) for i in range(3))
+    print(f"import pyshader: {t_lazy} us, with compiler: {t_full} us")
+    assert t_lazy < 0.5 * t_full
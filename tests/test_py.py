@@ -398,6 +398,468 @@ def test_errror_reports_the_correct_name2():
     assert "variables: bar[0], 1.0" in str(info2.value).lower()
 
 
+def test_python2shader_lazy(monkeypatch):
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+    ):
+        foo = 3.0
+        bar = foo + index.x  # noqa - error is only detected in spirv stage
+
+    def compute_shader_invalid(
+        index: ("input", "GlobalInvocationId", ivec3),
+    ):
+        foo = (1, 2)  # noqa - error is detected when converting bytecode
+
+    # Eager by default
+    m1 = pyshader.python2shader(compute_shader)
+    assert isinstance(m1._bytecode, list)
+    with raises(pyshader.ShaderError):
+        pyshader.python2shader(compute_shader_invalid)
+
+    # Lazy via argument, can also be used as decorator factory
+    m2 = pyshader.python2shader(compute_shader, lazy=True)
+    assert callable(m2._bytecode)
+    assert m2.to_bytecode() == m1.to_bytecode()
+    assert isinstance(m2._bytecode, list)
+    m3 = pyshader.python2shader(lazy=True)(compute_shader_invalid)
+    with raises(pyshader.ShaderError):
+        m3.to_spirv()
+
+    # The shader type is still checked directly
+    with raises(NameError):
+        pyshader.python2shader(lambda: None, lazy=True)
+
+    # Lazy via env var
+    monkeypatch.setenv("PYSHADER_LAZY", "1")
+    m4 = pyshader.python2shader(compute_shader_invalid)
+    assert callable(m4._bytecode)
+    with raises(pyshader.ShaderError):
+        pyshader.python2shader(compute_shader_invalid, lazy=False)
+
+
+def test_python2shader_workgroup_size():
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        data[index.x] = index.x
+
+    def vertex_shader(
+        index: ("input", "VertexId", i32),
+    ):
+        pass
+
+    # Default
+    m = pyshader.python2shader(compute_shader)
+    assert m.workgroup_size == (1, 1, 1)
+    m = pyshader.python2shader(vertex_shader)
+    assert m.workgroup_size is None
+    assert m.cache_info()["misses"] == 0  # no need to compile
+
+    # Missing dimensions are one, can also be used as decorator factory
+    m = pyshader.python2shader(compute_shader, workgroup_size=64)
+    assert m.workgroup_size == (64, 1, 1)
+    m = pyshader.python2shader(workgroup_size=[8, 8])(compute_shader)
+    assert m.workgroup_size == (8, 8, 1)
+    assert m.get_spirv_metadata()["execution_modes"]["LocalSize"] == [8, 8, 1]
+    assert m.to_spirv() != pyshader.python2shader(compute_shader).to_spirv()
+
+    # Also when lazy, and when the SpirV is generated with options
+    m = pyshader.python2shader(compute_shader, workgroup_size=(4, 4, 4), lazy=True)
+    m.to_spirv(eliminate_dead_code=True)
+    assert m.workgroup_size == (4, 4, 4)
+
+    # Validated against the limits
+    for workgroup_size in (0, (257, 1, 1), (1, 1, 65), (16, 16, 2)):
+        with raises(ValueError):
+            pyshader.python2shader(compute_shader, workgroup_size=workgroup_size)
+    for workgroup_size in (1.0, (1, 2, 3, 4), (), "64", True, (True, 1)):
+        with raises(TypeError):
+            pyshader.python2shader(compute_shader, workgroup_size=workgroup_size)
+    with raises(TypeError):
+        pyshader.python2shader(vertex_shader, workgroup_size=64)
+
+
+def test_shared_memory_and_barriers():
+    from pyshader import _spirv_constants as cc
+    from pyshader._generator_bc import Bytecode2SpirVGenerator
+
+    def compute_shader(
+        index: ("input", "LocalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+        tile: ("shared", Array(64, i32)),
+        count: (pyshader.RES_SHARED, "i32"),
+    ):
+        tile[index.x] = index.x
+        count = 3
+        stdlib.barrier()
+        stdlib.workgroup_barrier()
+        stdlib.memory_barrier()
+        data[index.x] = tile[63 - index.x] + count
+
+    m = pyshader.python2shader(compute_shader, workgroup_size=64)
+    gen = Bytecode2SpirVGenerator()
+    gen.convert(m.to_bytecode())
+    variables = [i for i in gen._sections["types"] if i[0] == cc.OpVariable]
+    assert [i[-1] for i in variables].count(cc.StorageClass_Workgroup) == 2
+    barriers = [i for i in gen._sections["functions"] if "Barrier" in i[0].name]
+    assert [i[0] for i in barriers] == [cc.OpControlBarrier] * 2 + [cc.OpMemoryBarrier]
+
+    def fragment_shader1(
+        tile: ("shared", Array(64, f32)),
+    ):
+        pass
+
+    def compute_shader2(
+        tile: ("shared", 0, Array(64, f32)),
+    ):
+        pass
+
+    def fragment_shader3(
+        color: ("output", 0, vec4),
+    ):
+        stdlib.barrier()
+
+    def fragment_shader4(
+        color: ("output", 0, vec4),
+    ):
+        stdlib.memory_barrier()
+
+    def compute_shader5(
+        tile: ("shared", Array(f32)),
+    ):
+        pass
+
+    for func, msg in [
+        (fragment_shader1, "only works in compute shaders"),
+        (compute_shader2, "cannot have a slot"),
+        (fragment_shader3, "only works in compute shaders"),
+        (compute_shader5, "must have a fixed length"),
+    ]:
+        with raises(pyshader.ShaderError) as info:
+            pyshader.python2shader(func).to_spirv()
+        assert msg in str(info.value)
+    pyshader.python2shader(fragment_shader4).to_spirv()
+
+
+def test_atomics():
+    from pyshader import _spirv_constants as cc
+    from pyshader._generator_bc import Bytecode2SpirVGenerator
+
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+        count: ("shared", i32),
+    ):
+        old = stdlib.atomic_add(data[index.x], 1)
+        stdlib.atomic_exchange(count, old)
+        data[0] = stdlib.atomic_compare_exchange(count, 0, 7)
+
+    m = pyshader.python2shader(compute_shader, workgroup_size=64)
+    gen = Bytecode2SpirVGenerator()
+    gen.convert(m.to_bytecode())
+    functions = gen._sections["functions"]
+    atomics = [i for i in functions if i[0].name.startswith("OpAtomic")]
+    assert [i[0] for i in atomics] == [
+        cc.OpAtomicIAdd,
+        cc.OpAtomicExchange,
+        cc.OpAtomicCompareExchange,
+    ]
+    # The scope depends on the memory: device for buffers, workgroup for shared
+    assert atomics[0][4] is gen._constants["i32", int(cc.Scope_Device)]
+    assert atomics[1][4] is gen._constants["i32", int(cc.Scope_Workgroup)]
+    # The value to compare with comes last
+    assert atomics[2][-2:] == (gen._constants["i32", 7], gen._constants["i32", 0])
+
+    def compute_shader_local(
+        index: ("input", "GlobalInvocationId", ivec3),
+    ):
+        a = 3
+        stdlib.atomic_add(a, 1)
+
+    def compute_shader_float(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(f32)),
+    ):
+        stdlib.atomic_add(data[index.x], 1.0)
+
+    def compute_shader_type(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        stdlib.atomic_add(data[index.x], 1.0)
+
+    def compute_shader_nargs(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        stdlib.atomic_compare_exchange(data[index.x], 1)
+
+    for func, msg in [
+        (compute_shader_local, "buffer or shared memory"),
+        (compute_shader_float, "need an i32"),
+        (compute_shader_type, "with a f32 value"),
+        (compute_shader_nargs, "takes exactly 3 arguments"),
+    ]:
+        with raises(pyshader.ShaderError) as info:
+            pyshader.python2shader(func).to_spirv()
+        assert msg in str(info.value)
+
+
+def test_subgroup_operations():
+    from pyshader import _spirv_constants as cc
+    from pyshader._generator_bc import Bytecode2SpirVGenerator
+
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+        lane: ("input", "SubgroupLocalInvocationId", i32),
+        data1: ("buffer", 0, Array(f32)),
+        data2: ("buffer", 1, Array(i32)),
+        data3: ("buffer", 2, Array(ivec4)),
+    ):
+        i = index.x
+        v = data1[i]
+        data1[i] = stdlib.subgroup_add(v) + stdlib.subgroup_max(v)
+        data2[i] = stdlib.subgroup_exclusive_add(lane) + stdlib.subgroup_min(lane)
+        data2[i] = stdlib.subgroup_broadcast(lane, 0) + stdlib.subgroup_shuffle(i, 2)
+        data3[i] = stdlib.subgroup_ballot(v > 0.5)
+        data1[i] = stdlib.subgroup_broadcast(vec2(1.0, 2.0), 1).x  # composite constant
+
+    m = pyshader.python2shader(compute_shader)
+    gen = Bytecode2SpirVGenerator()
+    gen.convert(m.to_bytecode())
+    functions = gen._sections["functions"]
+    ops = [i for i in functions if i[0].name.startswith("OpGroupNonUniform")]
+    assert [i[0] for i in ops] == [
+        cc.OpGroupNonUniformFAdd,
+        cc.OpGroupNonUniformFMax,
+        cc.OpGroupNonUniformIAdd,
+        cc.OpGroupNonUniformSMin,
+        cc.OpGroupNonUniformBroadcast,
+        cc.OpGroupNonUniformShuffle,
+        cc.OpGroupNonUniformBallot,
+        cc.OpGroupNonUniformBroadcast,
+    ]
+    assert all(i[3] is gen._constants["i32", int(cc.Scope_Subgroup)] for i in ops)
+    assert ops[2][4] == cc.GroupOperation_ExclusiveScan
+    # The invocation id is unsigned, the ballot is cast to ivec4
+    assert ops[4][-1] is gen._constants["uint", 0]
+    assert functions[functions.index(ops[-2]) + 1][0] == cc.OpBitcast
+
+    meta = m.get_spirv_metadata()
+    for name in ("", "Arithmetic", "Ballot", "Shuffle"):
+        assert f"Capability_GroupNonUniform{name}" in meta["capabilities"]
+
+    # Subgroup operations need SpirV 1.3
+    assert m.to_spirv()[4:8] == bytes([0, 3, 1, 0])
+    with raises(pyshader.ShaderError) as info:
+        m.to_spirv(spirv_version=(1, 2))
+    assert "needs SpirV version 1.3" in str(info.value)
+    with raises(ValueError):
+        m.to_spirv(spirv_version=(1, 5))
+
+    def compute_shader_bool(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        stdlib.subgroup_add(index.x > 2)
+
+    def compute_shader_ballot(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        stdlib.subgroup_ballot(index.x)
+
+    def compute_shader_broadcast(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        stdlib.subgroup_broadcast(data[0], index.x)
+
+    def compute_shader_nargs(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+    ):
+        stdlib.subgroup_shuffle(data[0])
+
+    for func, msg in [
+        (compute_shader_bool, "subgroup_add() with a boolean"),
+        (compute_shader_ballot, "needs a bool"),
+        (compute_shader_broadcast, "must be a constant"),
+        (compute_shader_nargs, "takes exactly 2 arguments"),
+    ]:
+        with raises(pyshader.ShaderError) as info:
+            pyshader.python2shader(func).to_spirv()
+        assert msg in str(info.value)
+
+
+def test_specialization_constants():
+    from pyshader import _spirv_constants as cc
+    from pyshader._generator_bc import Bytecode2SpirVGenerator
+
+    @pyshader.python2shader(workgroup_size=("size_x", 2))
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(f32)),
+        size_x: (pyshader.RES_SPECIALIZATION, 0, i32, 32),
+        scale: ("specialization", 1, f32, 2),
+        flag: ("specialization", 2, "boolean"),
+    ):
+        v = data[index.x] * scale
+        if flag:
+            v = v + 1.0
+        data[index.x] = v
+
+    # The LocalSize has the default values
+    assert compute_shader.workgroup_size == (32, 2, 1)
+
+    for options in ({}, {"eliminate_dead_code": True}):
+        gen = Bytecode2SpirVGenerator(**options)
+        gen.convert(compute_shader.to_bytecode())
+        types = gen._sections["types"]
+        annotations = gen._sections["annotations"]
+        spec = [i for i in types if i[0].name.startswith("OpSpecConstant")]
+        assert [i[0] for i in spec] == [
+            cc.OpSpecConstant,
+            cc.OpSpecConstant,
+            cc.OpSpecConstantFalse,
+            cc.OpSpecConstantComposite,
+        ]
+        assert spec[0][3] == (32).to_bytes(4, "little")
+        assert spec[1][3] == bytes(ctypes.c_float(2.0))
+        # The ids are decorated, and the workgroup size is a builtin
+        spec_ids = [i[1:] for i in annotations if i[2] == cc.Decoration_SpecId]
+        assert spec_ids == [(spec[j][2], cc.Decoration_SpecId, j) for j in range(3)]
+        builtin = (spec[3][2], cc.Decoration_BuiltIn, cc.BuiltIn_WorkgroupSize)
+        assert (cc.OpDecorate,) + builtin in annotations
+        assert spec[3][3] is spec[0][2]
+
+    def compute_shader_store(
+        index: ("input", "GlobalInvocationId", ivec3),
+        n: ("specialization", 0, i32),
+    ):
+        n = 3  # noqa
+
+    def compute_shader_type(
+        index: ("input", "GlobalInvocationId", ivec3),
+        n: ("specialization", 0, vec3),
+    ):
+        pass
+
+    def compute_shader_default(
+        index: ("input", "GlobalInvocationId", ivec3),
+        n: ("specialization", 0, i32, 1.5),
+    ):
+        pass
+
+    def compute_shader_id(
+        index: ("input", "GlobalInvocationId", ivec3),
+        n: ("specialization", 0, i32),
+        m: ("specialization", 0, i32),
+    ):
+        pass
+
+    for func, msg in [
+        (compute_shader_store, "Cannot store to specialization"),
+        (compute_shader_type, "must be a scalar"),
+        (compute_shader_default, "Invalid default value"),
+        (compute_shader_id, "already taken"),
+    ]:
+        with raises(pyshader.ShaderError) as info:
+            pyshader.python2shader(func).to_spirv()
+        assert msg in str(info.value)
+
+    # Integers narrower than 32 bits are extended to a full word
+    def compute_shader_ints(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(i32)),
+        a: ("specialization", 0, "u8", 200),
+        b: ("specialization", 1, "i16", -3),
+        c: ("specialization", 2, "i64", 5),
+    ):
+        data[index.x] = i32(a) + i32(b) + i32(c)
+
+    m = pyshader.python2shader(compute_shader_ints)
+    gen = Bytecode2SpirVGenerator()
+    gen.convert(m.to_bytecode())
+    spec = [i for i in gen._sections["types"] if i[0] == cc.OpSpecConstant]
+    assert [i[3] for i in spec] == [
+        (200).to_bytes(4, "little"),
+        (-3).to_bytes(4, "little", signed=True),
+        (5).to_bytes(8, "little"),
+    ]
+    spirv = m.to_spirv()
+    assert len(spirv) % 4 == 0
+    for name in ("Int8", "Int16", "Int64"):
+        assert f"Capability_{name}" in m.get_spirv_metadata()["capabilities"]
+
+    # Using a specialization constant for the workgroup size
+    def compute_shader_size(
+        index: ("input", "GlobalInvocationId", ivec3),
+        n: ("specialization", 0, i32),
+    ):
+        pass
+
+    for workgroup_size, msg in [
+        ("m", "not a specialization constant"),
+        ("n", "default value of at least 1"),
+    ]:
+        m = pyshader.python2shader(
+            compute_shader_size, workgroup_size=(workgroup_size,)
+        )
+        with raises(pyshader.ShaderError) as info:
+            m.to_spirv()
+        assert msg in str(info.value)
+
+
+def test_long_or_chains():
+    # Each if-statement should become a single conditional branch
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data: ("buffer", 0, Array(f32)),
+    ):
+        a = data[index.x]
+        b = 0.0
+        if a > 1.0 or a < 2.0 or a == 3.0 or b > 4.0 or b < 5.0 or b == 6.0:
+            b = 1.0
+        if a > 1.0 or not a < 2.0 or a == 3.0 or not b > 4.0 or b < 5.0:
+            b = 2.0
+        if (a > 1.0 or b < 2.0) and (a == 3.0 or b > 4.0):
+            b = 3.0
+        data[index.x] = b
+
+    m = pyshader.python2shader(compute_shader)
+    opcodes = [op[0] for op in m.to_bytecode()]
+    assert opcodes.count("co_branch_conditional") == 3
+    assert opcodes.count("co_binary_op") >= 10
+    m.to_spirv()
+
+
+def test_instruction_table():
+    import dis
+    from pyshader.py import get_line_bumps_from_code_object
+    from pyshader.py import get_instructions_from_code_object
+
+    # A function with an EXTENDED_ARG (more than 256 constants)
+    ns = {}
+    exec("def func(a):\n" + "".join(f"    a = a + {i}\n" for i in range(300)), ns)
+    co = ns["func"].__code__
+
+    line_bumps = get_line_bumps_from_code_object(co)
+    instructions, index = get_instructions_from_code_object(co, line_bumps)
+    ref = [x for x in dis.get_instructions(co) if x.opname != "EXTENDED_ARG"]
+    assert len(instructions) == len(ref)
+    assert any(x[2] > 255 for x in instructions)
+    for (offset, opname, arg, linenr, target), x in zip(instructions, ref):
+        assert (offset, opname) == (x.offset, x.opname)
+        assert arg == (x.arg or 0)
+        assert linenr == x.starts_line
+        assert target == (x.argval if x.opcode in dis.hasjrel + dis.hasjabs else None)
+    # EXTENDED_ARG offsets map to the instruction they belong to
+    assert len(index) == len(co.co_code) // 2
+    assert all(instructions[i][0] >= offset for offset, i in index.items())
+
+
 # %% Utils for this module
 
 
@@ -8,6 +8,7 @@ import ctypes
 
 import pyshader
 from pyshader import f32, i32, ivec2, ivec3, ivec4, vec2, vec3, vec4, Array  # noqa
+from pyshader import stdlib
 
 import wgpu.backends.rs  # noqa
 from wgpu.utils import compute_with_buffers
@@ -203,6 +204,65 @@ def test_array3():
     assert list(out[0]) == list(range(0, 20, 2))
 
 
+def test_shared_memory_reduction():
+    def compute_shader(
+        index: ("input", "LocalInvocationId", ivec3),
+        group: ("input", "WorkgroupId", ivec3),
+        data1: ("buffer", 0, Array(f32)),
+        data2: ("buffer", 1, Array(f32)),
+        tile: ("shared", Array(16, f32)),
+    ):
+        i = index.x
+        tile[i] = data1[group.x * 16 + i]
+        stdlib.workgroup_barrier()
+        step = 8
+        while step > 0:
+            if i < step:
+                tile[i] = tile[i] + tile[i + step]
+            stdlib.workgroup_barrier()
+            step = step // 2
+        if i == 0:
+            data2[group.x] = tile[0]
+
+    compute_shader = pyshader.python2shader(compute_shader, workgroup_size=16)
+    validate_module(compute_shader, HASHES)
+
+    skip_if_no_wgpu()
+
+    inp_arrays = {0: (ctypes.c_float * 64)(*range(64))}
+    out_arrays = {1: ctypes.c_float * 4}
+    out = compute_with_buffers(inp_arrays, out_arrays, compute_shader, n=4)
+
+    assert iters_equal(out[1], [sum(range(i * 16, i * 16 + 16)) for i in range(4)])
+
+
+def test_atomics():
+    @python2shader_and_validate
+    def compute_shader(
+        index: ("input", "GlobalInvocationId", ivec3),
+        data1: ("buffer", 0, Array(i32)),
+        data2: ("buffer", 1, Array(i32)),
+    ):
+        i = index.x
+        stdlib.atomic_add(data2[data1[i] % 4], 1)
+        stdlib.atomic_max(data2[4], data1[i])
+        stdlib.atomic_min(data2[5], -data1[i])
+        stdlib.atomic_or(data2[6], data1[i])
+        stdlib.atomic_xor(data2[7], data1[i])
+        stdlib.atomic_compare_exchange(data2[8], 0, 42)
+
+    skip_if_no_wgpu()
+
+    inp_arrays = {0: (ctypes.c_int32 * 20)(*range(20))}
+    out_arrays = {1: ctypes.c_int32 * 9}
+    out = compute_with_buffers(inp_arrays, out_arrays, compute_shader, n=20)
+
+    xor = 0
+    for i in range(20):
+        xor ^= i
+    assert iters_equal(out[1], [5, 5, 5, 5, 19, -19, 31, xor, 42])
+
+
 # %% Utils for this module
 
 
@@ -226,6 +286,11 @@ HASHES = {
     "test_array1.compute_shader": ("cbc64b40fe63d646", "38e72aa08155c541"),
     "test_array2.compute_shader": ("457ca294721bd18f", "64db69b6951edef9"),
     "test_array3.compute_shader": ("676e70558accaa1f", "f4bbd80f53bc1838"),
+    "test_shared_memory_reduction.compute_shader": (
+        "c67dd42eb026c48d",
+        "09b7fcde8667df04",
+    ),
+    "test_atomics.compute_shader": ("9c639536183ff987", "8060777c0aba1a79"),
 }
 
 
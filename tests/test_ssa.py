@@ -0,0 +1,84 @@
+"""
+Tests for the promotion of local variables to SSA values.
+"""
+
+from pyshader import python2shader, f32, ivec3, Array
+from pyshader import _spirv_constants as cc
+
+from testutils import get_generator, get_function_opcodes
+from testutils import validate_module, run_test_and_print_new_hashes
+
+
+def compute_shader(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data1: ("buffer", 0, Array(f32)),
+):
+    i = index.x
+    total = 0.0
+    for j in range(i, 10):
+        if j > 5:
+            total = total + data1[j]
+        else:
+            total = total * 2.0
+    data1[i] = total
+
+
+def test_promote_locals_off_by_default():
+    m = python2shader(compute_shader)
+    opcodes = get_function_opcodes(get_generator(m))
+    assert cc.OpVariable in opcodes
+    assert cc.OpPhi not in opcodes
+
+
+def test_promote_locals():
+    m = python2shader(compute_shader)
+    gen = get_generator(m, promote_locals=True)
+    functions = gen._sections["functions"]
+    opcodes = get_function_opcodes(gen)
+
+    # The only memory access left is the buffer
+    assert cc.OpVariable not in opcodes
+    assert opcodes.count(cc.OpLoad) == 2  # index.x and data1[j]
+    assert opcodes.count(cc.OpStore) == 1  # data1[i]
+
+    # Phi nodes for total and j in the loop header, and for total in the merge
+    phis = [instr for instr in functions if instr[0] == cc.OpPhi]
+    assert len(phis) == 3
+    labels = {instr[1].id for instr in functions if instr[0] == cc.OpLabel}
+    for phi in phis:
+        assert len(phi) == 7  # two incoming values
+        assert {label.id for label in phi[4::2]} <= labels
+
+    # The loop bound is used directly, instead of being loaded
+    compare = [instr for instr in functions if instr[0] == cc.OpSLessThan][0]
+    assert compare[3] is phis[1][2] or compare[3] is phis[0][2]
+    types = gen._sections["types"]
+    constants = {instr[2].id for instr in types if instr[0] == cc.OpConstant}
+    assert compare[4].id in constants
+
+    # The names of the variables are gone
+    names = [instr[2] for instr in gen._sections["debug"] if instr[0] == cc.OpName]
+    assert "total" not in names and "j" not in names
+
+    # Can be combined with the other options
+    gen2 = get_generator(
+        m,
+        promote_locals=True,
+        eliminate_common_subexpressions=True,
+        eliminate_dead_code=True,
+    )
+    assert len(gen2.dump()) < len(get_generator(m, eliminate_dead_code=True).dump())
+
+
+def test_promote_locals_hashes():
+    m = python2shader(compute_shader)
+    validate_module(m, HASHES, options={"promote_locals": True})
+
+
+HASHES = {
+    "compute_shader": ("7d44c0f872b31ccd", "fae50dc7f756e924"),
+}
+
+
+if __name__ == "__main__":
+    run_test_and_print_new_hashes(globals())
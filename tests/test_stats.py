@@ -0,0 +1,89 @@
+"""
+Tests for the compile stats.
+"""
+
+import pyshader
+from pyshader import _stats, i32, ivec3, Array
+
+from pytest import raises
+
+
+def compute_shader(
+    index: ("input", "GlobalInvocationId", ivec3),
+    data: ("buffer", 0, Array(i32)),
+):
+    data[index.x] = index.x + 1 + 1
+
+
+FRONTEND_PHASES = [
+    "decode",
+    "fix_empty_blocks",
+    "fix_or_control_flow",
+    "fix_consistent_labels",
+]
+GENERATOR_PHASES = ["convert", "post_convert", "dump"]
+
+
+def test_stats_disabled(monkeypatch):
+    monkeypatch.delenv("PYSHADER_COMPILE_STATS", raising=False)
+    assert not _stats.is_enabled()
+    m = pyshader.python2shader(compute_shader)
+    m.to_spirv()
+    assert m.compile_stats == {}
+
+
+def test_stats_enabled():
+    pyshader.enable_compile_stats()
+    try:
+        m = pyshader.python2shader(compute_shader)
+        assert sorted(m.compile_stats["phases"]) == sorted(FRONTEND_PHASES)
+        m.to_spirv()
+    finally:
+        pyshader.enable_compile_stats(False)
+
+    stats = m.compile_stats
+    assert sorted(stats["phases"]) == sorted(FRONTEND_PHASES + GENERATOR_PHASES)
+    assert all(t >= 0 for t in stats["phases"].values())
+    assert stats["opcodes"] == len(m.to_bytecode())
+    assert stats["ids"] + 1 == m.get_spirv_metadata()["bound"]
+    assert stats["instructions"] > 10
+    assert stats["types"] > 3
+    assert stats["constants"] >= 1
+    assert stats["constant_cache_hits"] >= 1  # the 1 is re-used
+
+
+def test_stats_env_var(monkeypatch):
+    monkeypatch.setenv("PYSHADER_COMPILE_STATS", "1")
+    assert _stats.is_enabled()
+    m = pyshader.python2shader(compute_shader)
+    assert "decode" in m.compile_stats["phases"]
+
+
+def test_stats_hook():
+    calls = []
+    pyshader.set_compile_stats_hook(lambda m, stats: calls.append((m, stats)))
+    try:
+        m = pyshader.python2shader(compute_shader)
+        m.to_spirv()
+        m.to_spirv()  # cached: no stats
+    finally:
+        pyshader.set_compile_stats_hook(None)
+    assert not _stats.is_enabled()
+
+    assert len(calls) == 2
+    assert calls[0][0] is m and "convert" not in calls[0][1]["phases"]
+    assert calls[1][0] is m and "convert" in calls[1][1]["phases"]
+
+    # Stats are collected in worker processes too
+    calls = []
+    pyshader.set_compile_stats_hook(lambda m, stats: calls.append((m, stats)))
+    try:
+        modules = pyshader.compile_many([compute_shader, compute_shader], workers=2)
+    finally:
+        pyshader.set_compile_stats_hook(None)
+    assert len(calls) == 4
+    for m in modules:
+        assert "dump" in m.compile_stats["phases"]
+
+    with raises(TypeError):
+        pyshader.set_compile_stats_hook(42)
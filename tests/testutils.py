@@ -6,6 +6,7 @@ import hashlib
 import subprocess
 
 import pyshader
+from pyshader._generator_bc import Bytecode2SpirVGenerator
 
 
 def iters_equal(iter1, iter2):
@@ -34,8 +35,26 @@ def iters_close(iter1, iter2):
     return True
 
 
-def validate_module(shader_module, hashes, check_bytecode=True, check_spirv=True):
-    """Validate the given shader module against the given hashes."""
+def get_generator(shader_module, **options):
+    """Get a SpirV generator that converted the given shader module using
+    the given options, so that the generated instructions can be inspected.
+    """
+    gen = Bytecode2SpirVGenerator(**options)
+    gen.convert(shader_module.to_bytecode())
+    return gen
+
+
+def get_function_opcodes(gen):
+    """Get the opcodes of the function instructions of the given generator."""
+    return [instr[0] for instr in gen._sections["functions"]]
+
+
+def validate_module(
+    shader_module, hashes, check_bytecode=True, check_spirv=True, options=None
+):
+    """Validate the given shader module against the given hashes. The
+    SpirV is generated with the given options (if any).
+    """
 
     func = shader_module.input
     assert callable(func)
@@ -57,7 +76,7 @@ def validate_module(shader_module, hashes, check_bytecode=True, check_spirv=True
     assert bc2 == pyshader.opcodes.str2bc(text_bc)  # Quick sanity check
 
     # Get the SpirV code as bytes.
-    byte_sp = shader_module.to_spirv()
+    byte_sp = shader_module.to_spirv(**(options or {}))
 
     # print(text_bc)
     # print(pyshader.dev.disassemble(byte_sp))